@@ -0,0 +1,293 @@
+"""
+A reproducible (offline) benchmark of the extraction pipeline for each .docx file in unittests/test_data.
+
+For every document, the following stages are measured:
+    - get_document: reading the file with python-docx (without cache)
+    - get_all_ebd_keys: building the document index and discovering the EBD keys
+    - get_ebd_docx_tables: locating the tables of every EBD (per EBD latency)
+    - get_ebd_document_release_information: reading the release information from the title page
+    - convert_docx_tables_to_ebd_table: converting the tables of every EBD (per EBD latency)
+The wall times are taken from runs without tracemalloc (the best of --repeat runs); the peak memory of each stage is
+measured in a separate run with tracemalloc (skip it with --no-memory). Every run reads the document again, so the
+results that are memoized per document (heading levels, release information) are always computed by the measured
+stage. Note that tracemalloc only traces the
+allocations of the Python interpreter; the memory that libxml2 (lxml) allocates for the XML trees is not included.
+
+Usage (from the repository root):
+    PYTHONPATH=src python benchmarks/benchmark_suite.py [--repeat 3] [--output results.json] [DOCX_FILE ...]
+"""
+
+import functools
+import gc
+import json
+import math
+import platform
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar
+
+import click
+from docx.document import Document as DocumentType
+from docx.table import Table
+
+from ebdamame import (
+    DocumentIndex,
+    EbdNoTableSection,
+    get_all_ebd_keys,
+    get_document,
+    get_ebd_document_release_information,
+    get_ebd_docx_tables,
+)
+from ebdamame.docxtableconverter import DocxTableConverter
+
+_TEST_DATA_DIRECTORY = Path(__file__).parent.parent / "unittests" / "test_data"
+_PERCENTILES = (50, 90, 99)
+
+T = TypeVar("T")
+
+
+def _get_version(package_name: str) -> str:
+    try:
+        return version(package_name)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _percentile(sorted_values: list[float], percentile: int) -> float:
+    """
+    returns the percentile of the sorted values (nearest rank method)
+    """
+    rank = max(1, math.ceil(percentile / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _summarize_latencies(latencies: list[float]) -> dict[str, Any]:
+    """
+    returns count, total, percentiles and maximum of the given per EBD latencies (in seconds)
+    """
+    if not latencies:
+        return {"count": 0}
+    sorted_latencies = sorted(latencies)
+    summary: dict[str, Any] = {"count": len(latencies), "total_seconds": sum(latencies)}
+    for percentile in _PERCENTILES:
+        summary[f"p{percentile}_seconds"] = _percentile(sorted_latencies, percentile)
+    summary["max_seconds"] = sorted_latencies[-1]
+    return summary
+
+
+def _measure(function: Callable[[], T]) -> tuple[T, float]:
+    """
+    calls the function and returns its result and the elapsed wall time in seconds
+    """
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def _measure_peak_memory(function: Callable[[], Any]) -> int:
+    """
+    returns the peak memory (in bytes) that is allocated while the function is called (and its result is alive)
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        _ = function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def _measure_peak_memory_on_fresh_document(docx_file: Path, function: Callable[[DocumentType], Any]) -> int:
+    """
+    returns the peak memory (in bytes) of the function called with a freshly read document, so that nothing that is
+    memoized per document (e.g. the heading levels or the release information) has been computed before
+    """
+    document = get_document(docx_file, use_cache=False)
+    return _measure_peak_memory(functools.partial(function, document))
+
+
+# pylint:disable=too-many-locals
+def _run_stages(docx_file: Path) -> dict[str, dict[str, Any]]:
+    """
+    runs all stages once for the given file and returns the wall times (and per EBD latencies) of the stages
+    """
+    document, get_document_seconds = _measure(lambda: get_document(docx_file, use_cache=False))
+    document_index, get_all_ebd_keys_seconds = _measure(lambda: DocumentIndex(document))
+    ebd_keys = get_all_ebd_keys(document_index)
+    release_information, release_information_seconds = _measure(lambda: get_ebd_document_release_information(document))
+    location_latencies: list[float] = []
+    conversion_latencies: list[float] = []
+    number_of_conversion_errors = 0
+    for ebd_key, (_, ebd_kapitel) in ebd_keys.items():
+        try:
+            docx_tables, location_seconds = _measure(
+                functools.partial(get_ebd_docx_tables, document_index, ebd_key=ebd_key)
+            )
+        except Exception:  # pylint: disable=broad-exception-caught
+            continue  # e.g. TableNotFoundError; the same EBDs fail in every run
+        location_latencies.append(location_seconds)
+        if isinstance(docx_tables, EbdNoTableSection):
+            continue
+        converter_arguments: dict[str, Any] = {
+            "ebd_key": ebd_key,
+            "chapter": ebd_kapitel.chapter_title or "",
+            "section": ebd_kapitel.section_title or "",
+            "ebd_name": ebd_kapitel.subsection_title or ebd_key,
+            "release_information": release_information,
+        }
+        start = time.perf_counter()
+        try:
+            DocxTableConverter(docx_tables, **converter_arguments).convert_docx_tables_to_ebd_table()
+        except Exception:  # pylint: disable=broad-exception-caught
+            number_of_conversion_errors += 1
+        conversion_latencies.append(time.perf_counter() - start)
+    return {
+        "get_document": {"wall_time_seconds": get_document_seconds},
+        "get_all_ebd_keys": {"wall_time_seconds": get_all_ebd_keys_seconds, "number_of_ebd_keys": len(ebd_keys)},
+        "get_ebd_docx_tables": {
+            "wall_time_seconds": sum(location_latencies),
+            **_summarize_latencies(location_latencies),
+        },
+        "get_ebd_document_release_information": {"wall_time_seconds": release_information_seconds},
+        "convert_docx_tables_to_ebd_table": {
+            "wall_time_seconds": sum(conversion_latencies),
+            "number_of_errors": number_of_conversion_errors,
+            **_summarize_latencies(conversion_latencies),
+        },
+    }
+
+
+def _measure_peak_memory_of_stages(docx_file: Path) -> dict[str, int]:
+    """
+    returns the peak memory (in bytes) of every stage of the given file
+    """
+    document = get_document(docx_file, use_cache=False)
+    document_index = DocumentIndex(document)
+    release_information = get_ebd_document_release_information(document)
+    located_tables: dict[str, list[Table]] = {}
+
+    def _locate_all_tables() -> None:
+        for ebd_key in get_all_ebd_keys(document_index):
+            try:
+                docx_tables = get_ebd_docx_tables(document_index, ebd_key=ebd_key)
+            except Exception:  # pylint: disable=broad-exception-caught
+                continue
+            if isinstance(docx_tables, list):
+                located_tables[ebd_key] = docx_tables
+
+    def _convert_all_tables() -> None:
+        for ebd_key, docx_tables in located_tables.items():
+            try:
+                DocxTableConverter(
+                    docx_tables,
+                    ebd_key=ebd_key,
+                    chapter="",
+                    section="",
+                    ebd_name=ebd_key,
+                    release_information=release_information,
+                ).convert_docx_tables_to_ebd_table()
+            except Exception:  # pylint: disable=broad-exception-caught
+                pass
+
+    located_tables_peak = _measure_peak_memory(_locate_all_tables)
+    return {
+        "get_document": _measure_peak_memory(lambda: get_document(docx_file, use_cache=False)),
+        "get_all_ebd_keys": _measure_peak_memory_on_fresh_document(docx_file, DocumentIndex),
+        "get_ebd_docx_tables": located_tables_peak,
+        "get_ebd_document_release_information": _measure_peak_memory_on_fresh_document(
+            docx_file, get_ebd_document_release_information
+        ),
+        "convert_docx_tables_to_ebd_table": _measure_peak_memory(_convert_all_tables),
+    }
+
+
+def _benchmark_document(docx_file: Path, repeat: int, measure_memory: bool) -> dict[str, Any]:
+    """
+    returns the results of all stages for the given file; the wall times are the best of `repeat` runs
+    """
+    best_run: Optional[dict[str, dict[str, Any]]] = None
+    for _ in range(repeat):
+        run = _run_stages(docx_file)
+        if best_run is None:
+            best_run = run
+        else:
+            for stage_name, stage in run.items():
+                if stage["wall_time_seconds"] < best_run[stage_name]["wall_time_seconds"]:
+                    best_run[stage_name] = stage
+        gc.collect()
+    assert best_run is not None
+    if measure_memory:
+        for stage_name, peak_memory in _measure_peak_memory_of_stages(docx_file).items():
+            best_run[stage_name]["peak_memory_bytes"] = peak_memory
+        gc.collect()
+    return {
+        "file": docx_file.name,
+        "size_bytes": docx_file.stat().st_size,
+        "wall_time_seconds": sum(stage["wall_time_seconds"] for stage in best_run.values()),
+        "stages": best_run,
+    }
+
+
+def _format_summary_line(result: dict[str, Any]) -> str:
+    stages = result["stages"]
+    conversion = stages["convert_docx_tables_to_ebd_table"]
+    return (
+        f"{result['file']}: {result['wall_time_seconds']:.2f}s total, "
+        f"read {stages['get_document']['wall_time_seconds']:.2f}s, "
+        f"keys {stages['get_all_ebd_keys']['wall_time_seconds']:.2f}s "
+        f"({stages['get_all_ebd_keys']['number_of_ebd_keys']} EBDs), "
+        f"conversion p50/p99 {conversion.get('p50_seconds', 0) * 1000:.1f}/"
+        f"{conversion.get('p99_seconds', 0) * 1000:.1f}ms"
+        + (
+            f", peak read {stages['get_document']['peak_memory_bytes'] / 1024 / 1024:.0f} MiB"
+            if "peak_memory_bytes" in stages["get_document"]
+            else ""
+        )
+    )
+
+
+@click.command()
+@click.argument("docx_files", nargs=-1, type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option("--repeat", default=3, show_default=True, help="number of runs per document (the best run counts)")
+@click.option("--no-memory", is_flag=True, help="skip the (slow) measurement of the peak memory with tracemalloc")
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    help="path of the JSON file that the results are written to",
+)
+def main(docx_files: tuple[Path, ...], repeat: int, no_memory: bool, output: Optional[Path]) -> None:
+    """
+    benchmarks the extraction stages for the given files (default: all files in unittests/test_data)
+    """
+    results: list[dict[str, Any]] = []
+    for docx_file in list(docx_files) or sorted(_TEST_DATA_DIRECTORY.glob("*.docx")):
+        result = _benchmark_document(docx_file, repeat=repeat, measure_memory=not no_memory)
+        click.echo(_format_summary_line(result))
+        results.append(result)
+    report = {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "versions": {
+                package_name: _get_version(package_name)
+                for package_name in ("ebdamame", "python-docx", "lxml", "rebdhuhn", "pydantic")
+            },
+        },
+        "repeat": repeat,
+        "documents": results,
+        "total_wall_time_seconds": sum(result["wall_time_seconds"] for result in results),
+    }
+    if output is not None:
+        with open(output, "w", encoding="utf-8") as output_file:
+            json.dump(report, output_file, indent=2)
+        click.echo(f"The results have been written to {output}")
+
+
+if __name__ == "__main__":
+    main()  # pylint:disable=no-value-for-parameter
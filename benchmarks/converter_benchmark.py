@@ -0,0 +1,142 @@
+"""
+Benchmarks the conversion of EBD tables (DocxTableConverter) in isolation: the documents are read and the tables are
+located before the measurement starts, so only the conversion itself is timed.
+
+Usage (from the repository root):
+    PYTHONPATH=src python benchmarks/converter_benchmark.py [--repeat 5] [--star-only] [DOCX_FILE ...]
+Without DOCX_FILE arguments, all .docx files in unittests/test_data are used.
+"""
+
+import re
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+import click
+
+from ebdamame import EbdNoTableSection, RawEbdTable
+from ebdamame._lxml_engine import read_streamed_document_index
+from ebdamame.docxtableconverter import DocxTableConverter
+
+_TEST_DATA_DIRECTORY = Path(__file__).parent.parent / "unittests" / "test_data"
+_STAR_STEP_NUMBER_PATTERN = re.compile(r"^\d+\*$")
+
+
+def _has_star_step(tables: list[RawEbdTable]) -> bool:
+    """
+    returns true iff one of the tables contains a step number with a star (e.g. "50*")
+    """
+    return any(
+        _STAR_STEP_NUMBER_PATTERN.match(text.strip()) for table in tables for row in table.text_matrix for text in row
+    )
+
+
+def _collect_conversions(docx_files: list[Path], star_only: bool) -> list[dict[str, Any]]:
+    """
+    reads the given files and returns the arguments of DocxTableConverter for every EBD that has a table
+    """
+    conversions: list[dict[str, Any]] = []
+    for docx_file in docx_files:
+        document_index = read_streamed_document_index(docx_file)
+        for ebd_key in document_index.get_all_ebd_keys():
+            try:
+                tables = document_index.get_ebd_raw_tables(ebd_key)
+            except Exception:  # pylint: disable=broad-exception-caught
+                continue
+            if isinstance(tables, EbdNoTableSection) or (star_only and not _has_star_step(tables)):
+                continue
+            conversions.append(
+                {
+                    "docx_tables": tables,
+                    "ebd_key": ebd_key,
+                    "chapter": "",
+                    "section": "",
+                    "ebd_name": ebd_key,
+                    "release_information": document_index.release_information,
+                }
+            )
+    return conversions
+
+
+def _convert_all(conversions: list[dict[str, Any]]) -> int:
+    """
+    converts all EBDs; returns the number of successful conversions
+    """
+    number_of_converted_tables = 0
+    for arguments in conversions:
+        try:
+            DocxTableConverter(**arguments).convert_docx_tables_to_ebd_table()
+            number_of_converted_tables += 1
+        except Exception:  # pylint: disable=broad-exception-caught
+            pass  # unsupported tables fail in the same way before and after a change
+    return number_of_converted_tables
+
+
+def _count_enhanced_rows_during_conversion(conversions: list[dict[str, Any]]) -> int:
+    """
+    returns the number of rows that are enhanced (DocxTableConverter._enhance_list_view) while converting all EBDs
+    """
+    # pylint: disable=protected-access
+    enhance_list_view = DocxTableConverter._enhance_list_view
+    number_of_enhanced_rows = 0
+
+    def _counting_enhance_list_view(*args: Any, **kwargs: Any) -> Any:
+        nonlocal number_of_enhanced_rows
+        enhanced_rows = enhance_list_view(*args, **kwargs)
+        number_of_enhanced_rows += len(enhanced_rows)
+        return enhanced_rows
+
+    DocxTableConverter._enhance_list_view = staticmethod(_counting_enhance_list_view)  # type: ignore[method-assign]
+    try:
+        _convert_all(conversions)
+    finally:
+        DocxTableConverter._enhance_list_view = staticmethod(enhance_list_view)  # type: ignore[method-assign]
+    return number_of_enhanced_rows
+
+
+def _measure_enhanced_rows(conversions: list[dict[str, Any]]) -> tuple[int, int, int]:
+    """
+    returns the number of enhanced rows and the memory blocks and bytes that are allocated to keep them
+    """
+    tracemalloc.start()
+    enhanced_tables = []
+    for arguments in conversions:
+        for table_index, table in enumerate(arguments["docx_tables"]):
+            # pylint: disable=protected-access
+            enhanced_tables.append(DocxTableConverter._enhance_list_view(table, 2 if table_index == 0 else 0))
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocations = snapshot.statistics("filename")
+    number_of_rows = sum(len(enhanced_table) for enhanced_table in enhanced_tables)
+    return number_of_rows, sum(stat.count for stat in allocations), sum(stat.size for stat in allocations)
+
+
+@click.command()
+@click.argument("docx_files", nargs=-1, type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option("--repeat", default=5, show_default=True, help="number of measured conversions of all EBDs")
+@click.option("--star-only", is_flag=True, help="only convert EBDs with multi step instructions (e.g. step '50*')")
+def main(docx_files: tuple[Path, ...], repeat: int, star_only: bool) -> None:
+    """
+    converts the EBDs of the given files repeatedly and prints the timings and the allocations of the enhanced rows
+    """
+    conversions = _collect_conversions(list(docx_files) or sorted(_TEST_DATA_DIRECTORY.glob("*.docx")), star_only)
+    number_of_converted_tables = _convert_all(conversions)  # warm up
+    timings: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _convert_all(conversions)
+        timings.append(time.perf_counter() - start)
+    number_of_rows, number_of_blocks, number_of_bytes = _measure_enhanced_rows(conversions)
+    click.echo(f"EBDs: {len(conversions)} ({number_of_converted_tables} converted), table rows: {number_of_rows}")
+    click.echo(f"rows enhanced during the conversion: {_count_enhanced_rows_during_conversion(conversions)}")
+    click.echo(f"conversion of all EBDs: best {min(timings):.3f}s, median {statistics.median(timings):.3f}s")
+    click.echo(
+        f"enhanced rows: {number_of_blocks} memory blocks ({number_of_blocks / max(number_of_rows, 1):.1f} per row), "
+        f"{number_of_bytes / 1024:.0f} KiB ({number_of_bytes / max(number_of_rows, 1):.0f} bytes per row)"
+    )
+
+
+if __name__ == "__main__":
+    main()  # pylint:disable=no-value-for-parameter
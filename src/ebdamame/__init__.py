@@ -4,29 +4,40 @@ Contains high level functions to process .docx files
 
 import gc
 import logging
-import sys
-from io import BytesIO
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Generator, Optional
 
-import docx
 from docx.document import Document as DocumentType
 from docx.table import Table
-from docx.text.paragraph import Paragraph
-
-from ._docx_utils import (
-    EBD_KEY_PATTERN,
-    EBD_KEY_WITH_HEADING_PATTERN,
-    enrich_paragraphs_with_sections,
-    get_ebd_document_release_information,
-    get_tables_and_paragraphs,
-    is_heading,
-    table_is_an_ebd_table,
-    table_is_first_ebd_table,
+from rebdhuhn.models.ebd_table import EbdDocumentReleaseInformation, EbdTable
+
+from ._docx_source import DocxSource, describe_docx_source, get_rereadable_docx_source, normalize_docx_source
+from ._docx_utils import EBD_KEY_PATTERN, get_ebd_document_release_information
+from ._extraction import (
+    ExtractionEngine,
+    convert_ebd_section,
+    document_cache,
+    get_cached_document,
+    get_document_index,
+    get_release_information,
+    is_manually_triggered_garbage_collection_required,
+    read_document,
+    read_document_index,
+    streamed_document_cache,
 )
+from ._lxml_engine import StreamedDocumentIndex, peek_release_information
+from ._raw_table import RawEbdTable
+from .cache import EbdTableCache, get_document_hash
+from .documentindex import DocumentIndex
 from .exceptions import EbdTableNotConvertibleError, StepNumberNotFoundError, TableNotFoundError
+from .instrumentation import StageTimings, TimingRecorder, TimingReport, measure_stage, record_timings
 from .models import EbdChapterInformation, EbdNoTableSection
 
 __all__ = [
+    # Constants
+    "EBD_KEY_PATTERN",
     # Exceptions
     "EbdTableNotConvertibleError",
     "StepNumberNotFoundError",
@@ -34,51 +45,78 @@ __all__ = [
     # Models
     "EbdChapterInformation",
     "EbdNoTableSection",
+    "RawEbdTable",
+    "ExtractionEngine",
+    # Index and Cache
+    "DocumentIndex",
+    "EbdTableCache",
+    # Instrumentation
+    "StageTimings",
+    "TimingRecorder",
+    "TimingReport",
+    "record_timings",
     # Functions
+    "clear_document_cache",
+    "configure_document_cache",
+    "get_all_ebd_fingerprints",
     "get_all_ebd_keys",
     "get_document",
     "get_ebd_docx_tables",
+    "get_ebd_raw_tables",
     "get_ebd_document_release_information",
+    "get_ebd_table",
+    "iter_ebd_tables",
+    "peek_release_information",
 ]
 
 _logger = logging.getLogger(__name__)
 
-_is_python_version_314 = sys.version_info[0:2] == (3, 14)
-_is_manually_triggered_garbage_collection_required = _is_python_version_314
 
-"""
-I don't know the reason why, but the CI failed in Python 3.14 with the following message:
-"Error: Process completed with exit code 143."
-based on the commit https://github.com/Hochfrequenz/ebdamame/pull/363/commits/b6a456345d46a11fe09c6c1c32ff66e62cb1392c
-
-The python-docx repo as of 2025-10-13 mentions one open issue which might be related:
-https://github.com/python-openxml/python-docx/issues/1428
-Also in the CPython repository there is an open regression bug, that maybe affects ebdamame internally:
-https://github.com/python/cpython/issues/139951
-So as a workaround, we trigger garbage collection manually after working with a docx file.
-"""
+def configure_document_cache(max_documents: int, max_bytes: int) -> None:
+    """
+    Sets the limits of the in-process cache of parsed documents.
+    The cache holds at most `max_documents` documents whose files are in total not larger than `max_bytes`.
+    The least recently used documents are dropped first.
+    Use `max_documents=0` to disable the cache.
+    """
+    number_of_dropped_documents = document_cache.configure(max_documents=max_documents, max_bytes=max_bytes)
+    streamed_document_cache.configure(max_documents=max_documents, max_bytes=max_bytes)
+    if number_of_dropped_documents > 0 and is_manually_triggered_garbage_collection_required:
+        gc.collect()
+
+
+def clear_document_cache(docx_file_path: Optional[str | os.PathLike[str]] = None) -> None:
+    """
+    Drops the given file (or all files if no path is given) from the in-process cache of parsed documents.
+    Changed files are detected automatically (by modification time and size), so this is only needed to free memory.
+    """
+    if docx_file_path is not None:
+        docx_file_path = Path(docx_file_path)
+    number_of_dropped_documents = document_cache.invalidate(docx_file_path)
+    streamed_document_cache.invalidate(docx_file_path)
+    if number_of_dropped_documents > 0 and is_manually_triggered_garbage_collection_required:
+        gc.collect()
 
 
-def get_document(docx_file_path: Path) -> DocumentType:
+def get_document(docx_file_path: DocxSource, use_cache: bool = True) -> DocumentType:
     """
     opens and returns the document specified in the docx_file_path using python-docx
+
+    Instead of a path, the content of the file can be passed as `bytes`, `bytearray`, `memoryview` or memory-mapped
+    file (`mmap.mmap`) or as a seekable binary file object. The content is read in place, without copying it.
+
+    By default, parsed documents are kept in a small in-process LRU cache (see `configure_document_cache`), so
+    repeated calls for the same (unchanged) file do not parse it again; treat the returned document as read-only then.
+    Use `use_cache=False` to always get a freshly parsed document.
+    Only files given by their path (`Path`, `str` or `os.PathLike`) are cached.
     """
-    with open(docx_file_path, "rb") as docx_file:
-        source_stream = BytesIO(docx_file.read())
-        # Originally I tried the recipe from
-        # https://python-docx.readthedocs.io/en/latest/user/documents.html#opening-a-file-like-document
-        # but then switched from StringIO to BytesIO (without explicit 'utf-8') because of:
-        # UnicodeDecodeError: 'charmap' codec can't decode byte 0x81 in position 605: character maps to <undefined>
-    try:
-        document = docx.Document(source_stream)
-        _logger.info("Successfully read the file '%s'", docx_file_path)
-        return document
-    finally:
-        source_stream.close()
+    docx_file_path = normalize_docx_source(docx_file_path)
+    if not use_cache:
+        return read_document(docx_file_path)
+    return get_cached_document(docx_file_path).document
 
 
-# pylint:disable=too-many-branches
-def get_ebd_docx_tables(docx_file_path: Path, ebd_key: str) -> list[Table] | EbdNoTableSection:
+def get_ebd_docx_tables(docx_file_path: DocxSource | DocumentIndex, ebd_key: str) -> list[Table] | EbdNoTableSection:
     """
     Opens the file specified in `docx_file_path` and returns the tables that relate to the given `ebd_key`.
 
@@ -89,8 +127,12 @@ def get_ebd_docx_tables(docx_file_path: Path, ebd_key: str) -> list[Table] | Ebd
     In this case, the section is identified and the related paragraph is captured as a remark
     (e.g. 'Es ist das EBD E_0556 zu nutzen.' for EBD_0561).
 
+    If you want to extract more than one EBD from the same file, pass a `DocumentIndex` instead of a path.
+    The document is then neither read nor traversed again.
+
     Args:
-        docx_file_path (Path): The path to the .docx file to be processed.
+        docx_file_path (DocxSource | DocumentIndex): The path to the .docx file to be processed (or its content or a
+            binary file object, see `get_document`) or an index of the document.
         ebd_key (str): The EBD key to search for in the document.
 
     Returns:
@@ -102,105 +144,284 @@ def get_ebd_docx_tables(docx_file_path: Path, ebd_key: str) -> list[Table] | Ebd
     """
     if EBD_KEY_PATTERN.match(ebd_key) is None:
         raise ValueError(f"The ebd_key '{ebd_key}' does not match {EBD_KEY_PATTERN.pattern}")
-    document = get_document(docx_file_path)
-
-    empty_ebd_text: str | None = None  # paragraph text if there is no ebd table
-    found_table_in_subsection: bool = False
-    is_inside_subsection_of_requested_table: bool = False
-    tables: list[Table] = []
-    tables_and_paragraphs = get_tables_and_paragraphs(document)
-    for table_or_paragraph in tables_and_paragraphs:
-        if isinstance(table_or_paragraph, Paragraph):
-            paragraph: Paragraph = table_or_paragraph
-            # Assumptions:
-            # 1. before each EbdTable there is a paragraph whose text starts with the respective EBD key
-            # 2. there are no duplicates
-            is_ebd_heading_of_requested_ebd_key = paragraph.text.startswith(ebd_key)
-            if is_inside_subsection_of_requested_table and is_heading(paragraph):
-                _logger.warning("No EBD table found in subsection for: '%s'", ebd_key)
-                break
-            if is_inside_subsection_of_requested_table and paragraph.text.strip() != "":
-                if empty_ebd_text is None:
-                    # the first text paragraph after we found the correct section containing the ebd key
-                    empty_ebd_text = paragraph.text.strip()
-                else:
-                    empty_ebd_text += ("\n") + paragraph.text.strip()
-            is_inside_subsection_of_requested_table = (
-                is_ebd_heading_of_requested_ebd_key or is_inside_subsection_of_requested_table
-            )
-        if isinstance(table_or_paragraph, Table) and is_inside_subsection_of_requested_table:
-            found_table_in_subsection = True
-        if (
-            isinstance(table_or_paragraph, Table)
-            and is_inside_subsection_of_requested_table
-            and table_is_an_ebd_table(table_or_paragraph)
-            and table_is_first_ebd_table(table_or_paragraph)
-        ):
-            table: Table = table_or_paragraph
-            tables.append(table)
-            # Now we have to check if the EBD table spans multiple pages, and _maybe_ we have to collect more tables.
-            # The funny thing is: Sometimes the authors create multiple tables split over multiple lines which belong
-            # together, sometimes they create 1 proper table that spans multiple pages.
-            # The latter case (1 docx table spanning >1 pages) is transparent to the extraction logic; i.e. python-docx
-            # treats a single table that spans multiple pages just the same as a table on only 1 page.
-            for next_item in tables_and_paragraphs:  # start iterating from where the outer loop paused
-                if isinstance(next_item, Table):
-                    # this is the case that the authors created multiple single tables on single adjacent pages
-                    # if table_is_an_ebd_table(table):
-                    if table_is_an_ebd_table(next_item):
-                        tables.append(next_item)
-                elif isinstance(next_item, Paragraph):
-                    if next_item.text.startswith("S_") or next_item.text.startswith("E_"):
-                        # this is the case that the authors created 1 table that spans multiple pages
-                        # and we're done collecting tables for this EBD key
-                        break
-                    continue
-                else:
-                    break  # inner loop because if no other table will follow
-                    # we're done collecting the tables for this EBD key
-        if is_inside_subsection_of_requested_table and len(tables) > 0:  # this means: we found the table
-            # break the outer loop, too; no need to iterate any further
-            break
-    if not any(tables):
-        if not is_inside_subsection_of_requested_table:
-            raise TableNotFoundError(ebd_key=ebd_key)
-        if empty_ebd_text is None:
-            if found_table_in_subsection:
-                # probably there is an error while scraping the tables
-                raise TableNotFoundError(ebd_key=ebd_key)
-            return EbdNoTableSection(ebd_key=ebd_key, remark="")
-        return EbdNoTableSection(ebd_key=ebd_key, remark=empty_ebd_text.strip())
+    if isinstance(docx_file_path, DocumentIndex):
+        return docx_file_path.get_ebd_docx_tables(ebd_key)
+    document_index = get_cached_document(normalize_docx_source(docx_file_path)).index
+    try:
+        return document_index.get_ebd_docx_tables(ebd_key)
+    finally:
+        if is_manually_triggered_garbage_collection_required and not document_cache.is_enabled:
+            del document_index
+            gc.collect()
+
+
+def get_ebd_raw_tables(
+    docx_file_path: DocxSource | DocumentIndex, ebd_key: str, engine: ExtractionEngine = "python-docx"
+) -> list[RawEbdTable] | EbdNoTableSection:
+    """
+    Same as `get_ebd_docx_tables` but returns the detached, text-only representations of the tables (`RawEbdTable`).
+    They hold only what the `DocxTableConverter` reads and no reference to the document, so they can be pickled (e.g.
+    sent to worker processes) and the document can be freed once they have been read.
+    The `engine` ("python-docx" or "lxml") determines how the file is read (see `iter_ebd_tables`).
+
+    Raises:
+        TableNotFoundError: If no tables related to the given `ebd_key` are found in the document.
+    """
+    if EBD_KEY_PATTERN.match(ebd_key) is None:
+        raise ValueError(f"The ebd_key '{ebd_key}' does not match {EBD_KEY_PATTERN.pattern}")
+    document_index = get_document_index(docx_file_path, engine=engine)
     try:
-        return tables
+        return document_index.get_ebd_raw_tables(ebd_key)
     finally:
-        if _is_manually_triggered_garbage_collection_required:
-            del document
+        if is_manually_triggered_garbage_collection_required and not document_cache.is_enabled:
+            del document_index
             gc.collect()
 
 
-def get_all_ebd_keys(docx_file_path: Path) -> dict[str, tuple[str, EbdChapterInformation]]:
+def get_all_ebd_keys(
+    docx_file_path: DocxSource | DocumentIndex, engine: ExtractionEngine = "python-docx"
+) -> dict[str, tuple[str, EbdChapterInformation]]:
     """
-    Extract all EBD keys from the given file.
+    Extract all EBD keys from the given file (or its content or a binary file object, see `get_document`) or document
+    index.
     Returns a dictionary with all EBD keys as keys and the respective EBD titles as values.
     E.g. key: "E_0003", value: "Bestellung der Aggregationsebene RZ prüfen"
+    The `engine` ("python-docx" or "lxml") determines how the file is read; both yield the same keys.
+    """
+    if isinstance(docx_file_path, DocumentIndex):
+        return docx_file_path.get_all_ebd_keys()
+    document_index = get_document_index(docx_file_path, engine=engine)
+    try:
+        return document_index.get_all_ebd_keys()
+    finally:
+        if is_manually_triggered_garbage_collection_required and not document_cache.is_enabled:
+            del document_index
+            gc.collect()
+
+
+def get_all_ebd_fingerprints(
+    docx_file_path: DocxSource | DocumentIndex, engine: ExtractionEngine = "python-docx"
+) -> dict[str, str]:
+    """
+    Returns the fingerprints of all EBDs of the given file (or its content or a binary file object, see
+    `get_document`) or document index, in document order. E.g. key: "E_0003", value: "3f2a..." (a SHA-256 hex digest)
+
+    The fingerprint of an EBD covers its heading (title and chapter information) and either the texts and layout of
+    its tables or its remark; the formatting and the revision ids (rsid) of the XML are ignored. So an EBD whose
+    fingerprint did not change between two releases of the document yields the same result (apart from the release
+    information) and doesn't have to be converted or published again. The fingerprints don't depend on the `engine`.
+    The document is read (and traversed) only once, like in `get_all_ebd_keys`; no EBD is converted.
+    """
+    document_index = get_document_index(docx_file_path, engine=engine)
+    try:
+        return document_index.get_all_ebd_fingerprints()
+    finally:
+        if is_manually_triggered_garbage_collection_required and not document_cache.is_enabled:
+            del document_index
+            gc.collect()
+
+
+_worker_document_index: Optional[DocumentIndex | StreamedDocumentIndex] = None  # pylint:disable=invalid-name
+"""
+the document index of a worker process (see _initialize_worker); it's built once per worker, not once per EBD
+"""
+_worker_release_information: Optional[EbdDocumentReleaseInformation] = None  # pylint:disable=invalid-name
+
+
+def _initialize_worker(docx_file_path: Path, engine: ExtractionEngine) -> None:
+    """
+    Reads and indexes the document once when a worker process of the process pool starts.
+    """
+    global _worker_document_index, _worker_release_information  # pylint:disable=global-statement
+    _worker_document_index = read_document_index(docx_file_path, engine)
+    _worker_release_information = get_release_information(_worker_document_index)
+
+
+def _convert_ebd_section_in_worker(
+    ebd_key_title_and_kapitel: tuple[str, str, EbdChapterInformation],
+) -> EbdTable | EbdNoTableSection | Exception:
+    """
+    Converts a single EBD inside a worker process. Errors are returned (not raised) to keep the other results.
+    """
+    ebd_key, title, ebd_kapitel = ebd_key_title_and_kapitel
+    assert _worker_document_index is not None, "The worker has not been initialized"
+    try:
+        return convert_ebd_section(_worker_document_index, ebd_key, title, ebd_kapitel, _worker_release_information)
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        _logger.warning("Could not convert EBD '%s': %s", ebd_key, error)
+        return error
+
+
+def _iter_ebd_tables_in_parallel(
+    docx_file_path: Path,
+    ebd_keys: dict[str, tuple[str, EbdChapterInformation]],
+    max_workers: int,
+    engine: ExtractionEngine,
+) -> Generator[tuple[str, EbdTable | EbdNoTableSection | Exception], None, None]:
+    """
+    Distributes the conversion of the given EBDs of the given file across a process pool.
+    The results are yielded in document order.
+    """
+    tasks = [(ebd_key, title, ebd_kapitel) for ebd_key, (title, ebd_kapitel) in ebd_keys.items()]
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_initialize_worker, initargs=(docx_file_path, engine)
+    ) as executor:
+        chunksize = max(1, len(tasks) // (4 * max_workers))
+        for (ebd_key, _, _), result in zip(
+            tasks, executor.map(_convert_ebd_section_in_worker, tasks, chunksize=chunksize)
+        ):
+            yield ebd_key, result
+
+
+def _iter_ebd_tables_sequentially(
+    document_index: DocumentIndex | StreamedDocumentIndex,
+) -> Generator[tuple[str, EbdTable | EbdNoTableSection | Exception], None, None]:
+    """
+    Converts the EBDs of the given document one after another.
+    """
+    release_information = get_release_information(document_index)
+    for ebd_key, (title, ebd_kapitel) in document_index.get_all_ebd_keys().items():
+        try:
+            result: EbdTable | EbdNoTableSection | Exception = convert_ebd_section(
+                document_index, ebd_key, title, ebd_kapitel, release_information
+            )
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            _logger.warning("Could not convert EBD '%s': %s", ebd_key, error)
+            result = error
+        yield ebd_key, result
+
+
+def _iter_ebd_tables_with_cache(
+    docx_file_path: DocxSource, max_workers: Optional[int], cache: EbdTableCache, engine: ExtractionEngine
+) -> Generator[tuple[str, EbdTable | EbdNoTableSection | Exception], None, None]:
+    """
+    Yields the results from the cache if all EBDs of the file are cached; converts (and caches) all EBDs otherwise.
+    """
+    docx_file_path = get_rereadable_docx_source(docx_file_path)  # it's hashed and then parsed
+    document_hash = get_document_hash(docx_file_path)
+    cached_document = cache.load_document(document_hash)
+    if cached_document is not None:
+        _logger.info("All EBDs of '%s' are read from the cache", describe_docx_source(docx_file_path))
+        for ebd_key, (_, _, cached_result) in cached_document.items():
+            yield ebd_key, cached_result
+        return
+    document_index = get_document_index(docx_file_path, engine=engine)
+    ebd_keys = document_index.get_all_ebd_keys()
+    if max_workers is None:
+        results = _iter_ebd_tables_sequentially(document_index)
+    else:
+        assert isinstance(docx_file_path, Path)
+        results = _iter_ebd_tables_in_parallel(docx_file_path, ebd_keys, max_workers=max_workers, engine=engine)
+    try:
+        for ebd_key, result in results:
+            cache.store(document_hash, ebd_key, result)
+            yield ebd_key, result
+        cache.store_ebd_keys(document_hash, ebd_keys)  # stored last, so that only complete documents are found
+    finally:
+        if is_manually_triggered_garbage_collection_required and not document_cache.is_enabled:
+            del document_index
+            gc.collect()
+
+
+def iter_ebd_tables(
+    docx_file_path: DocxSource | DocumentIndex,
+    max_workers: Optional[int] = None,
+    cache: Optional[EbdTableCache] = None,
+    engine: ExtractionEngine = "python-docx",
+) -> Generator[tuple[str, EbdTable | EbdNoTableSection | Exception], None, None]:
+    """
+    Converts all EBDs from the given file (or its content, see `get_document`, or document index) and yields them one
+    after another in document order.
+
+    The document is read and traversed only once. Each EBD is converted as soon as it is requested from the generator,
+    so consumers can start processing (e.g. writing) the first results immediately.
+    The release information is extracted once per document and shared by all EBDs.
+
+    If `max_workers` is set, the EBDs are converted in a pool of `max_workers` processes instead.
+    Each worker process reads the document once. The results are still yielded in document order.
+    This requires the path to the file (neither a `DocumentIndex` nor file objects can be shared between processes).
+
+    If a `cache` is given (and a path, not a `DocumentIndex`), the results are read from the cache if the same file
+    content has been converted before; otherwise the results are written to the cache.
+
+    The `engine` determines how the file is read: "python-docx" (default) or "lxml", which streams the XML of the
+    document without building the python-docx object model. Both engines yield the same results.
+
+    Yields:
+        tuple[str, EbdTable | EbdNoTableSection | Exception]: The EBD key and either the converted `EbdTable`,
+        an `EbdNoTableSection` if the section has no table or the exception that occurred while locating or
+        converting the EBD (e.g. `TableNotFoundError` or `EbdTableNotConvertibleError`).
+        Errors of single EBDs do not abort the iteration.
     """
-    document = get_document(docx_file_path)
-    result: dict[str, tuple[str, EbdChapterInformation]] = {}
-    for paragraph, ebd_kapitel in enrich_paragraphs_with_sections(document.paragraphs):
-        match = EBD_KEY_WITH_HEADING_PATTERN.match(paragraph.text)
-        if match is None:
-            contains_ebd_number = paragraph.text.lstrip().startswith("E_")
-            if contains_ebd_number:
-                _logger.warning("Found EBD number but could not match: '%s'", paragraph.text)
-            continue
-        ebd_key = match.groupdict()["key"]
-        title = match.groupdict()["title"]
-        result[ebd_key] = (title, ebd_kapitel)
-        _logger.debug("Found EBD %s: '%s' (%s)", ebd_key, title, ebd_kapitel)
-    _logger.info("%i EBD keys have been found", len(result))
+    docx_file_path = normalize_docx_source(docx_file_path)
+    if max_workers is not None and not isinstance(docx_file_path, Path):
+        raise ValueError("Parallel conversion requires the path to the docx file, not its content or a DocumentIndex")
+    if isinstance(docx_file_path, DocumentIndex):
+        yield from _iter_ebd_tables_sequentially(docx_file_path)
+        return
+    if cache is not None:
+        yield from _iter_ebd_tables_with_cache(docx_file_path, max_workers=max_workers, cache=cache, engine=engine)
+        return
+    if isinstance(docx_file_path, Path) and max_workers is not None:
+        yield from _iter_ebd_tables_in_parallel(
+            docx_file_path, get_all_ebd_keys(docx_file_path, engine=engine), max_workers=max_workers, engine=engine
+        )
+        return
+    document_index = get_document_index(docx_file_path, engine=engine)
     try:
-        return result
+        yield from _iter_ebd_tables_sequentially(document_index)
+    finally:
+        if is_manually_triggered_garbage_collection_required and not document_cache.is_enabled:
+            del document_index
+            gc.collect()
+
+
+def get_ebd_table(
+    docx_file_path: DocxSource | DocumentIndex,
+    ebd_key: str,
+    cache: Optional[EbdTableCache] = None,
+    engine: ExtractionEngine = "python-docx",
+) -> EbdTable | EbdNoTableSection:
+    """
+    Locates and converts a single EBD from the given file (or its content, see `get_document`, or document index).
+    Chapter, section and name of the EBD are read from the document headings (like in `iter_ebd_tables`).
+
+    If a `cache` is given (and a path, not a `DocumentIndex`), the result is read from the cache if the same file
+    content has been converted before, without reading the document at all.
+    The `engine` ("python-docx" or "lxml") determines how the file is read (see `iter_ebd_tables`).
+
+    Raises:
+        TableNotFoundError: If the EBD is not found in the document.
+        EbdTableNotConvertibleError, StepNumberNotFoundError: If the EBD table can't be converted.
+    """
+    if EBD_KEY_PATTERN.match(ebd_key) is None:
+        raise ValueError(f"The ebd_key '{ebd_key}' does not match {EBD_KEY_PATTERN.pattern}")
+    docx_file_path = normalize_docx_source(docx_file_path)
+    document_hash: Optional[str] = None
+    if cache is not None and not isinstance(docx_file_path, DocumentIndex):
+        docx_file_path = get_rereadable_docx_source(docx_file_path)  # it's hashed and then parsed
+        document_hash = get_document_hash(docx_file_path)
+        cached_result = cache.load(document_hash, ebd_key)
+        if isinstance(cached_result, Exception):
+            raise cached_result
+        if cached_result is not None:
+            return cached_result
+    document_index = get_document_index(docx_file_path, engine=engine)
+    ebd_keys = document_index.get_all_ebd_keys()
+    try:
+        if ebd_key not in ebd_keys:
+            raise TableNotFoundError(ebd_key=ebd_key)
+        title, ebd_kapitel = ebd_keys[ebd_key]
+        release_information = get_release_information(document_index)
+        result = convert_ebd_section(document_index, ebd_key, title, ebd_kapitel, release_information)
+    except (TableNotFoundError, EbdTableNotConvertibleError, StepNumberNotFoundError) as error:
+        if cache is not None and document_hash is not None:
+            cache.store(document_hash, ebd_key, error)
+        raise
     finally:
-        if _is_manually_triggered_garbage_collection_required:
-            del document
+        if is_manually_triggered_garbage_collection_required and not document_cache.is_enabled:
+            del document_index
             gc.collect()
+    if cache is not None and document_hash is not None:
+        cache.store(document_hash, ebd_key, result)
+    return result
@@ -0,0 +1,125 @@
+"""
+An in-process LRU cache for parsed documents.
+
+This module is internal - do not import directly from external code.
+"""
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Generic, Optional, TypeVar
+
+from docx.document import Document as DocumentType
+
+from .documentindex import DocumentIndex
+
+CachedT = TypeVar("CachedT")
+
+DocumentCacheKey = tuple[str, int, int]
+"""
+resolved path, modification time (in ns) and size (in bytes) of the file
+"""
+
+
+def get_document_cache_key(docx_file_path: Path) -> DocumentCacheKey:
+    """
+    Returns the cache key of the file; the key changes as soon as the file is modified.
+    """
+    stat_result = docx_file_path.stat()
+    return str(docx_file_path.resolve()), stat_result.st_mtime_ns, stat_result.st_size
+
+
+class CachedDocument:  # pylint:disable=too-few-public-methods
+    """
+    A parsed document and its index (which is built on first access).
+    """
+
+    __slots__ = ("document", "_index")
+
+    def __init__(self, document: DocumentType):
+        self.document = document
+        self._index: Optional[DocumentIndex] = None
+
+    @property
+    def index(self) -> DocumentIndex:
+        """
+        the index of the document
+        """
+        if self._index is None:
+            self._index = DocumentIndex(self.document)
+        return self._index
+
+
+class DocumentCache(Generic[CachedT]):
+    """
+    A thread-safe LRU cache of parsed documents, limited by the number of documents and the summed up file sizes.
+    The cached values are either `CachedDocument`s (python-docx) or the indexes of the lxml engine.
+    """
+
+    def __init__(self, max_documents: int, max_bytes: int):
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[DocumentCacheKey, CachedT] = OrderedDict()
+        self.max_documents = max_documents
+        self.max_bytes = max_bytes
+
+    @property
+    def is_enabled(self) -> bool:
+        """
+        false if the limits don't allow to cache any document
+        """
+        return self.max_documents > 0 and self.max_bytes > 0
+
+    def get(self, key: DocumentCacheKey) -> Optional[CachedT]:
+        """
+        Returns the cached document (and marks it as most recently used) or None.
+        """
+        with self._lock:
+            cached_document = self._entries.get(key)
+            if cached_document is not None:
+                self._entries.move_to_end(key)
+            return cached_document
+
+    def put(self, key: DocumentCacheKey, cached_document: CachedT) -> int:
+        """
+        Adds the document to the cache and drops the least recently used documents if a limit is exceeded.
+        Returns the number of dropped documents.
+        """
+        if not self.is_enabled or key[2] > self.max_bytes:
+            return 0
+        with self._lock:
+            self._entries[key] = cached_document
+            self._entries.move_to_end(key)
+            return self._shrink()
+
+    def _shrink(self) -> int:
+        number_of_dropped_documents = 0
+        while self._entries and (
+            len(self._entries) > self.max_documents or sum(key[2] for key in self._entries) > self.max_bytes
+        ):
+            self._entries.popitem(last=False)
+            number_of_dropped_documents += 1
+        return number_of_dropped_documents
+
+    def configure(self, max_documents: int, max_bytes: int) -> int:
+        """
+        Changes the limits and returns the number of documents that had to be dropped.
+        """
+        with self._lock:
+            self.max_documents = max_documents
+            self.max_bytes = max_bytes
+            return self._shrink()
+
+    def invalidate(self, docx_file_path: Optional[Path] = None) -> int:
+        """
+        Drops all versions of the given file (or all documents if no path is given) from the cache.
+        Returns the number of dropped documents.
+        """
+        with self._lock:
+            if docx_file_path is None:
+                keys = list(self._entries.keys())
+            else:
+                resolved_path = str(docx_file_path.resolve())
+                keys = [key for key in self._entries if key[0] == resolved_path]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
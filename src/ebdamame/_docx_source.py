@@ -0,0 +1,140 @@
+"""
+Helpers to read .docx files from paths, in-memory buffers and binary file objects without copying their content.
+
+This module is internal - do not import directly from external code.
+"""
+
+import io
+import mmap
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, BinaryIO, Generator, TypeVar, Union
+
+DocxSource = Union[Path, str, "os.PathLike[str]", bytes, bytearray, memoryview, mmap.mmap, BinaryIO]
+"""
+A .docx file: either its path (`Path`, `str` or `os.PathLike`), its content (bytes, bytearray, memoryview or a
+memory-mapped file) or a binary file object. In-memory content and memory-mapped files are read without copying them;
+file objects must be seekable (otherwise they're read into memory first).
+"""
+
+BUFFER_TYPES = (bytes, bytearray, memoryview, mmap.mmap)
+"""
+the types of in-memory content that are read in place
+"""
+
+_SourceT = TypeVar("_SourceT")
+
+
+def normalize_docx_source(docx_source: _SourceT) -> _SourceT | Path:
+    """
+    Returns paths given as `str` or `os.PathLike` as `Path`, so that they're read and cached like `Path` objects.
+    All other sources are returned unchanged.
+    """
+    if isinstance(docx_source, (str, os.PathLike)):
+        return Path(docx_source)
+    return docx_source
+
+
+class BufferReader(io.RawIOBase):
+    """
+    A read-only, seekable file object on top of an object that supports the buffer protocol.
+    Unlike `io.BytesIO(buffer)`, this neither copies the buffer nor converts it to bytes; only the requested chunks
+    are copied on `read`.
+    """
+
+    def __init__(self, buffer: Union[bytes, bytearray, memoryview, mmap.mmap]):
+        super().__init__()
+        self._view = memoryview(buffer).cast("B")
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence})")
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+        self._position = position
+        return position
+
+    def read(self, size: int | None = -1) -> bytes:
+        end = len(self._view) if size is None or size < 0 else min(self._position + size, len(self._view))
+        if end <= self._position:
+            return b""
+        chunk = bytes(self._view[self._position : end])
+        self._position = end
+        return chunk
+
+    def readinto(self, buffer: "memoryview | bytearray") -> int:  # type: ignore[override]
+        target = memoryview(buffer).cast("B")
+        number_of_bytes = max(0, min(len(target), len(self._view) - self._position))
+        target[:number_of_bytes] = self._view[self._position : self._position + number_of_bytes]
+        self._position += number_of_bytes
+        return number_of_bytes
+
+    def close(self) -> None:
+        if not self.closed:
+            self._view.release()  # a memory-mapped file can't be closed as long as there are views on it
+        super().close()
+
+
+def get_rereadable_docx_source(docx_source: DocxSource) -> DocxSource:
+    """
+    Returns the source itself unless it's a file object that is not seekable: Its content is read into memory once
+    then, so that it can be read more than once (e.g. hashed and parsed).
+    """
+    if isinstance(docx_source, (str, os.PathLike, *BUFFER_TYPES)) or docx_source.seekable():
+        return docx_source
+    return io.BytesIO(docx_source.read())
+
+
+@contextmanager
+def open_docx_source(docx_source: DocxSource) -> Generator[Union[str, IO[bytes]], None, None]:
+    """
+    Yields something that python-docx and zipfile can read the .docx file from: the path (as str) of files on disk,
+    a `BufferReader` for in-memory content and the file object itself if it's seekable.
+    The position of file objects is restored afterwards.
+    """
+    if isinstance(docx_source, (str, os.PathLike)):
+        # zipfile reads the parts from the file on demand; the file is not loaded as a whole
+        yield os.fspath(docx_source)
+        return
+    if isinstance(docx_source, BUFFER_TYPES):
+        with BufferReader(docx_source) as buffer_reader:
+            yield buffer_reader  # type: ignore[misc]
+        return
+    if not docx_source.seekable():
+        with io.BytesIO(docx_source.read()) as docx_stream:
+            yield docx_stream
+        return
+    position = docx_source.tell()
+    try:
+        yield docx_source
+    finally:
+        docx_source.seek(position)
+
+
+def describe_docx_source(docx_source: DocxSource) -> str:
+    """
+    returns a short description of the source for log messages (the path of files on disk)
+    """
+    if isinstance(docx_source, (str, os.PathLike)):
+        return os.fspath(docx_source)
+    name = getattr(docx_source, "name", None)
+    if isinstance(name, str):
+        return name
+    return f"<{type(docx_source).__name__}>"
@@ -7,18 +7,23 @@ This module is internal - do not import directly from external code.
 import itertools
 import logging
 import re
+import threading
+import weakref
 from datetime import date
 from typing import Generator, Iterable, Optional, Union
 
 from docx.document import Document as DocumentType
 from docx.oxml.document import CT_Body
-from docx.oxml.ns import qn
+from docx.oxml.ns import nsmap, qn
 from docx.oxml.table import CT_Tbl
 from docx.oxml.text.paragraph import CT_P
 from docx.table import Table, _Cell
 from docx.text.paragraph import Paragraph
+from lxml import etree  # type: ignore[import-untyped]
 from rebdhuhn.models.ebd_table import EbdDocumentReleaseInformation
 
+from ._raw_table import RawEbdTable, get_cell_text
+from .instrumentation import measure_stage
 from .models import EbdChapterInformation
 
 _logger = logging.getLogger(__name__)
@@ -40,6 +45,33 @@ It appears in cells like "ja  5" to indicate the subsequent step number.
 """
 
 
+_EBD_CELL_TEXT_PATTERN = re.compile(
+    rf"{DOCX_ARROW_CHAR}|à|^(?:(?:ja|nein)\Z|(?:ja|nein)\s*(?:Ende|\d+)$|\s*Cluster:|Hinweis:)"
+)
+"""
+All the criteria of cell_text_is_probably_from_an_ebd_cell in one pattern (use it with `search`):
+the arrow (also in the wrong encoding "à"), "ja"/"nein" (optionally followed by the subsequent step), or a cell that
+starts with "Cluster:" (ignoring leading whitespace) or "Hinweis:".
+"""
+
+_EBD_CELL_SIGNAL_PATTERN = re.compile(rf"{DOCX_ARROW_CHAR}|à|ja|nein|Cluster:|Hinweis:")
+"""
+Matches the raw w:t texts of every cell that might match _EBD_CELL_TEXT_PATTERN; the texts of all other cells don't
+have to be joined at all.
+"""
+
+_NAMESPACES = {"w": nsmap["w"]}
+_cell_elements_xpath = etree.XPath(
+    "w:tr/w:tc[not(w:tcPr/w:vMerge[not(@w:val) or @w:val='continue'])]", namespaces=_NAMESPACES
+)
+"""
+the cells of a w:tbl element that have a text of their own (the text of vertically merged cells is found in the first
+cell of the merge)
+"""
+_first_cell_xpath = etree.XPath("w:tr[1]/w:tc[1]", namespaces=_NAMESPACES)
+_cell_texts_xpath = etree.XPath(".//w:t/text()", namespaces=_NAMESPACES)
+
+
 def get_tables_and_paragraphs(document: DocumentType) -> Generator[Union[Table, Paragraph], None, None]:
     """
     Yields tables and paragraphs from the given document in the order in which they occur in the document.
@@ -58,18 +90,12 @@ def get_tables_and_paragraphs(document: DocumentType) -> Generator[Union[Table,
 
 def cell_is_probably_from_an_ebd_cell(cell: _Cell) -> bool:
     """Check if a cell likely belongs to an EBD table based on its content."""
-    if DOCX_ARROW_CHAR in cell.text:
-        return True
-    if cell.text in {"ja", "nein"}:
-        return True
-    if "à" in cell.text:
-        # the rightarrow in wrong encoding
-        return True
-    if EBD_CELL_PATTERN.match(cell.text):
-        return True
-    if cell.text.strip().startswith("Cluster:") or cell.text.startswith("Hinweis:"):
-        return True
-    return False
+    return cell_text_is_probably_from_an_ebd_cell(cell.text)
+
+
+def cell_text_is_probably_from_an_ebd_cell(cell_text: str) -> bool:
+    """Check if a cell with the given text likely belongs to an EBD table."""
+    return _EBD_CELL_TEXT_PATTERN.search(cell_text) is not None
 
 
 def table_is_an_ebd_table(table: Table) -> bool:
@@ -78,16 +104,7 @@ def table_is_an_ebd_table(table: Table) -> bool:
     This is to distinguish between tables that are inside the same subsection that describes an EBD but are not part
     of the decision tree at all (e.g. in E_0406 the tables about Artikel-IDs).
     """
-    if table_is_first_ebd_table(table):
-        return True
-    for row in table.rows:
-        try:
-            for cell in row.cells:
-                if cell_is_probably_from_an_ebd_cell(cell):
-                    return True
-        except IndexError:  # don't ask me why this happens; It's the internals of python-docx
-            continue
-    return False
+    return ct_tbl_is_an_ebd_table(table._tbl)  # pylint:disable=protected-access
 
 
 def table_is_first_ebd_table(table: Table) -> bool:
@@ -96,18 +113,172 @@ def table_is_first_ebd_table(table: Table) -> bool:
     We assume that each EBD table has a header row with
     "Prüfende Rolle" in the first column.
     """
-    return "prüfende rolle" in table.rows[0].cells[0].text.lower()
+    return ct_tbl_is_first_ebd_table(table._tbl)  # pylint:disable=protected-access
+
+
+def ct_tbl_is_an_ebd_table(table_element: CT_Tbl) -> bool:
+    """
+    Same as table_is_an_ebd_table but works directly on the w:tbl element (without python-docx rows and cells, which
+    compute the merged cell grid for every row). Stops at the first cell that looks like an EBD cell.
+    """
+    if ct_tbl_is_first_ebd_table(table_element):
+        return True
+    for cell_element in _cell_elements_xpath(table_element):
+        if _EBD_CELL_SIGNAL_PATTERN.search("".join(_cell_texts_xpath(cell_element))) is None:
+            continue
+        if cell_text_is_probably_from_an_ebd_cell(get_cell_text(cell_element)):
+            return True
+    return False
+
+
+def ct_tbl_is_first_ebd_table(table_element: CT_Tbl) -> bool:
+    """
+    Same as table_is_first_ebd_table but works directly on the w:tbl element.
+    """
+    first_cells = _first_cell_xpath(table_element)
+    return bool(first_cells) and "prüfende rolle" in get_cell_text(first_cells[0]).lower()
+
+
+def raw_table_is_an_ebd_table(table: RawEbdTable) -> bool:
+    """
+    Same as table_is_an_ebd_table but for the text-only representation of a table.
+    """
+    if raw_table_is_first_ebd_table(table):
+        return True
+    for row_index in range(len(table.rows)):
+        try:
+            if any(cell_text_is_probably_from_an_ebd_cell(text) for text in table.get_grid_cell_texts(row_index)):
+                return True
+        except IndexError:  # same as in table_is_an_ebd_table
+            continue
+    return False
+
+
+def raw_table_is_first_ebd_table(table: RawEbdTable) -> bool:
+    """
+    Same as table_is_first_ebd_table but for the text-only representation of a table.
+    """
+    return "prüfende rolle" in table.get_grid_cell_texts(0)[0].lower()
+
+
+_DEFAULT_HEADING_LEVELS_BY_STYLE_ID: dict[str, Optional[int]] = {"berschrift1": 1, "berschrift2": 2, "berschrift3": 3}
+"""
+the (German) style ids of the headings in the EBD documents; used if a document has no styles part
+"""
+
+_HEADING_STYLE_NAME_PATTERN = re.compile(r"^heading (?P<level>[1-3])$", re.IGNORECASE)
+"""
+the names of the built-in heading styles that structure the document into chapters, sections and subsections.
+Word stores the names of built-in styles in English, only the style ids (and the displayed names) are localised.
+"""
+
+_STYLE = qn("w:style")
+_STYLE_ID = qn("w:styleId")
+_STYLE_NAME = qn("w:name")
+_STYLE_TYPE = qn("w:type")
+_STYLE_DEFAULT = qn("w:default")
+_VAL = qn("w:val")
+_P = qn("w:p")
+_P_PR = qn("w:pPr")
+_P_STYLE = qn("w:pStyle")
+
+
+class HeadingLevels:
+    """
+    Maps the raw style ids of paragraphs (w:pPr/w:pStyle/@w:val) to the heading levels of their styles: 1 (chapter),
+    2 (section) or 3 (subsection). All other paragraphs have no heading level (None).
+
+    The map is built once per document from its styles part; heading styles are recognized by their names ("heading 1"
+    to "heading 3"), so it doesn't matter whether their ids are e.g. "berschrift1" or "Heading1".
+    Style ids are resolved like python-docx resolves `Paragraph.style`: paragraphs without a style id (or with an id
+    that is not the id of a paragraph style) have the default paragraph style.
+    """
+
+    def __init__(self, styles_element: Optional[etree._Element]):
+        """
+        Reads the styles from the given w:styles element (None if the document has no styles part).
+        """
+        self._levels_by_style_id: dict[str, Optional[int]] = {}
+        self._default_level: Optional[int] = None
+        if styles_element is None:
+            self._levels_by_style_id = dict(_DEFAULT_HEADING_LEVELS_BY_STYLE_ID)
+            return
+        style_types: dict[str, Optional[str]] = {}
+        for style in styles_element.iterchildren(_STYLE):
+            style_id = style.get(_STYLE_ID)
+            style_type = style.get(_STYLE_TYPE)
+            level = _get_heading_level_of_style(style) if style_type == "paragraph" else None
+            if style_id is not None and style_id not in style_types:  # the first style with an id wins
+                style_types[style_id] = style_type
+                if style_type == "paragraph":
+                    self._levels_by_style_id[style_id] = level
+            if style_type == "paragraph" and style.get(_STYLE_DEFAULT) in ("1", "true", "on"):
+                self._default_level = level  # the last default style wins
+
+    def get_level(self, style_id: Optional[str]) -> Optional[int]:
+        """
+        Returns the heading level of paragraphs with the given (raw) style id; None if they're no headings.
+        """
+        if not style_id:
+            return self._default_level
+        return self._levels_by_style_id.get(style_id, self._default_level)
+
+    def get_paragraph_level(self, paragraph_element: etree._Element) -> Optional[int]:
+        """
+        Returns the heading level of the given w:p element; None if it's not a heading.
+        """
+        paragraph_properties = paragraph_element.find(_P_PR)
+        if paragraph_properties is None:
+            return self._default_level
+        paragraph_style = paragraph_properties.find(_P_STYLE)
+        return self.get_level(paragraph_style.get(_VAL) if paragraph_style is not None else None)
+
+
+def _get_heading_level_of_style(style: etree._Element) -> Optional[int]:
+    style_name = style.find(_STYLE_NAME)
+    if style_name is None:
+        return None
+    match = _HEADING_STYLE_NAME_PATTERN.match(style_name.get(_VAL) or "")
+    return int(match.group("level")) if match else None
+
+
+_heading_levels_cache: "weakref.WeakKeyDictionary[etree._Element, HeadingLevels]" = weakref.WeakKeyDictionary()
+"""
+The heading levels per document. The keys are the root (w:styles) elements of the styles parts, which live as long as
+the python-docx document. Entries are dropped together with their documents.
+"""
+_heading_levels_cache_lock = threading.Lock()
+
+
+def get_heading_levels(document: DocumentType) -> HeadingLevels:
+    """
+    Returns the heading levels of the paragraph styles of the given document (built on first access).
+    """
+    styles_element = document.styles.element
+    with _heading_levels_cache_lock:
+        heading_levels = _heading_levels_cache.get(styles_element)
+    if heading_levels is None:
+        heading_levels = HeadingLevels(styles_element)
+        with _heading_levels_cache_lock:
+            _heading_levels_cache[styles_element] = heading_levels
+    return heading_levels
+
+
+def get_paragraph_heading_level(paragraph: Paragraph, heading_levels: Optional[HeadingLevels] = None) -> Optional[int]:
+    """
+    Returns the heading level (1 to 3) of the given paragraph; None if it's not a heading.
+    The style of the paragraph is looked up in the heading levels of its document (unless they're given).
+    """
+    if heading_levels is None:
+        heading_levels = get_heading_levels(paragraph.part.package.main_document_part.document)
+    return heading_levels.get_paragraph_level(paragraph._p)  # pylint:disable=protected-access
 
 
 def is_heading(paragraph: Paragraph) -> bool:
     """
     Returns True if the paragraph is a heading.
     """
-    return paragraph.style is not None and paragraph.style.style_id in {
-        "berschrift1",
-        "berschrift2",
-        "berschrift3",
-    }
+    return get_paragraph_heading_level(paragraph) is not None
 
 
 def enrich_paragraphs_with_sections(
@@ -116,6 +287,24 @@ def enrich_paragraphs_with_sections(
     """
     Yield each paragraph + the "Kapitel" in which it is found.
     """
+    paragraphs, paragraphs_to_enrich = itertools.tee(paragraphs)
+    texts_and_heading_levels = (
+        (paragraph.text, get_paragraph_heading_level(paragraph)) for paragraph in paragraphs_to_enrich
+    )
+    for paragraph, (_, location) in zip(paragraphs, enrich_paragraph_texts_with_sections(texts_and_heading_levels)):
+        yield paragraph, location
+
+
+def enrich_paragraph_texts_with_sections(
+    texts_and_heading_levels: Iterable[tuple[str, Optional[int]]],
+) -> Generator[tuple[str, EbdChapterInformation], None, None]:
+    """
+    Yield each paragraph text + the "Kapitel" in which it is found.
+    The paragraphs are given as their texts and their heading levels (see HeadingLevels).
+    The chapter information only changes at headings; all paragraphs below the same heading share one (frozen)
+    instance.
+    """
+    location: Optional[EbdChapterInformation] = None
     chapter_counter = itertools.count(start=1)
     chapter = 1
     chapter_title: Optional[str] = None
@@ -125,24 +314,26 @@ def enrich_paragraphs_with_sections(
     subsection_counter = itertools.count(start=1)
     subsection = 1
     subsection_title: Optional[str] = None
-    for paragraph in paragraphs:
-        # since pyton-docx 1.1.2 there are type hints; seems like the style is not guaranteed to be not None
-        match paragraph.style.style_id:  # type: ignore[union-attr]
-            case "berschrift1":
+    for text, heading_level in texts_and_heading_levels:
+        match heading_level:
+            case 1:
                 chapter = next(chapter_counter)
-                chapter_title = paragraph.text.strip()
+                chapter_title = text.strip()
                 section_counter = itertools.count(start=1)
                 section_title = None
                 subsection_counter = itertools.count(start=1)
                 subsection_title = None
-            case "berschrift2":
+            case 2:
                 section = next(section_counter)
-                section_title = paragraph.text.strip()
+                section_title = text.strip()
                 subsection_counter = itertools.count(start=1)
                 subsection_title = None
-            case "berschrift3":
+            case 3:
                 subsection = next(subsection_counter)
-                subsection_title = paragraph.text.strip()
+                subsection_title = text.strip()
+            case _ if location is not None:
+                yield text, location
+                continue
         location = EbdChapterInformation(
             chapter=chapter,
             section=section,
@@ -152,7 +343,7 @@ def enrich_paragraphs_with_sections(
             subsection_title=subsection_title,
         )
         _logger.debug("Handling Paragraph %i.%i.%i", chapter, section, subsection)
-        yield paragraph, location
+        yield text, location
 
 
 _STAND_PATTERN = re.compile(r"^Stand:\s*(?P<day>\d{2})\.(?P<month>\d{2})\.(?P<year>\d{4})\s*$")
@@ -181,7 +372,7 @@ def _parse_german_date(date_str: str) -> Optional[date]:
     return None
 
 
-def _get_table_cell_texts(table_element: CT_Tbl) -> list[list[str]]:
+def _get_table_cell_texts(table_element: etree._Element) -> list[list[str]]:
     """
     Extract cell texts from a table element using low-level XML API.
 
@@ -205,43 +396,124 @@ def _get_table_cell_texts(table_element: CT_Tbl) -> list[list[str]]:
     return rows_data
 
 
-def _extract_stand_date_from_body(body: CT_Body) -> Optional[date]:
-    """Extract the 'Stand:' date from the document body."""
-    for para_elem in body.iter(qn("w:p")):
-        para_text = "".join(t_elem.text for t_elem in para_elem.iter(qn("w:t")) if t_elem.text).strip()
-        match = _STAND_PATTERN.match(para_text)
+def match_stand_date(paragraph_element: etree._Element) -> Optional[re.Match[str]]:
+    """Returns the match if the paragraph is the 'Stand:' paragraph, None otherwise."""
+    para_text = "".join(t_elem.text for t_elem in paragraph_element.iter(qn("w:t")) if t_elem.text).strip()
+    return _STAND_PATTERN.match(para_text)
+
+
+def parse_stand_date(match: re.Match[str]) -> Optional[date]:
+    """Returns the date of a matched 'Stand:' paragraph (None if the date is invalid)."""
+    day, month, year = int(match.group("day")), int(match.group("month")), int(match.group("year"))
+    try:
+        result = date(year, month, day)
+        _logger.debug("Found Stand date: %s", result)
+        return result
+    except ValueError:
+        _logger.warning("Invalid Stand date values: day=%d, month=%d, year=%d", day, month, year)
+        return None
+
+
+_paragraphs_xpath = etree.XPath("descendant-or-self::w:p", namespaces=_NAMESPACES)
+_is_section_break_xpath = etree.XPath("boolean(self::w:p/w:pPr/w:sectPr)", namespaces=_NAMESPACES)
+
+
+def is_end_of_title_page(body_child: etree._Element, heading_levels: HeadingLevels) -> bool:
+    """
+    Returns true iff the given direct child of the body is the first heading, i.e. the first element after the title
+    page. The title page contains the release information ('Stand:' paragraph and version table).
+    The headings are recognized by the heading levels of the document (see HeadingLevels).
+    """
+    return body_child.tag == _P and heading_levels.get_paragraph_level(body_child) is not None
+
+
+def is_last_element_of_title_page(body_child: etree._Element) -> bool:
+    """
+    Returns true iff the given direct child of the body is a paragraph that ends a section (i.e. the title page).
+    """
+    return bool(_is_section_break_xpath(body_child))
+
+
+def iter_title_page(body: CT_Body, heading_levels: HeadingLevels) -> Generator[etree._Element, None, None]:
+    """
+    Yields the direct children of the body up to the first section break (inclusive) or the first heading (exclusive),
+    whatever comes first.
+    """
+    for body_child in body.iterchildren():
+        if is_end_of_title_page(body_child, heading_levels):
+            return
+        yield body_child
+        if is_last_element_of_title_page(body_child):
+            return
+
+
+def find_stand_date_match(body_child: etree._Element) -> Optional[re.Match[str]]:
+    """
+    Returns the match of the first 'Stand:' paragraph in the given element (or the element itself), None otherwise.
+    """
+    for paragraph_element in _paragraphs_xpath(body_child):
+        match = match_stand_date(paragraph_element)
+        if match:
+            return match
+    return None
+
+
+def _extract_stand_date_from_body(body: CT_Body, heading_levels: HeadingLevels) -> Optional[date]:
+    """Extract the 'Stand:' date from the title page of the document body."""
+    for body_child in iter_title_page(body, heading_levels):
+        match = find_stand_date_match(body_child)
         if match:
-            day, month, year = int(match.group("day")), int(match.group("month")), int(match.group("year"))
-            try:
-                result = date(year, month, day)
-                _logger.debug("Found Stand date: %s", result)
-                return result
-            except ValueError:
-                _logger.warning("Invalid Stand date values: day=%d, month=%d, year=%d", day, month, year)
-                return None
+            return parse_stand_date(match)
     return None
 
 
-def _extract_version_info_from_body(body: CT_Body) -> tuple[Optional[str], Optional[date]]:
-    """Extract version and original release date from the metadata table in the document body."""
-    for item in body.iterchildren():
+def get_version_info_from_table(table_element: etree._Element) -> Optional[tuple[str, Optional[date]]]:
+    """
+    Returns version and original release date if the given (top level) table is the metadata table, None otherwise.
+    """
+    rows_data = _get_table_cell_texts(table_element)
+    if len(rows_data) < 2 or len(rows_data[0]) < 2:
+        return None
+    if rows_data[0][0].strip() != "Version:":
+        return None
+    version = rows_data[0][1].strip()
+    _logger.debug("Found Version: %s", version)
+    original_release_date = None
+    if len(rows_data[1]) >= 2 and "Publikationsdatum" in rows_data[1][0].strip():
+        original_release_date = _parse_german_date(rows_data[1][1].strip())
+        _logger.debug("Found original release date: %s", original_release_date)
+    return version, original_release_date
+
+
+def _extract_version_info_from_body(
+    body: CT_Body, heading_levels: HeadingLevels
+) -> tuple[Optional[str], Optional[date]]:
+    """Extract version and original release date from the metadata table on the title page of the document body."""
+    for item in iter_title_page(body, heading_levels):
         if not isinstance(item, CT_Tbl):
             continue
-        rows_data = _get_table_cell_texts(item)
-        if len(rows_data) < 2 or len(rows_data[0]) < 2:
-            continue
-        if rows_data[0][0].strip() != "Version:":
-            continue
-        version = rows_data[0][1].strip()
-        _logger.debug("Found Version: %s", version)
-        original_release_date = None
-        if len(rows_data[1]) >= 2 and "Publikationsdatum" in rows_data[1][0].strip():
-            original_release_date = _parse_german_date(rows_data[1][1].strip())
-            _logger.debug("Found original release date: %s", original_release_date)
-        return version, original_release_date
+        version_info = get_version_info_from_table(item)
+        if version_info is not None:
+            return version_info
     return None, None
 
 
+def create_release_information(
+    version: Optional[str], release_date: Optional[date], original_release_date: Optional[date]
+) -> Optional[EbdDocumentReleaseInformation]:
+    """
+    Returns the release information or None (and logs a warning) if no version has been found.
+    """
+    if version is None:
+        _logger.warning("Could not find Version information in the document title page")
+        return None
+    return EbdDocumentReleaseInformation(
+        version=version,
+        release_date=release_date,
+        original_release_date=original_release_date,
+    )
+
+
 def get_ebd_document_release_information(document: DocumentType) -> Optional[EbdDocumentReleaseInformation]:
     """
     Extract release information from the title page of an EBD document.
@@ -257,11 +529,11 @@ def get_ebd_document_release_information(document: DocumentType) -> Optional[Ebd
         EbdDocumentReleaseInformation with version and dates extracted from the title page,
         or None if the information could not be extracted (logs a warning in this case).
     """
-    return get_ebd_document_release_information_from_body(document.element.body)
+    return get_ebd_document_release_information_from_body(document.element.body, get_heading_levels(document))
 
 
 def get_ebd_document_release_information_from_body(
-    body: CT_Body,
+    body: CT_Body, heading_levels: HeadingLevels
 ) -> Optional[EbdDocumentReleaseInformation]:
     """
     Extract release information from the body element of an EBD document.
@@ -270,26 +542,56 @@ def get_ebd_document_release_information_from_body(
     from a document body element directly, which is useful when you only have
     access to tables (which reference their parent document via table.part.element.body).
 
+    The result is memoized per document (see _release_information_cache), so converting all EBDs of a document
+    scans its title page only once.
+
     Args:
         body: The document body element (CT_Body)
+        heading_levels: The heading levels of the document (the first heading ends the title page)
 
     Returns:
         EbdDocumentReleaseInformation with version and dates extracted from the title page,
         or None if the information could not be extracted (logs a warning in this case).
     """
-    try:
-        release_date = _extract_stand_date_from_body(body)
-        version, original_release_date = _extract_version_info_from_body(body)
+    document_element = body.getparent()
+    if document_element is None:
+        return _read_release_information_from_body(body, heading_levels)
+    with _release_information_cache_lock:
+        cached_release_information = _release_information_cache.get(document_element, _NOT_CACHED)
+    if cached_release_information is _NOT_CACHED:
+        cached_release_information = _read_release_information_from_body(body, heading_levels)
+        with _release_information_cache_lock:
+            _release_information_cache[document_element] = cached_release_information
+    if cached_release_information is None:
+        return None
+    assert isinstance(cached_release_information, EbdDocumentReleaseInformation)
+    # the model is mutable; a copy keeps the cached information intact if the caller modifies the result
+    return cached_release_information.model_copy()
 
-        if version is None:
-            _logger.warning("Could not find Version information in the document title page")
-            return None
 
-        return EbdDocumentReleaseInformation(
-            version=version,
-            release_date=release_date,
-            original_release_date=original_release_date,
-        )
+_release_information_cache: "weakref.WeakKeyDictionary[etree._Element, Optional[EbdDocumentReleaseInformation]]" = (
+    weakref.WeakKeyDictionary()
+)
+"""
+The release information per document. The keys are the root (w:document) elements, which live as long as the
+python-docx document (unlike the proxy objects of the w:body element, which lxml may re-create on every access).
+Entries are dropped together with their documents.
+"""
+_release_information_cache_lock = threading.Lock()
+_NOT_CACHED = object()
+
+
+def _read_release_information_from_body(
+    body: CT_Body, heading_levels: HeadingLevels
+) -> Optional[EbdDocumentReleaseInformation]:
+    """
+    scans the given body for the release information (without memoization)
+    """
+    try:
+        with measure_stage("read_release_information"):
+            release_date = _extract_stand_date_from_body(body, heading_levels)
+            version, original_release_date = _extract_version_info_from_body(body, heading_levels)
+        return create_release_information(version, release_date, original_release_date)
     except Exception as e:  # pylint: disable=broad-exception-caught
         _logger.warning("Failed to extract release information from document: %s", e)
         return None
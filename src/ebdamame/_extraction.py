@@ -0,0 +1,196 @@
+"""
+Reading, indexing and converting documents: the building blocks shared by the public functions of the package and by
+the modules `batch`, `incremental`, `manifest` and `aio`. It also holds the in-process caches of parsed documents.
+
+This module is internal - do not import directly from external code.
+"""
+
+import gc
+import logging
+import sys
+from pathlib import Path
+from typing import Literal, Optional
+
+import docx
+from docx.document import Document as DocumentType
+from rebdhuhn.models.ebd_table import EbdDocumentReleaseInformation, EbdTable
+
+from ._document_cache import CachedDocument, DocumentCache, get_document_cache_key
+from ._docx_source import DocxSource, describe_docx_source, normalize_docx_source, open_docx_source
+from ._docx_utils import get_ebd_document_release_information
+from ._lxml_engine import StreamedDocumentIndex, read_streamed_document_index
+from .documentindex import DocumentIndex
+from .docxtableconverter import DocxTableConverter
+from .instrumentation import measure_stage
+from .models import EbdChapterInformation, EbdNoTableSection
+
+_logger = logging.getLogger(__name__)
+
+_is_python_version_314 = sys.version_info[0:2] == (3, 14)
+is_manually_triggered_garbage_collection_required = _is_python_version_314
+
+"""
+I don't know the reason why, but the CI failed in Python 3.14 with the following message:
+"Error: Process completed with exit code 143."
+based on the commit https://github.com/Hochfrequenz/ebdamame/pull/363/commits/b6a456345d46a11fe09c6c1c32ff66e62cb1392c
+
+The python-docx repo as of 2025-10-13 mentions one open issue which might be related:
+https://github.com/python-openxml/python-docx/issues/1428
+Also in the CPython repository there is an open regression bug, that maybe affects ebdamame internally:
+https://github.com/python/cpython/issues/139951
+So as a workaround, we trigger garbage collection manually after working with a docx file.
+"""
+
+
+ExtractionEngine = Literal["python-docx", "lxml"]
+"""
+The engine that reads the document:
+"python-docx" builds the python-docx object model of the document (this is the default).
+"lxml" streams the XML of the document and keeps only the texts of paragraphs and tables, which is faster and needs
+less memory. Both engines produce the same results.
+"""
+
+document_cache: DocumentCache[CachedDocument] = DocumentCache(max_documents=2, max_bytes=32 * 1024 * 1024)
+"""
+the parsed documents that are kept in memory (see configure_document_cache)
+"""
+streamed_document_cache: DocumentCache[StreamedDocumentIndex] = DocumentCache(
+    max_documents=2, max_bytes=32 * 1024 * 1024
+)
+"""
+the documents that have been read by the lxml engine and are kept in memory (same limits as document_cache)
+"""
+
+
+def _get_document_cache(
+    engine: ExtractionEngine,
+) -> DocumentCache[CachedDocument] | DocumentCache[StreamedDocumentIndex]:
+    return streamed_document_cache if engine == "lxml" else document_cache
+
+
+def is_document_cache_enabled(engine: ExtractionEngine) -> bool:
+    """
+    false if the limits of the document cache don't allow to cache any document read by the given engine
+    """
+    return _get_document_cache(engine).is_enabled
+
+
+def is_document_cached(docx_file_path: Path, engine: ExtractionEngine) -> bool:
+    """
+    true if the (unchanged) file has been read by the given engine and is still kept in the document cache
+    """
+    return _get_document_cache(engine).get(get_document_cache_key(docx_file_path)) is not None
+
+
+def read_document(docx_file_path: DocxSource) -> DocumentType:
+    """
+    opens and returns the document specified in the docx_file_path using python-docx (without any caching)
+    """
+    # The content is not copied into a BytesIO first: python-docx reads the parts of the package directly from the
+    # file (or from the in-memory content), so the compressed file is never held in memory as a whole.
+    with measure_stage("read_document"), open_docx_source(docx_file_path) as docx_source:
+        document = docx.Document(docx_source)
+    _logger.info("Successfully read the file '%s'", describe_docx_source(docx_file_path))
+    return document
+
+
+def get_cached_document(docx_file_path: DocxSource) -> CachedDocument:
+    """
+    returns the parsed document from the in-process cache; reads it if it's not (yet) cached
+    Only files on disk are cached; in-memory content and file objects are read on every call.
+    """
+    docx_file_path = normalize_docx_source(docx_file_path)
+    if not isinstance(docx_file_path, Path) or not document_cache.is_enabled:
+        return CachedDocument(read_document(docx_file_path))
+    cache_key = get_document_cache_key(docx_file_path)
+    cached_document = document_cache.get(cache_key)
+    if cached_document is None:
+        cached_document = CachedDocument(read_document(docx_file_path))
+        number_of_dropped_documents = document_cache.put(cache_key, cached_document)
+        if number_of_dropped_documents > 0 and is_manually_triggered_garbage_collection_required:
+            gc.collect()
+    else:
+        _logger.debug("Using the cached document for '%s'", describe_docx_source(docx_file_path))
+    return cached_document
+
+
+def _get_streamed_document_index(docx_file_path: DocxSource) -> StreamedDocumentIndex:
+    """
+    returns the index of the document read by the lxml engine (from the in-process cache if possible)
+    """
+    docx_file_path = normalize_docx_source(docx_file_path)
+    if not isinstance(docx_file_path, Path) or not streamed_document_cache.is_enabled:
+        return read_streamed_document_index(docx_file_path)
+    cache_key = get_document_cache_key(docx_file_path)
+    streamed_document_index = streamed_document_cache.get(cache_key)
+    if streamed_document_index is None:
+        streamed_document_index = read_streamed_document_index(docx_file_path)
+        streamed_document_cache.put(cache_key, streamed_document_index)
+    else:
+        _logger.debug("Using the cached lxml index for '%s'", describe_docx_source(docx_file_path))
+    return streamed_document_index
+
+
+def get_document_index(
+    docx_file_path: DocxSource | DocumentIndex, engine: ExtractionEngine = "python-docx"
+) -> DocumentIndex | StreamedDocumentIndex:
+    """
+    returns the index of the document (built only once per document as long as the document is cached)
+    """
+    if isinstance(docx_file_path, DocumentIndex):
+        return docx_file_path
+    docx_file_path = normalize_docx_source(docx_file_path)
+    if engine == "lxml":
+        return _get_streamed_document_index(docx_file_path)
+    if engine != "python-docx":
+        raise ValueError(f"Unknown engine '{engine}'")
+    return get_cached_document(docx_file_path).index
+
+
+def read_document_index(docx_file_path: Path, engine: ExtractionEngine) -> DocumentIndex | StreamedDocumentIndex:
+    """
+    reads and indexes the document with the given engine (without any caching)
+    """
+    if engine == "lxml":
+        return read_streamed_document_index(docx_file_path)
+    return DocumentIndex(read_document(docx_file_path))
+
+
+def get_release_information(
+    document_index: DocumentIndex | StreamedDocumentIndex,
+) -> Optional[EbdDocumentReleaseInformation]:
+    """
+    returns the release information from the title page of the indexed document
+    """
+    if isinstance(document_index, StreamedDocumentIndex):
+        return document_index.release_information
+    return get_ebd_document_release_information(document_index.document)
+
+
+def convert_ebd_section(
+    document_index: DocumentIndex | StreamedDocumentIndex,
+    ebd_key: str,
+    title: str,
+    ebd_kapitel: EbdChapterInformation,
+    release_information: Optional[EbdDocumentReleaseInformation],
+) -> EbdTable | EbdNoTableSection:
+    """
+    Locates the tables of the given EBD in the index and converts them to an EbdTable.
+    Chapter, section and name of the EBD are taken from the chapter information of the EBD heading.
+    """
+    docx_tables = document_index.get_ebd_raw_tables(ebd_key)  # the tables as read for the classification
+    if isinstance(docx_tables, EbdNoTableSection):
+        return docx_tables
+    ebd_name = ebd_kapitel.subsection_title
+    if ebd_name is None or not ebd_name.startswith(ebd_key):
+        # the EBD heading is not the (last) subsection heading, e.g. because it is not formatted as heading
+        ebd_name = f"{ebd_key}_{title.strip()}"
+    converter = DocxTableConverter(
+        docx_tables,
+        ebd_key=ebd_key,
+        ebd_name=ebd_name,
+        chapter=ebd_kapitel.chapter_title or "",
+        section=f"{ebd_kapitel.chapter}.{ebd_kapitel.section}.{ebd_kapitel.subsection}: {ebd_kapitel.section_title}",
+        release_information=release_information,
+    )
+    return converter.convert_docx_tables_to_ebd_table()
@@ -0,0 +1,223 @@
+"""
+An alternative extraction engine that reads EBD documents with lxml, bypassing the python-docx object model.
+
+The main document part is streamed with `lxml.etree.iterparse`. Each paragraph and table on the top level of the
+document body is reduced to its text (or to a `RawEbdTable`) and removed from the tree as soon as it has been read.
+The resulting index yields the same EBD keys, remarks and tables as the `DocumentIndex` of a python-docx document.
+
+This module is internal - do not import directly from external code.
+"""
+
+import logging
+import zipfile
+from datetime import date
+from typing import IO, Generator, Optional
+
+from docx.oxml.ns import qn
+from lxml import etree  # type: ignore[import-untyped]
+from rebdhuhn.models.ebd_table import EbdDocumentReleaseInformation
+
+from ._docx_source import DocxSource, describe_docx_source, open_docx_source
+from ._docx_utils import (
+    HeadingLevels,
+    create_release_information,
+    find_stand_date_match,
+    get_version_info_from_table,
+    is_end_of_title_page,
+    is_last_element_of_title_page,
+    parse_stand_date,
+)
+from ._raw_table import RawEbdTable, get_paragraph_text
+from .documentindex import DocumentIndexBase, IndexedParagraph
+from .instrumentation import measure_stage
+
+_logger = logging.getLogger(__name__)
+
+_DOCUMENT_PART_NAME = "word/document.xml"
+_STYLES_PART_NAME = "word/styles.xml"
+
+_BODY = qn("w:body")
+_P = qn("w:p")
+_TBL = qn("w:tbl")
+
+
+def _create_parser() -> etree.XMLParser:
+    """
+    returns a parser with the same settings as the one used by python-docx (so that the texts are the same)
+    """
+    return etree.XMLParser(remove_blank_text=True, resolve_entities=False)
+
+
+class _ReleaseInformationCollector:
+    """
+    Collects the release information from the elements of the document body while they're streamed.
+    It finds the same information as get_ebd_document_release_information: the first 'Stand:' paragraph and the first
+    top level table that contains the version, both on the title page (which ends at the first heading according to
+    the given heading levels of the document).
+    """
+
+    def __init__(self, heading_levels: HeadingLevels) -> None:
+        self._heading_levels = heading_levels
+        self._stand_date_is_found = False
+        self._release_date: Optional[date] = None
+        self._version_info: Optional[tuple[str, Optional[date]]] = None
+        self._title_page_is_read = False
+        self._error: Optional[Exception] = None
+
+    @property
+    def is_complete(self) -> bool:
+        """
+        true as soon as the remaining elements of the body can't change the release information anymore
+        """
+        return (
+            self._error is not None
+            or self._title_page_is_read
+            or (self._stand_date_is_found and self._version_info is not None)
+        )
+
+    def feed(self, body_child: etree._Element) -> None:
+        """
+        Reads the given direct child of the body element (must be called in document order).
+        """
+        if self.is_complete:
+            return
+        try:
+            if is_end_of_title_page(body_child, self._heading_levels):
+                self._title_page_is_read = True
+                return
+            if not self._stand_date_is_found:
+                match = find_stand_date_match(body_child)
+                if match:
+                    self._release_date = parse_stand_date(match)
+                    self._stand_date_is_found = True
+            if self._version_info is None and body_child.tag == _TBL:
+                self._version_info = get_version_info_from_table(body_child)
+            self._title_page_is_read = is_last_element_of_title_page(body_child)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            self._error = error
+
+    def get_release_information(self) -> Optional[EbdDocumentReleaseInformation]:
+        """
+        returns the release information (or None if it could not be extracted)
+        """
+        if self._error is not None:
+            _logger.warning("Failed to extract release information from document: %s", self._error)
+            return None
+        version, original_release_date = self._version_info or (None, None)
+        return create_release_information(version, self._release_date, original_release_date)
+
+
+class StreamedDocumentIndex(DocumentIndexBase[RawEbdTable]):
+    """
+    An index over the paragraph texts and tables of an EBD document that has been read by the lxml engine.
+    The tables are `RawEbdTable`s; the index holds neither XML nor python-docx objects.
+    """
+
+    def __init__(
+        self,
+        items: list[IndexedParagraph | RawEbdTable],
+        release_information: Optional[EbdDocumentReleaseInformation],
+    ):
+        super().__init__(items)
+        self._release_information = release_information
+
+    @property
+    def release_information(self) -> Optional[EbdDocumentReleaseInformation]:
+        """
+        the release information from the title page of the document
+        """
+        return self._release_information
+
+    def _get_raw_table(self, table: RawEbdTable) -> RawEbdTable:
+        return table
+
+
+def _read_heading_levels(archive: zipfile.ZipFile) -> HeadingLevels:
+    """
+    returns the heading levels of the paragraph styles in the styles part of the given .docx archive
+    """
+    try:
+        styles_element: Optional[etree._Element] = etree.fromstring(archive.read(_STYLES_PART_NAME), _create_parser())
+    except KeyError:
+        styles_element = None
+    return HeadingLevels(styles_element)
+
+
+def _iter_body_items(
+    document_part: IO[bytes], heading_levels: HeadingLevels, release_information: _ReleaseInformationCollector
+) -> Generator[IndexedParagraph | RawEbdTable, None, None]:
+    """
+    Streams the main document part and yields its top level paragraphs and tables in document order.
+    Each element is dropped from the tree as soon as it has been read.
+    """
+    body: Optional[etree._Element] = None
+    for _, element in etree.iterparse(
+        document_part, events=("end",), tag=(_P, _TBL), remove_blank_text=True, resolve_entities=False
+    ):
+        parent = element.getparent()
+        if parent is None or parent.tag != _BODY:
+            continue  # paragraphs inside tables (or other elements) are read together with their top level element
+        body = parent
+        # all siblings before the current element have been read already (or are neither paragraph nor table)
+        while body[0] is not element:
+            if body[0].tag not in (_P, _TBL):
+                release_information.feed(body[0])
+            del body[0]
+        release_information.feed(element)
+        if element.tag == _P:
+            item: IndexedParagraph | RawEbdTable = IndexedParagraph(
+                get_paragraph_text(element), heading_levels.get_paragraph_level(element)
+            )
+        else:
+            item = RawEbdTable.from_element(element)
+        element.clear()
+        yield item
+    if body is not None:
+        for remaining_element in body:
+            if remaining_element.tag not in (_P, _TBL):
+                release_information.feed(remaining_element)
+
+
+def read_streamed_document_index(docx_file_path: DocxSource) -> StreamedDocumentIndex:
+    """
+    Reads the given .docx file (or in-memory content or file object) with the lxml engine and returns the index of the
+    document.
+    """
+    with (
+        measure_stage("read_document"),
+        open_docx_source(docx_file_path) as docx_source,
+        zipfile.ZipFile(docx_source) as archive,
+    ):
+        heading_levels = _read_heading_levels(archive)
+        release_information = _ReleaseInformationCollector(heading_levels)
+        with archive.open(_DOCUMENT_PART_NAME) as document_part:
+            items = list(_iter_body_items(document_part, heading_levels, release_information))
+    _logger.info("Successfully read the file '%s' (lxml engine)", describe_docx_source(docx_file_path))
+    return StreamedDocumentIndex(items, release_information.get_release_information())
+
+
+def peek_release_information(docx_file_path: DocxSource) -> Optional[EbdDocumentReleaseInformation]:
+    """
+    Reads the release information from the title page of the given .docx file (or its content or a file object).
+    Only the beginning of the main document part is decompressed and parsed; streaming stops at the end of the title
+    page (or as soon as both the 'Stand:' paragraph and the version table have been read). The styles part is read as
+    well, because the first heading ends the title page.
+    """
+    with (
+        measure_stage("read_release_information"),
+        open_docx_source(docx_file_path) as docx_source,
+        zipfile.ZipFile(docx_source) as archive,
+    ):
+        collector = _ReleaseInformationCollector(_read_heading_levels(archive))
+        with archive.open(_DOCUMENT_PART_NAME) as document_part:
+            for _, element in etree.iterparse(
+                document_part, events=("end",), remove_blank_text=True, resolve_entities=False
+            ):
+                parent = element.getparent()
+                if parent is None or parent.tag != _BODY:
+                    continue
+                collector.feed(element)
+                if collector.is_complete:
+                    break
+                element.clear()  # the elements of the title page are small, but there is no need to keep them
+    return collector.get_release_information()
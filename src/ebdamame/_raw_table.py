@@ -0,0 +1,311 @@
+"""
+A light-weight, text-only representation of docx tables.
+
+This module is internal - do not import directly from external code.
+"""
+
+from typing import NamedTuple, Optional
+
+from docx.oxml.ns import nsmap, qn
+from docx.table import Table
+from lxml import etree  # type: ignore[import-untyped]
+
+_P = qn("w:p")
+_R = qn("w:r")
+_HYPERLINK = qn("w:hyperlink")
+_T = qn("w:t")
+_TAB = qn("w:tab")
+_PTAB = qn("w:ptab")
+_BR = qn("w:br")
+_CR = qn("w:cr")
+_NO_BREAK_HYPHEN = qn("w:noBreakHyphen")
+_BR_TYPE = qn("w:type")
+_TR = qn("w:tr")
+_TR_PR = qn("w:trPr")
+_GRID_BEFORE = qn("w:gridBefore")
+_TC = qn("w:tc")
+_TC_PR = qn("w:tcPr")
+_GRID_SPAN = qn("w:gridSpan")
+_V_MERGE = qn("w:vMerge")
+_VAL = qn("w:val")
+
+
+def _get_run_text(run_element: etree._Element) -> str:
+    """
+    returns the text of a w:r element; same as python-docx `Run.text`
+    """
+    texts: list[str] = []
+    for child in run_element:
+        tag = child.tag
+        if tag == _T:
+            texts.append(child.text or "")
+        elif tag in (_TAB, _PTAB):
+            texts.append("\t")
+        elif tag == _CR:
+            texts.append("\n")
+        elif tag == _BR:
+            # only line breaks are translated to text, page and column breaks are not
+            if child.get(_BR_TYPE, "textWrapping") == "textWrapping":
+                texts.append("\n")
+        elif tag == _NO_BREAK_HYPHEN:
+            texts.append("-")
+    return "".join(texts)
+
+
+def get_paragraph_text(paragraph_element: etree._Element) -> str:
+    """
+    Returns the text of a w:p element without creating python-docx objects.
+    The result is the same as python-docx `Paragraph.text`: only runs and hyperlinks that are direct children of the
+    paragraph are considered.
+    """
+    texts: list[str] = []
+    for child in paragraph_element:
+        if child.tag == _R:
+            texts.append(_get_run_text(child))
+        elif child.tag == _HYPERLINK:
+            texts.extend(_get_run_text(run) for run in child if run.tag == _R)
+    return "".join(texts)
+
+
+def get_cell_text(cell_element: etree._Element) -> str:
+    """
+    Returns the text of a w:tc element; same as python-docx `_Cell.text`.
+    """
+    return "\n".join(get_paragraph_text(child) for child in cell_element if child.tag == _P)
+
+
+_CANONICAL_TABLE_XSLT = etree.XSLT(
+    etree.XML(
+        f"""<xsl:stylesheet version="1.0" xmlns:xsl="http://www.w3.org/1999/XSL/Transform" xmlns:w="{nsmap["w"]}"
+    exclude-result-prefixes="w">
+    <xsl:template match="/w:tbl"><t><xsl:apply-templates select="w:tr"/></t></xsl:template>
+    <xsl:template match="w:tr">
+        <r b="{{number(concat('0', w:trPr/w:gridBefore/@w:val))}}"><xsl:apply-templates select="w:tc"/></r>
+    </xsl:template>
+    <xsl:template match="w:tc">
+        <c>
+            <xsl:attribute name="s">
+                <xsl:choose>
+                    <xsl:when test="w:tcPr/w:gridSpan">
+                        <xsl:value-of select="number(w:tcPr/w:gridSpan/@w:val)"/>
+                    </xsl:when>
+                    <xsl:otherwise>1</xsl:otherwise>
+                </xsl:choose>
+            </xsl:attribute>
+            <xsl:if test="w:tcPr/w:vMerge">
+                <xsl:attribute name="m">
+                    <xsl:value-of select="w:tcPr/w:vMerge/@w:val"/>
+                    <xsl:if test="not(w:tcPr/w:vMerge/@w:val)">continue</xsl:if>
+                </xsl:attribute>
+            </xsl:if>
+            <xsl:for-each select="w:p">
+                <xsl:if test="position() &gt; 1"><xsl:text>&#10;</xsl:text></xsl:if>
+                <xsl:apply-templates select="w:r|w:hyperlink/w:r" mode="run"/>
+            </xsl:for-each>
+        </c>
+    </xsl:template>
+    <xsl:template match="w:r" mode="run"><xsl:apply-templates select="*" mode="run-content"/></xsl:template>
+    <xsl:template match="w:t" mode="run-content"><xsl:value-of select="."/></xsl:template>
+    <xsl:template match="w:tab|w:ptab" mode="run-content"><xsl:text>&#9;</xsl:text></xsl:template>
+    <xsl:template match="w:cr" mode="run-content"><xsl:text>&#10;</xsl:text></xsl:template>
+    <xsl:template match="w:br[not(@w:type) or @w:type='textWrapping']" mode="run-content">
+        <xsl:text>&#10;</xsl:text>
+    </xsl:template>
+    <xsl:template match="w:noBreakHyphen" mode="run-content"><xsl:text>-</xsl:text></xsl:template>
+    <xsl:template match="*" mode="run-content"/>
+</xsl:stylesheet>""",
+        etree.XMLParser(remove_blank_text=True),
+    )
+)
+"""
+Transforms a w:tbl element into its canonical XML: <t><r b="grid before"><c s="grid span" m="vertical merge">text</c>
+...</r>...</t>. The texts are the same as in RawEbdTable, i.e. the same as python-docx `_Cell.text`.
+"""
+
+
+def get_canonical_table_xml(table_element: etree._Element) -> bytes:
+    """
+    Returns the canonical XML of a w:tbl element: only the texts and the layout of the cells (everything that a
+    RawEbdTable holds) are kept. Tables that differ only in formatting, run boundaries, proofing marks or revision ids
+    (e.g. w:rsidR) have the same canonical XML. The XML is produced by an XSLT, without reading the table in Python.
+    """
+    return etree.tostring(_CANONICAL_TABLE_XSLT(table_element), encoding="utf-8")  # type: ignore[no-any-return]
+
+
+class RawEbdTableCell(NamedTuple):
+    """
+    the text and the merge information of a single w:tc element
+    """
+
+    text: str
+    grid_span: int = 1
+    """
+    the number of layout grid columns the cell spans (w:gridSpan)
+    """
+    vertical_merge: Optional[str] = None
+    """
+    "restart" or "continue" if the cell is (part of) a vertically merged cell (w:vMerge), None otherwise
+    """
+
+
+class RawEbdTableRow(NamedTuple):
+    """
+    the cells of a single w:tr element
+    """
+
+    cells: tuple[RawEbdTableCell, ...]
+    """
+    the cells in the order of the w:tc elements (this is what _sort_columns_in_row used to return)
+    """
+    grid_before: int = 0
+    """
+    the number of unpopulated layout grid columns before the first cell (w:gridBefore)
+    """
+
+    def get_cell_index_at_grid_offset(self, grid_offset: int) -> int:
+        """
+        returns the index of the cell that starts exactly at the given layout grid column
+        """
+        remaining_offset = grid_offset - self.grid_before
+        for cell_index, cell in enumerate(self.cells):
+            if remaining_offset < 0:
+                break
+            if remaining_offset == 0:
+                return cell_index
+            remaining_offset -= cell.grid_span
+        raise ValueError(f"no `tc` element at grid_offset={grid_offset}")
+
+
+def _read_cell(cell_element: etree._Element) -> RawEbdTableCell:
+    """
+    reads the text and the merge information of a w:tc element
+    """
+    grid_span = 1
+    vertical_merge: Optional[str] = None
+    cell_properties = cell_element.find(_TC_PR)
+    if cell_properties is not None:
+        grid_span_element = cell_properties.find(_GRID_SPAN)
+        if grid_span_element is not None:
+            grid_span = int(grid_span_element.get(_VAL))
+        vertical_merge_element = cell_properties.find(_V_MERGE)
+        if vertical_merge_element is not None:
+            vertical_merge = vertical_merge_element.get(_VAL, "continue")
+    return RawEbdTableCell(get_cell_text(cell_element), grid_span, vertical_merge)
+
+
+class RawEbdTable:
+    """
+    The texts and the layout of a docx table, detached from the XML and the python-docx object model.
+    It holds only what the `DocxTableConverter` reads (the cell texts, the rows and the merged cells), so it neither
+    keeps the document alive nor references lxml elements: it can be pickled (e.g. sent to worker processes or
+    cached) and the document can be dropped as soon as its tables have been read.
+    The text of each cell is joined exactly once (when the table is read); the text matrices derived from it are
+    immutable and computed at most once, so they can be shared by the table classifiers and the converter.
+    """
+
+    __slots__ = ("rows", "_text_matrix", "_grid_text_matrix")
+
+    def __init__(self, rows: tuple[RawEbdTableRow, ...]):
+        self.rows = rows
+        self._text_matrix: Optional[tuple[tuple[str, ...], ...]] = None
+        self._grid_text_matrix: list[Optional[tuple[str, ...]]] = [None] * len(rows)
+
+    def __getstate__(self) -> tuple[RawEbdTableRow, ...]:
+        # the text matrices are derived from the rows; they're computed again (if needed) after unpickling
+        return self.rows
+
+    def __setstate__(self, rows: tuple[RawEbdTableRow, ...]) -> None:
+        self.rows = rows
+        self._text_matrix = None
+        self._grid_text_matrix = [None] * len(rows)
+
+    @classmethod
+    def from_docx_table(cls, table: Table) -> "RawEbdTable":
+        """
+        Reads the rows, cells and cell texts from a python-docx table.
+        """
+        return cls.from_element(table._tbl)  # pylint:disable=protected-access
+
+    @classmethod
+    def from_element(cls, table_element: etree._Element) -> "RawEbdTable":
+        """
+        Reads the rows, cells and cell texts from a w:tbl element (either a python-docx CT_Tbl or a plain lxml element).
+        Cells with the same text and layout (e.g. the many empty cells or "ja"/"nein") are stored only once.
+        """
+        known_cells: dict[RawEbdTableCell, RawEbdTableCell] = {}
+        rows: list[RawEbdTableRow] = []
+        for row_element in table_element:
+            if row_element.tag != _TR:
+                continue
+            grid_before = 0
+            row_properties = row_element.find(_TR_PR)
+            if row_properties is not None:
+                grid_before_element = row_properties.find(_GRID_BEFORE)
+                if grid_before_element is not None:
+                    grid_before = int(grid_before_element.get(_VAL))
+            cells: list[RawEbdTableCell] = []
+            for cell_element in row_element:
+                if cell_element.tag == _TC:
+                    cell = _read_cell(cell_element)
+                    cells.append(known_cells.setdefault(cell, cell))
+            rows.append(RawEbdTableRow(tuple(cells), grid_before))
+        return cls(tuple(rows))
+
+    @property
+    def text_matrix(self) -> tuple[tuple[str, ...], ...]:
+        """
+        the texts of the w:tc elements, row by row (merged cells occur only once per row);
+        this is the column order of the _sort_columns_in_row workaround in the converter
+        """
+        if self._text_matrix is None:
+            self._text_matrix = tuple(tuple(cell.text for cell in row.cells) for row in self.rows)
+        return self._text_matrix
+
+    def get_canonical_xml(self) -> bytes:
+        """
+        Returns the canonical XML of the table (see get_canonical_table_xml); it's the same as the canonical XML of the
+        w:tbl element from which the table has been read.
+        """
+        table = etree.Element("t")
+        for row in self.rows:
+            row_element = etree.SubElement(table, "r", b=str(row.grid_before))
+            for cell in row.cells:
+                cell_element = etree.SubElement(row_element, "c", s=str(cell.grid_span))
+                if cell.vertical_merge is not None:
+                    cell_element.set("m", cell.vertical_merge)
+                if cell.text:
+                    cell_element.text = cell.text
+        return etree.tostring(table, encoding="utf-8")  # type: ignore[no-any-return]
+
+    def get_cell_texts(self, row_index: int) -> tuple[str, ...]:
+        """
+        returns the texts of the w:tc elements of the given row (merged cells occur only once)
+        """
+        return self.text_matrix[row_index]
+
+    def _get_grid_texts_of_cell(self, row_index: int, cell_index: int) -> list[str]:
+        row = self.rows[row_index]
+        cell = row.cells[cell_index]
+        if cell.vertical_merge == "continue":
+            # the content is found in the first cell of the vertically merged cells (somewhere above)
+            if row_index == 0:
+                raise ValueError("no tr above topmost tr in w:tbl")
+            grid_offset = row.grid_before + sum(preceding_cell.grid_span for preceding_cell in row.cells[:cell_index])
+            cell_index_above = self.rows[row_index - 1].get_cell_index_at_grid_offset(grid_offset)
+            return self._get_grid_texts_of_cell(row_index - 1, cell_index_above)
+        return [cell.text] * cell.grid_span
+
+    def get_grid_cell_texts(self, row_index: int) -> tuple[str, ...]:
+        """
+        Returns the texts of the layout grid cells of the given row; same as the texts of python-docx `_Row.cells`:
+        Horizontally merged cells occur once per spanned column, vertically merged cells have the text of the first
+        cell of the merge. The result is computed once per row.
+        """
+        grid_texts = self._grid_text_matrix[row_index]
+        if grid_texts is None:
+            texts: list[str] = []
+            for cell_index in range(len(self.rows[row_index].cells)):
+                texts.extend(self._get_grid_texts_of_cell(row_index, cell_index))
+            grid_texts = tuple(texts)
+            self._grid_text_matrix[row_index] = grid_texts
+        return grid_texts
@@ -0,0 +1,262 @@
+"""
+This module contains an asyncio API for the extraction, e.g. for web services that must not block their event loop.
+Reading and converting the documents is CPU-bound; it runs in an executor (threads by default) with a bounded number
+of concurrent jobs. Concurrent requests for the same result share a single job.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import functools
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from pathlib import Path
+from types import TracebackType
+from typing import Any, AsyncGenerator, Callable, Generic, Hashable, Optional, Type, TypeVar
+
+from docx.table import Table
+from rebdhuhn.models.ebd_table import EbdTable
+
+from . import (
+    EbdChapterInformation,
+    EbdNoTableSection,
+    EbdTableCache,
+    ExtractionEngine,
+    get_all_ebd_keys,
+    get_ebd_docx_tables,
+    get_ebd_table,
+    iter_ebd_tables,
+)
+from ._document_cache import get_document_cache_key
+from ._docx_source import DocxSource, normalize_docx_source
+from ._extraction import is_document_cache_enabled, is_document_cached
+
+_T = TypeVar("_T")
+
+DEFAULT_MAX_CONCURRENCY = 4
+"""
+the default number of jobs that run in the executor at the same time
+"""
+
+
+def _get_document_identity(docx_file_path: DocxSource) -> Hashable:
+    """
+    Identifies the document of a request: files by their path, modification time and size (like the document cache),
+    in-memory content and file objects by the object itself (the in-flight request keeps it alive, so its id is not
+    reused meanwhile).
+    """
+    if isinstance(docx_file_path, Path):
+        return get_document_cache_key(docx_file_path)
+    return id(docx_file_path)
+
+
+def _extract_all_ebd_tables(
+    docx_file_path: DocxSource, cache: Optional[EbdTableCache], engine: ExtractionEngine
+) -> list[tuple[str, EbdTable | EbdNoTableSection | Exception]]:
+    return list(iter_ebd_tables(docx_file_path, cache=cache, engine=engine))
+
+
+def _release_slot(loop: asyncio.AbstractEventLoop, semaphore: asyncio.Semaphore, _: "Future[Any]") -> None:
+    with contextlib.suppress(RuntimeError):  # the event loop has been closed while the job was running
+        loop.call_soon_threadsafe(semaphore.release)
+
+
+class _InFlightRequest(Generic[_T]):  # pylint:disable=too-few-public-methods
+    """
+    A job that has been started for a request and the number of requests that are waiting for its result.
+    """
+
+    __slots__ = ("task", "number_of_waiters")
+
+    def __init__(self, task: "asyncio.Future[_T]"):
+        self.task = task
+        self.number_of_waiters = 0
+
+
+class AsyncEbdExtractor:
+    """
+    Extracts EBDs from .docx files without blocking the event loop.
+
+    All calls run in the given `executor` (a `concurrent.futures.Executor`); by default, the extractor creates a pool
+    of `max_concurrency` threads (and shuts it down on `close` or when leaving `async with`). At most `max_concurrency`
+    jobs are submitted to the executor at the same time; further requests wait without occupying the executor.
+    Concurrent requests for the same result (same document and EBD key) share one job. The jobs run in the context of
+    the request that started them (with threads), so its timing recording (see `record_timings`) includes them.
+
+    Cancelling a request that is still waiting for its turn means its job never starts. A job that is already running
+    can't be interrupted: it finishes in the background and its result is discarded (unless other requests are waiting
+    for it).
+
+    Files (paths) are read once per process thanks to the document cache (see `configure_document_cache`). In-memory
+    content and file objects are not cached and are read by each request (as in the synchronous API).
+    With a `ProcessPoolExecutor`, the arguments have to be picklable (paths or bytes, not file objects) and each worker
+    process reads the document on its own; `get_ebd_docx_tables` requires an executor that runs in this process.
+    """
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        engine: ExtractionEngine = "python-docx",
+        cache: Optional[EbdTableCache] = None,
+    ):
+        """
+        The `engine` ("python-docx" or "lxml") and the `cache` are used like in `get_ebd_table` and `iter_ebd_tables`.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1 but was {max_concurrency}")
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="ebdamame")
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._engine: ExtractionEngine = engine
+        self._cache = cache
+        self._in_flight: dict[tuple[Hashable, ...], _InFlightRequest[Any]] = {}
+
+    async def __aenter__(self) -> "AsyncEbdExtractor":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Shuts down the executor if it has been created by the extractor (jobs that haven't started yet are cancelled).
+        An executor that has been passed to the extractor is left alone.
+        """
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run_in_executor(self, function: Callable[[], _T]) -> _T:
+        loop = asyncio.get_running_loop()
+        if isinstance(self._executor, ThreadPoolExecutor):
+            # e.g. the active timing recording of the request (contexts can't be sent to other processes)
+            function = functools.partial(contextvars.copy_context().run, function)
+        await self._semaphore.acquire()
+        try:
+            future = self._executor.submit(function)
+        except BaseException:
+            self._semaphore.release()
+            raise
+        # the slot is released when the job is done (not when the request is cancelled), so that jobs which can't be
+        # interrupted still count against max_concurrency
+        future.add_done_callback(functools.partial(_release_slot, loop, self._semaphore))
+        return await asyncio.wrap_future(future)
+
+    async def _run_deduplicated(self, request_key: tuple[Hashable, ...], function: Callable[[], _T]) -> _T:
+        in_flight: Optional[_InFlightRequest[_T]] = self._in_flight.get(request_key)
+        if in_flight is None:
+            in_flight = _InFlightRequest(asyncio.ensure_future(self._run_in_executor(function)))
+            self._in_flight[request_key] = in_flight
+            in_flight.task.add_done_callback(functools.partial(self._forget, request_key, in_flight))
+        in_flight.number_of_waiters += 1
+        try:
+            return await asyncio.shield(in_flight.task)
+        finally:
+            in_flight.number_of_waiters -= 1
+            if in_flight.number_of_waiters == 0 and not in_flight.task.done():
+                # the last waiting request has been cancelled
+                in_flight.task.cancel()
+
+    def _forget(
+        self, request_key: tuple[Hashable, ...], in_flight: _InFlightRequest[Any], task: "asyncio.Future[Any]"
+    ) -> None:
+        if self._in_flight.get(request_key) is in_flight:
+            del self._in_flight[request_key]
+        if not task.cancelled():
+            task.exception()  # the error has been passed to all waiting requests (if there are any left)
+
+    async def _read_document(self, docx_file_path: DocxSource, engine: ExtractionEngine) -> None:
+        """
+        Reads the file before jobs for single EBDs of it are started, so that concurrent requests for different EBDs
+        of the same file don't read it at the same time (only files are cached and only within this process).
+        """
+        if not isinstance(docx_file_path, Path) or not isinstance(self._executor, ThreadPoolExecutor):
+            return
+        if is_document_cache_enabled(engine) and not is_document_cached(docx_file_path, engine):
+            await self._get_all_ebd_keys(docx_file_path, engine)
+
+    async def _get_all_ebd_keys(
+        self, docx_file_path: DocxSource, engine: ExtractionEngine
+    ) -> dict[str, tuple[str, EbdChapterInformation]]:
+        return await self._run_deduplicated(
+            (_get_document_identity(docx_file_path), "keys", engine),
+            functools.partial(get_all_ebd_keys, docx_file_path, engine=engine),
+        )
+
+    async def get_all_ebd_keys(self, docx_file_path: DocxSource) -> dict[str, tuple[str, EbdChapterInformation]]:
+        """
+        Returns the EBD keys of the given file (or its content or a binary file object, see `get_all_ebd_keys`).
+        """
+        return await self._get_all_ebd_keys(normalize_docx_source(docx_file_path), self._engine)
+
+    async def get_ebd_docx_tables(self, docx_file_path: DocxSource, ebd_key: str) -> list[Table] | EbdNoTableSection:
+        """
+        Returns the tables of the given EBD (see `get_ebd_docx_tables`).
+        The tables belong to the python-docx document that has been read in the executor, so this requires an executor
+        that runs in this process (e.g. threads).
+
+        Raises:
+            TableNotFoundError: If the EBD is not found in the document.
+        """
+        docx_file_path = normalize_docx_source(docx_file_path)
+        await self._read_document(docx_file_path, "python-docx")
+        return await self._run_deduplicated(
+            (_get_document_identity(docx_file_path), "tables", ebd_key),
+            functools.partial(get_ebd_docx_tables, docx_file_path, ebd_key),
+        )
+
+    async def get_ebd_table(self, docx_file_path: DocxSource, ebd_key: str) -> EbdTable | EbdNoTableSection:
+        """
+        Locates and converts a single EBD (see `get_ebd_table`).
+
+        Raises:
+            TableNotFoundError: If the EBD is not found in the document.
+            EbdTableNotConvertibleError, StepNumberNotFoundError: If the EBD table can't be converted.
+        """
+        docx_file_path = normalize_docx_source(docx_file_path)
+        await self._read_document(docx_file_path, self._engine)
+        return await self._run_deduplicated(
+            (_get_document_identity(docx_file_path), "table", self._engine, ebd_key),
+            functools.partial(get_ebd_table, docx_file_path, ebd_key, cache=self._cache, engine=self._engine),
+        )
+
+    async def _get_ebd_table_or_error(
+        self, docx_file_path: DocxSource, ebd_key: str
+    ) -> EbdTable | EbdNoTableSection | Exception:
+        try:
+            return await self.get_ebd_table(docx_file_path, ebd_key)
+        except Exception as error:  # pylint:disable=broad-exception-caught
+            return error
+
+    async def iter_ebd_tables(
+        self, docx_file_path: DocxSource
+    ) -> AsyncGenerator[tuple[str, EbdTable | EbdNoTableSection | Exception], None]:
+        """
+        Converts all EBDs of the given file (or its content or a binary file object) and yields them in document order,
+        like `iter_ebd_tables`: errors of single EBDs are yielded instead of raised.
+
+        The EBDs of a file are converted in up to `max_concurrency` jobs at once, sharing jobs with concurrent
+        `get_ebd_table` requests. In-memory content and file objects are converted in a single job instead (so that
+        they're read only once). Jobs that haven't started yet are cancelled when the generator is closed or cancelled.
+        """
+        docx_file_path = normalize_docx_source(docx_file_path)
+        if not isinstance(docx_file_path, Path):
+            results = await self._run_deduplicated(
+                (_get_document_identity(docx_file_path), "all", self._engine),
+                functools.partial(_extract_all_ebd_tables, docx_file_path, self._cache, self._engine),
+            )
+            for result in results:
+                yield result
+            return
+        ebd_keys = await self.get_all_ebd_keys(docx_file_path)
+        tasks = [asyncio.ensure_future(self._get_ebd_table_or_error(docx_file_path, ebd_key)) for ebd_key in ebd_keys]
+        try:
+            for ebd_key, task in zip(ebd_keys, tasks):
+                yield ebd_key, await task
+        finally:
+            for task in tasks:
+                task.cancel()
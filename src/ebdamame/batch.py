@@ -0,0 +1,367 @@
+"""
+This module contains functions to extract all EBDs from many .docx files at once, e.g. from all historical releases.
+"""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Generator, Iterable, Optional
+
+from pydantic import BaseModel, ConfigDict
+from rebdhuhn.models.ebd_table import EbdDocumentReleaseInformation, EbdTable
+
+from . import (
+    EBD_KEY_PATTERN,
+    DocumentIndex,
+    EbdChapterInformation,
+    EbdNoTableSection,
+    EbdTableCache,
+    ExtractionEngine,
+    TableNotFoundError,
+    iter_ebd_tables,
+)
+from ._extraction import convert_ebd_section, get_document_index, get_release_information, read_document_index
+from ._lxml_engine import StreamedDocumentIndex
+from .cache import get_document_hash
+
+_logger = logging.getLogger(__name__)
+
+_MAX_NUMBER_OF_DOCUMENTS_PER_WORKER = 2
+"""
+the number of indexed documents a worker process keeps in memory (the least recently used is dropped first)
+"""
+
+_worker_documents: dict[Path, tuple[DocumentIndex | StreamedDocumentIndex, Optional[EbdDocumentReleaseInformation]]] = (
+    {}
+)
+"""
+the documents that have been read and indexed inside a worker process (in order of their last usage)
+"""
+
+
+class DocumentExtractionStatistics(BaseModel):
+    """
+    Describes how long the extraction of all EBDs from a single document took.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    docx_file_path: Path
+    number_of_ebds: int
+    """
+    the number of EBD keys found in the document
+    """
+    number_of_errors: int
+    """
+    the number of EBDs that could not be located or converted
+    """
+    processing_time_in_seconds: float
+    """
+    the time spent on reading, indexing and converting the document summed up over all (worker) processes
+    """
+
+    @property
+    def ebds_per_second(self) -> float:
+        """
+        the throughput for this document
+        """
+        if self.processing_time_in_seconds == 0:
+            return 0.0
+        return self.number_of_ebds / self.processing_time_in_seconds
+
+
+def _get_document_in_worker(
+    docx_file_path: Path, engine: ExtractionEngine
+) -> tuple[DocumentIndex | StreamedDocumentIndex, Optional[EbdDocumentReleaseInformation]]:
+    """
+    Returns the index and release information of the given document; each worker reads each document at most once
+    (as long as it's not dropped from the worker cache).
+    """
+    if docx_file_path in _worker_documents:
+        _worker_documents[docx_file_path] = _worker_documents.pop(docx_file_path)  # mark as most recently used
+    else:
+        while len(_worker_documents) >= _MAX_NUMBER_OF_DOCUMENTS_PER_WORKER:
+            del _worker_documents[next(iter(_worker_documents))]
+        document_index = read_document_index(docx_file_path, engine)
+        release_information = get_release_information(document_index)
+        _worker_documents[docx_file_path] = (document_index, release_information)
+    return _worker_documents[docx_file_path]
+
+
+def _find_ebd_keys_in_worker(
+    docx_file_path: Path, engine: ExtractionEngine
+) -> tuple[dict[str, tuple[str, EbdChapterInformation]], float]:
+    """
+    Reads the document inside a worker process and returns all its EBD keys (and the time it took).
+    """
+    start = time.perf_counter()
+    document_index, _ = _get_document_in_worker(docx_file_path, engine)
+    return document_index.get_all_ebd_keys(), time.perf_counter() - start
+
+
+def _convert_ebd_sections_in_worker(
+    docx_file_path: Path, tasks: list[tuple[str, str, EbdChapterInformation]], engine: ExtractionEngine
+) -> tuple[list[EbdTable | EbdNoTableSection | Exception], float]:
+    """
+    Converts the given EBDs of the given document inside a worker process.
+    Returns the results in the order of the tasks and the time it took.
+    """
+    start = time.perf_counter()
+    document_index, release_information = _get_document_in_worker(docx_file_path, engine)
+    results: list[EbdTable | EbdNoTableSection | Exception] = []
+    for ebd_key, title, ebd_kapitel in tasks:
+        try:
+            results.append(convert_ebd_section(document_index, ebd_key, title, ebd_kapitel, release_information))
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            _logger.warning("Could not convert EBD '%s' from '%s': %s", ebd_key, docx_file_path, error)
+            results.append(error)
+    return results, time.perf_counter() - start
+
+
+def _convert_selected_ebd(
+    document_index: DocumentIndex | StreamedDocumentIndex,
+    ebd_key: str,
+    ebd_keys_of_document: dict[str, tuple[str, EbdChapterInformation]],
+    release_information: Optional[EbdDocumentReleaseInformation],
+) -> EbdTable | EbdNoTableSection | Exception:
+    """
+    Converts the given EBD. Errors are returned (not raised) to keep the results of the other EBDs.
+    """
+    try:
+        if ebd_key not in ebd_keys_of_document:
+            raise TableNotFoundError(ebd_key=ebd_key)
+        title, ebd_kapitel = ebd_keys_of_document[ebd_key]
+        return convert_ebd_section(document_index, ebd_key, title, ebd_kapitel, release_information)
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        _logger.warning("Could not convert EBD '%s': %s", ebd_key, error)
+        return error
+
+
+def _extract_selected_ebds(
+    docx_file_path: Path, ebd_keys: list[str], cache: Optional[EbdTableCache], engine: ExtractionEngine
+) -> dict[str, EbdTable | EbdNoTableSection | Exception]:
+    """
+    Converts the given EBDs of the given file in this process and returns the results in the order of the keys.
+    The file is hashed (for the cache) and read at most once; it's not read at all if all EBDs are cached.
+    """
+    results: dict[str, EbdTable | EbdNoTableSection | Exception] = {}
+    document_hash = get_document_hash(docx_file_path) if cache is not None else None
+    if cache is not None and document_hash is not None:
+        for ebd_key in ebd_keys:
+            cached_result = cache.load(document_hash, ebd_key)
+            if cached_result is not None:
+                results[ebd_key] = cached_result
+    uncached_ebd_keys = [ebd_key for ebd_key in ebd_keys if ebd_key not in results]
+    if uncached_ebd_keys:
+        document_index = get_document_index(docx_file_path, engine=engine)
+        ebd_keys_of_document = document_index.get_all_ebd_keys()
+        release_information = get_release_information(document_index)
+        for ebd_key in uncached_ebd_keys:
+            results[ebd_key] = _convert_selected_ebd(document_index, ebd_key, ebd_keys_of_document, release_information)
+            if cache is not None and document_hash is not None:
+                cache.store(document_hash, ebd_key, results[ebd_key])
+    return {ebd_key: results[ebd_key] for ebd_key in ebd_keys}
+
+
+def _create_statistics(
+    docx_file_path: Path, results: dict[str, EbdTable | EbdNoTableSection | Exception], processing_time: float
+) -> DocumentExtractionStatistics:
+    statistics = DocumentExtractionStatistics(
+        docx_file_path=docx_file_path,
+        number_of_ebds=len(results),
+        number_of_errors=sum(1 for result in results.values() if isinstance(result, Exception)),
+        processing_time_in_seconds=processing_time,
+    )
+    _logger.info(
+        "Extracted %i EBDs (%i errors) from '%s' in %.1fs (%.1f EBDs/s)",
+        statistics.number_of_ebds,
+        statistics.number_of_errors,
+        docx_file_path,
+        statistics.processing_time_in_seconds,
+        statistics.ebds_per_second,
+    )
+    return statistics
+
+
+class _PendingDocument:  # pylint:disable=too-few-public-methods
+    """
+    collects the results of a document whose EBDs are converted in (possibly) multiple worker processes
+    """
+
+    def __init__(
+        self,
+        ebd_keys: dict[str, tuple[str, EbdChapterInformation]],
+        result_keys: list[str],
+        results: dict[str, EbdTable | EbdNoTableSection | Exception],
+        number_of_chunks: int,
+        processing_time: float,
+    ):
+        self.ebd_keys = ebd_keys
+        """
+        all EBD keys of the document
+        """
+        self.result_keys = result_keys
+        """
+        the keys of the EBDs that are extracted, in the order of the results (all keys or the selected ones)
+        """
+        self.results = results
+        self.number_of_open_chunks = number_of_chunks
+        self.processing_time = processing_time
+
+    def get_results_in_order(self) -> dict[str, EbdTable | EbdNoTableSection | Exception]:
+        """
+        returns the results in the order of the result keys (the chunks might have been finished in any order)
+        """
+        return {ebd_key: self.results[ebd_key] for ebd_key in self.result_keys}
+
+
+def _load_cached_results(
+    cache: EbdTableCache, document_hash: str, ebd_keys: Optional[list[str]]
+) -> tuple[dict[str, EbdTable | EbdNoTableSection | Exception], bool]:
+    """
+    returns the cached results of the given EBDs (all EBDs of the document if no keys are given) and whether all of
+    them are cached
+    """
+    if ebd_keys is None:
+        cached_document = cache.load_document(document_hash)
+        if cached_document is None:
+            return {}, False
+        return {ebd_key: cached_result for ebd_key, (_, _, cached_result) in cached_document.items()}, True
+    results: dict[str, EbdTable | EbdNoTableSection | Exception] = {}
+    for ebd_key in ebd_keys:
+        cached_result = cache.load(document_hash, ebd_key)
+        if cached_result is not None:
+            results[ebd_key] = cached_result
+    return results, len(results) == len(ebd_keys)
+
+
+# pylint:disable=too-many-locals, too-many-branches
+def _extract_documents_in_parallel(
+    docx_file_paths: list[Path],
+    max_workers: int,
+    cache: Optional[EbdTableCache],
+    engine: ExtractionEngine,
+    selected_ebd_keys: Optional[list[str]],
+) -> Generator[
+    tuple[Path, dict[str, EbdTable | EbdNoTableSection | Exception], DocumentExtractionStatistics], None, None
+]:
+    """
+    Schedules the documents and their EBD sections across a process pool.
+    First, every document is indexed by a worker. As soon as the keys of a document are known, its EBDs are split into
+    chunks which are queued for all workers. Idle workers always pick the next chunk from the shared queue, so a single
+    huge document is processed by all workers instead of keeping only one of them busy.
+    Documents that are completely cached are not scheduled at all.
+    If `selected_ebd_keys` are given, only these EBDs are converted (and only those that are not cached).
+    """
+    document_hashes: dict[Path, str] = {}
+    cached_results: dict[Path, dict[str, EbdTable | EbdNoTableSection | Exception]] = {}
+    if cache is not None:
+        uncached_docx_file_paths: list[Path] = []
+        for docx_file_path in docx_file_paths:
+            start = time.perf_counter()
+            document_hashes[docx_file_path] = get_document_hash(docx_file_path)
+            results, is_complete = _load_cached_results(cache, document_hashes[docx_file_path], selected_ebd_keys)
+            if not is_complete:
+                uncached_docx_file_paths.append(docx_file_path)
+                cached_results[docx_file_path] = results
+                continue
+            yield docx_file_path, results, _create_statistics(docx_file_path, results, time.perf_counter() - start)
+        docx_file_paths = uncached_docx_file_paths
+        if not docx_file_paths:
+            return
+    chunks_per_document = max(1, -(-2 * max_workers // len(docx_file_paths)))  # ceiling division
+    pending_documents: dict[Path, _PendingDocument] = {}
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures: dict[Future[Any], tuple[Path, list[str]]] = {
+            executor.submit(_find_ebd_keys_in_worker, docx_file_path, engine): (docx_file_path, [])
+            for docx_file_path in docx_file_paths
+        }
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                docx_file_path, chunk_keys = futures.pop(future)
+                if docx_file_path not in pending_documents:
+                    ebd_keys, processing_time = future.result()
+                    result_keys = list(ebd_keys) if selected_ebd_keys is None else selected_ebd_keys
+                    results = cached_results.pop(docx_file_path, {})
+                    for ebd_key in result_keys:
+                        if ebd_key not in ebd_keys and ebd_key not in results:
+                            results[ebd_key] = TableNotFoundError(ebd_key=ebd_key)
+                    tasks = [(ebd_key, *ebd_keys[ebd_key]) for ebd_key in result_keys if ebd_key not in results]
+                    chunk_size = max(1, -(-len(tasks) // chunks_per_document))
+                    chunks = [tasks[start : start + chunk_size] for start in range(0, len(tasks), chunk_size)]
+                    pending_documents[docx_file_path] = _PendingDocument(
+                        ebd_keys, result_keys, results, len(chunks), processing_time
+                    )
+                    for chunk in chunks:
+                        chunk_future = executor.submit(_convert_ebd_sections_in_worker, docx_file_path, chunk, engine)
+                        futures[chunk_future] = (docx_file_path, [ebd_key for ebd_key, _, _ in chunk])
+                else:
+                    chunk_results, processing_time = future.result()
+                    pending_document = pending_documents[docx_file_path]
+                    pending_document.results.update(zip(chunk_keys, chunk_results))
+                    pending_document.processing_time += processing_time
+                    pending_document.number_of_open_chunks -= 1
+                pending_document = pending_documents[docx_file_path]
+                if pending_document.number_of_open_chunks == 0:
+                    del pending_documents[docx_file_path]
+                    results = pending_document.get_results_in_order()
+                    if cache is not None:
+                        for ebd_key, result in results.items():
+                            cache.store(document_hashes[docx_file_path], ebd_key, result)
+                        if selected_ebd_keys is None:  # only complete documents are found by load_document
+                            cache.store_ebd_keys(document_hashes[docx_file_path], pending_document.ebd_keys)
+                    yield docx_file_path, results, _create_statistics(
+                        docx_file_path, results, pending_document.processing_time
+                    )
+
+
+def extract_documents(
+    docx_file_paths: Iterable[Path],
+    max_workers: Optional[int] = None,
+    cache: Optional[EbdTableCache] = None,
+    engine: ExtractionEngine = "python-docx",
+    ebd_keys: Optional[Iterable[str]] = None,
+) -> Generator[
+    tuple[Path, dict[str, EbdTable | EbdNoTableSection | Exception], DocumentExtractionStatistics], None, None
+]:
+    """
+    Converts all EBDs (or only the given `ebd_keys`) from all the given files.
+
+    Without `max_workers` the files are processed one after another (see `iter_ebd_tables`).
+    With `max_workers`, documents and the EBD sections within the documents are distributed across a pool of
+    `max_workers` processes. The results are the same in both cases.
+    If a `cache` is given, files whose content has been converted before are read from the cache.
+    The `engine` determines how the files are read (see `iter_ebd_tables`).
+    If `ebd_keys` are given, only these EBDs are converted; an EBD that is not found in a file yields a
+    `TableNotFoundError`. Each file is still read (and hashed for the cache) only once.
+
+    Yields:
+        For each file, as soon as all its EBDs have been processed: the path of the file, a dictionary with the
+        results (same as in `iter_ebd_tables`, in document order or in the order of the given `ebd_keys`) and
+        statistics about the processing time.
+        In parallel mode the files are yielded in the order in which they are finished.
+
+    Raises:
+        ValueError: If one of the given `ebd_keys` is not an EBD key (e.g. "E_0003").
+    """
+    selected_ebd_keys = list(dict.fromkeys(ebd_keys)) if ebd_keys is not None else None
+    for ebd_key in selected_ebd_keys or []:
+        if EBD_KEY_PATTERN.match(ebd_key) is None:
+            raise ValueError(f"The ebd_key '{ebd_key}' does not match {EBD_KEY_PATTERN.pattern}")
+    docx_file_paths = list(dict.fromkeys(docx_file_paths))  # removes duplicates
+    if not docx_file_paths:
+        return
+    if max_workers is not None:
+        yield from _extract_documents_in_parallel(
+            docx_file_paths, max_workers=max_workers, cache=cache, engine=engine, selected_ebd_keys=selected_ebd_keys
+        )
+        return
+    for docx_file_path in docx_file_paths:
+        start = time.perf_counter()
+        if selected_ebd_keys is None:
+            results = dict(iter_ebd_tables(docx_file_path, cache=cache, engine=engine))
+        else:
+            results = _extract_selected_ebds(docx_file_path, selected_ebd_keys, cache=cache, engine=engine)
+        yield docx_file_path, results, _create_statistics(docx_file_path, results, time.perf_counter() - start)
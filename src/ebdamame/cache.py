@@ -0,0 +1,191 @@
+"""
+This module contains a persistent on-disk cache for converted EBDs.
+Re-running the extraction on unchanged .docx files then costs a file read per EBD instead of parsing the document.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import zlib
+from contextlib import nullcontext
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Optional
+
+from rebdhuhn.models.ebd_table import EbdTable
+
+from ._docx_source import BUFFER_TYPES, DocxSource, open_docx_source
+from .exceptions import EbdTableNotConvertibleError, StepNumberNotFoundError, TableNotFoundError
+from .models import EbdChapterInformation, EbdNoTableSection
+
+_logger = logging.getLogger(__name__)
+
+_KEYS_ENTRY_NAME = "__ebd_keys__"
+"""
+name of the cache entry that contains all EBD keys of a document (as returned by get_all_ebd_keys)
+"""
+
+
+def _get_package_version(package_name: str) -> str:
+    try:
+        return version(package_name)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def get_document_hash(docx_file_path: DocxSource) -> str:
+    """
+    Returns the SHA-256 hex digest of the content of the given file (or in-memory content or file object).
+    """
+    if isinstance(docx_file_path, BUFFER_TYPES):
+        return hashlib.sha256(docx_file_path).hexdigest()  # hashed in place, without a copy
+    sha256 = hashlib.sha256()
+    with open_docx_source(docx_file_path) as docx_source:
+        with open(docx_source, "rb") if isinstance(docx_source, str) else nullcontext(docx_source) as docx_file:
+            docx_file.seek(0)  # file objects: the content of the whole file (the position is restored afterwards)
+            for chunk in iter(lambda: docx_file.read(1024 * 1024), b""):
+                sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def _serialize_result(result: EbdTable | EbdNoTableSection | Exception) -> Optional[dict[str, Any]]:
+    """
+    returns a json serializable representation of the result or None if the result can't be cached
+    """
+    if isinstance(result, EbdTable):
+        return {"type": "EbdTable", "data": result.model_dump(mode="json")}
+    if isinstance(result, EbdNoTableSection):
+        return {"type": "EbdNoTableSection", "data": result.model_dump(mode="json")}
+    if isinstance(result, EbdTableNotConvertibleError):
+        return {"type": "EbdTableNotConvertibleError", "data": {"ebd_key": result.ebd_key, "reason": result.reason}}
+    if isinstance(result, (TableNotFoundError, StepNumberNotFoundError)):
+        return {"type": type(result).__name__, "data": {"ebd_key": result.ebd_key}}
+    return None  # other errors are not cached, because they might be caused by the environment
+
+
+def _deserialize_result(entry: dict[str, Any]) -> EbdTable | EbdNoTableSection | Exception:
+    match entry["type"]:
+        case "EbdTable":
+            return EbdTable.model_validate(entry["data"])
+        case "EbdNoTableSection":
+            return EbdNoTableSection.model_validate(entry["data"])
+        case "EbdTableNotConvertibleError":
+            return EbdTableNotConvertibleError(**entry["data"])
+        case "TableNotFoundError":
+            return TableNotFoundError(**entry["data"])
+        case "StepNumberNotFoundError":
+            return StepNumberNotFoundError(**entry["data"])
+    raise ValueError(f"Unknown cache entry type '{entry['type']}'")
+
+
+class EbdTableCache:
+    """
+    A content-addressed on-disk cache for the results of the EBD extraction.
+
+    The entries are keyed by the SHA-256 of the .docx file content, the EBD key and the versions of ebdamame and
+    rebdhuhn; so neither renamed files nor package updates lead to stale results.
+    The entries are stored as zlib compressed JSON files below `cache_dir`.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self._cache_dir = cache_dir
+        self._versions = f"ebdamame={_get_package_version('ebdamame')};rebdhuhn={_get_package_version('rebdhuhn')}"
+
+    @property
+    def cache_dir(self) -> Path:
+        """
+        the directory in which the cache entries are stored
+        """
+        return self._cache_dir
+
+    def _get_entry_path(self, document_hash: str, entry_name: str) -> Path:
+        entry_hash = hashlib.sha256(f"{document_hash};{entry_name};{self._versions}".encode("utf-8")).hexdigest()
+        return self._cache_dir / entry_hash[:2] / f"{entry_hash}.json.zlib"
+
+    def _read_entry(self, document_hash: str, entry_name: str) -> Optional[Any]:
+        entry_path = self._get_entry_path(document_hash, entry_name)
+        try:
+            with open(entry_path, "rb") as entry_file:
+                return json.loads(zlib.decompress(entry_file.read()))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, zlib.error) as error:
+            _logger.warning("Ignoring unreadable cache entry '%s': %s", entry_path, error)
+            return None
+
+    def _write_entry(self, document_hash: str, entry_name: str, content: Any) -> None:
+        entry_path = self._get_entry_path(document_hash, entry_name)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        compressed = zlib.compress(json.dumps(content, ensure_ascii=False).encode("utf-8"))
+        # write to a temporary file first, so that concurrent readers never see half written entries
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as temporary_file:
+                temporary_file.write(compressed)
+            os.replace(temporary_path, entry_path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    def load_ebd_keys(self, document_hash: str) -> Optional[dict[str, tuple[str, EbdChapterInformation]]]:
+        """
+        Returns the cached EBD keys of the document with the given hash (or None if they are not cached).
+        """
+        content = self._read_entry(document_hash, _KEYS_ENTRY_NAME)
+        if content is None:
+            return None
+        return {
+            ebd_key: (title, EbdChapterInformation.model_validate(ebd_kapitel))
+            for ebd_key, (title, ebd_kapitel) in content.items()
+        }
+
+    def store_ebd_keys(self, document_hash: str, ebd_keys: dict[str, tuple[str, EbdChapterInformation]]) -> None:
+        """
+        Stores the EBD keys (as returned by get_all_ebd_keys) of the document with the given hash.
+        """
+        content = {
+            ebd_key: [title, ebd_kapitel.model_dump(mode="json")] for ebd_key, (title, ebd_kapitel) in ebd_keys.items()
+        }
+        self._write_entry(document_hash, _KEYS_ENTRY_NAME, content)
+
+    def load(self, document_hash: str, ebd_key: str) -> Optional[EbdTable | EbdNoTableSection | Exception]:
+        """
+        Returns the cached result for the given EBD of the document with the given hash (or None on a cache miss).
+        """
+        content = self._read_entry(document_hash, ebd_key)
+        if content is None:
+            return None
+        try:
+            return _deserialize_result(content)
+        except ValueError as error:  # pydantic.ValidationError is a ValueError, too
+            _logger.warning("Ignoring invalid cache entry for '%s': %s", ebd_key, error)
+            return None
+
+    def store(self, document_hash: str, ebd_key: str, result: EbdTable | EbdNoTableSection | Exception) -> None:
+        """
+        Stores the result for the given EBD of the document with the given hash.
+        Exceptions other than the errors defined in ebdamame.exceptions are not stored.
+        """
+        content = _serialize_result(result)
+        if content is not None:
+            self._write_entry(document_hash, ebd_key, content)
+
+    def load_document(
+        self, document_hash: str
+    ) -> Optional[dict[str, tuple[str, EbdChapterInformation, EbdTable | EbdNoTableSection | Exception]]]:
+        """
+        Returns the EBD keys, titles, chapter information and results of all EBDs of the document with the given hash.
+        Returns None unless all of them are cached.
+        """
+        ebd_keys = self.load_ebd_keys(document_hash)
+        if ebd_keys is None:
+            return None
+        result: dict[str, tuple[str, EbdChapterInformation, EbdTable | EbdNoTableSection | Exception]] = {}
+        for ebd_key, (title, ebd_kapitel) in ebd_keys.items():
+            cached = self.load(document_hash, ebd_key)
+            if cached is None:
+                return None
+            result[ebd_key] = (title, ebd_kapitel, cached)
+        return result
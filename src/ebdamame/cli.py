@@ -0,0 +1,180 @@
+"""
+The command line interface of ebdamame: `ebdamame extract` converts the EBDs of one or more .docx files into JSON.
+It uses the public API of the package (see `ebdamame.batch.extract_documents`).
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import IO, Generator, Optional
+
+import click
+from rebdhuhn.models.ebd_table import EbdTable
+
+from . import EBD_KEY_PATTERN, EbdNoTableSection, EbdTableCache, ExtractionEngine, record_timings
+from .batch import extract_documents
+from .export import JsonLinesWriter
+
+_EBD_KEY_SEPARATOR = ","
+
+
+def _parse_ebd_keys(
+    _context: click.Context, _parameter: click.Parameter, values: tuple[str, ...]
+) -> Optional[list[str]]:
+    """
+    splits the values of the (repeatable) --keys option at commas; returns None if the option is not given
+    """
+    ebd_keys = [ebd_key.strip() for value in values for ebd_key in value.split(_EBD_KEY_SEPARATOR) if ebd_key.strip()]
+    for ebd_key in ebd_keys:
+        if EBD_KEY_PATTERN.match(ebd_key) is None:
+            raise click.BadParameter(f"'{ebd_key}' is not an EBD key (e.g. 'E_0003')")
+    return list(dict.fromkeys(ebd_keys)) or None
+
+
+def _extract_ebds(
+    docx_file_paths: list[Path],
+    jobs: int,
+    ebd_keys: Optional[list[str]],
+    cache: Optional[EbdTableCache],
+    engine: ExtractionEngine,
+) -> Generator[tuple[Path, dict[str, EbdTable | EbdNoTableSection | Exception], float], None, None]:
+    for docx_file_path, results, statistics in extract_documents(
+        docx_file_paths, max_workers=jobs if jobs > 1 else None, cache=cache, engine=engine, ebd_keys=ebd_keys
+    ):
+        yield docx_file_path, results, statistics.processing_time_in_seconds
+
+
+def _check_output_directories(docx_file_paths: tuple[Path, ...]) -> None:
+    """
+    raises a UsageError if different files would be written to the same subdirectory of --output-dir (i.e. files with
+    the same name in different directories)
+    """
+    files_by_output_directory: dict[str, set[Path]] = {}
+    for docx_file_path in docx_file_paths:
+        files_by_output_directory.setdefault(docx_file_path.stem, set()).add(docx_file_path.resolve())
+    conflicting_files = [
+        str(docx_file_path)
+        for files in files_by_output_directory.values()
+        if len(files) > 1
+        for docx_file_path in sorted(files)
+    ]
+    if conflicting_files:
+        raise click.UsageError(
+            "The EBDs of these files would be written to the same subdirectory of --output-dir: "
+            + ", ".join(conflicting_files)
+        )
+
+
+def _write_json_files(
+    output_dir: Path, docx_file_path: Path, results: dict[str, EbdTable | EbdNoTableSection | Exception]
+) -> None:
+    """
+    writes one JSON file per EBD (that has been converted or has no table) to <output_dir>/<name of the docx>/
+    """
+    document_output_dir = output_dir / docx_file_path.stem
+    document_output_dir.mkdir(parents=True, exist_ok=True)
+    for ebd_key, result in results.items():
+        if isinstance(result, Exception):
+            continue
+        with open(document_output_dir / f"{ebd_key}.json", "w", encoding="utf-8") as json_file:
+            json.dump(result.model_dump(mode="json"), json_file, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+@click.group()
+def main() -> None:
+    """
+    ebdamame scrapes the Entscheidungsbaumdiagramme (EBD) from the .docx files of EDI@Energy.
+    """
+
+
+# pylint:disable=too-many-arguments, too-many-positional-arguments, too-many-locals
+@main.command()
+@click.argument("docx_files", nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option(
+    "-o",
+    "--output-dir",
+    type=click.Path(file_okay=False, writable=True, path_type=Path),
+    help="Directory to which one JSON file per EBD is written (into a subdirectory per .docx file).",
+)
+@click.option(
+    "--jsonl",
+    "jsonl_file",
+    type=click.File("w", encoding="utf-8", lazy=False),
+    help="File to which the results are written as JSON Lines, one line per EBD ('-' for stdout).",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of worker processes; the EBDs of all files are distributed across them.",
+)
+@click.option(
+    "-k",
+    "--keys",
+    "ebd_keys",
+    multiple=True,
+    callback=_parse_ebd_keys,
+    help="Only extract these EBDs, e.g. '--keys E_0003,E_0015' (can be repeated).",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, writable=True, path_type=Path),
+    help="Directory of the EbdTableCache: unchanged files are read from the cache instead of being converted again.",
+)
+@click.option(
+    "--engine",
+    type=click.Choice(["python-docx", "lxml"]),
+    default="python-docx",
+    show_default=True,
+    help="How the .docx files are read; both engines yield the same results, 'lxml' is faster.",
+)
+def extract(
+    docx_files: tuple[Path, ...],
+    output_dir: Optional[Path],
+    jsonl_file: Optional[IO[str]],
+    jobs: int,
+    ebd_keys: Optional[list[str]],
+    cache_dir: Optional[Path],
+    engine: ExtractionEngine,
+) -> None:
+    """
+    Converts the EBDs of the given .docx files to JSON and prints a timing summary (to stderr).
+    """
+    if (output_dir is None) == (jsonl_file is None):
+        raise click.UsageError("Specify exactly one of --output-dir and --jsonl.")
+    if output_dir is not None:
+        _check_output_directories(docx_files)
+    cache = EbdTableCache(cache_dir) if cache_dir is not None else None
+    start = time.perf_counter()
+    number_of_ebds = number_of_errors = 0
+    jsonl_writer = JsonLinesWriter(jsonl_file) if jsonl_file is not None else None
+    with record_timings() as recorder:
+        for docx_file_path, results, processing_time in _extract_ebds(list(docx_files), jobs, ebd_keys, cache, engine):
+            if output_dir is not None:
+                _write_json_files(output_dir, docx_file_path, results)
+            else:
+                assert jsonl_writer is not None
+                for ebd_key, result in results.items():
+                    jsonl_writer.write(ebd_key, result, docx_file_path.name)
+                jsonl_writer.flush()
+            errors = sum(1 for result in results.values() if isinstance(result, Exception))
+            number_of_ebds += len(results)
+            number_of_errors += errors
+            click.echo(
+                f"{docx_file_path.name}: {len(results)} EBDs ({errors} errors) in {processing_time:.1f}s", err=True
+            )
+    wall_time = time.perf_counter() - start
+    click.echo(
+        f"Extracted {number_of_ebds} EBDs ({number_of_errors} errors) from {len(set(docx_files))} file(s) "
+        f"in {wall_time:.1f}s ({number_of_ebds / wall_time if wall_time > 0 else 0:.1f} EBDs/s)",
+        err=True,
+    )
+    for stage, timings in recorder.get_report().stages.items():
+        # only the stages that ran in this process (i.e. not in the worker processes of --jobs) are measured
+        click.echo(f"  {stage}: {timings.total_seconds:.2f}s ({timings.count}x)", err=True)
+
+
+if __name__ == "__main__":
+    main()  # pylint:disable=no-value-for-parameter
@@ -0,0 +1,368 @@
+"""
+This module contains an index over a single EBD document.
+The index is built in one traversal of the document body and allows to look up EBD keys and their tables without
+walking the entire document again for every single EBD key.
+"""
+
+import hashlib
+import json
+import logging
+from abc import ABC, abstractmethod
+from typing import Generic, Iterable, NamedTuple, Optional, TypeVar
+
+from docx.document import Document as DocumentType
+from docx.oxml.text.paragraph import CT_P
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+
+from ._docx_utils import (
+    EBD_KEY_PATTERN,
+    EBD_KEY_WITH_HEADING_PATTERN,
+    ct_tbl_is_an_ebd_table,
+    ct_tbl_is_first_ebd_table,
+    enrich_paragraph_texts_with_sections,
+    get_heading_levels,
+    get_tables_and_paragraphs,
+    raw_table_is_an_ebd_table,
+    raw_table_is_first_ebd_table,
+)
+from ._raw_table import RawEbdTable, get_canonical_table_xml
+from .exceptions import TableNotFoundError
+from .instrumentation import measure_stage
+from .models import EbdChapterInformation, EbdNoTableSection
+
+_logger = logging.getLogger(__name__)
+
+
+TableT = TypeVar("TableT")
+
+
+class IndexedParagraph(NamedTuple):
+    """
+    the text and the heading level (1 to 3, None if it's no heading; see HeadingLevels) of a paragraph in the document
+    body
+    """
+
+    text: str
+    heading_level: Optional[int]
+
+
+class DeferredParagraph:  # pylint:disable=too-few-public-methods
+    """
+    a paragraph of a python-docx document that is no heading; its text is only read on first access (i.e. when the
+    section that contains the paragraph is located), so that the discovery of the EBD keys only reads the headings
+    """
+
+    __slots__ = ("_paragraph_element", "_text")
+
+    heading_level: Optional[int] = None
+
+    def __init__(self, paragraph_element: CT_P):
+        self._paragraph_element = paragraph_element
+        self._text: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        """
+        the text of the paragraph (the same as `Paragraph.text`)
+        """
+        if self._text is None:
+            self._text = self._paragraph_element.text
+        return self._text
+
+
+class DocumentIndexBase(ABC, Generic[TableT]):  # pylint:disable=too-many-instance-attributes
+    """
+    The engine independent part of the document index: It's built from the paragraphs and tables of the document body
+    (in the order in which they occur in the document). By default, the tables are classified by their `RawEbdTable`
+    (see _get_raw_table), which is also what the converter reads; engines that can classify a table faster override
+    _is_an_ebd_table and _is_first_ebd_table.
+    """
+
+    def __init__(self, items: Iterable[IndexedParagraph | DeferredParagraph | TableT]):
+        """
+        Builds the index for the given paragraphs and tables.
+        """
+        self._paragraphs: dict[int, IndexedParagraph | DeferredParagraph] = {}
+        self._tables: dict[int, TableT] = {}
+        self._heading_indices: list[int] = []
+        for index, item in enumerate(items):
+            if isinstance(item, (IndexedParagraph, DeferredParagraph)):
+                self._paragraphs[index] = item
+                if item.heading_level is not None:
+                    self._heading_indices.append(index)
+            else:
+                self._tables[index] = item
+        self._number_of_items = len(self._paragraphs) + len(self._tables)
+        self._first_index_by_key: dict[str, int] = {}
+        """
+        maps an EBD key to the index of the first heading whose text starts with the key
+        """
+        self._ebd_keys: dict[str, tuple[str, EbdChapterInformation]] = {}
+        self._sections: dict[str, Optional[list[TableT] | EbdNoTableSection]] = {}
+        """
+        memoized results of _locate_section; None means that the section/table was not found
+        """
+        self._is_ebd_table: dict[int, bool] = {}
+        self._fingerprints: dict[str, Optional[str]] = {}
+        with measure_stage("discover_ebd_keys"):
+            self._discover_ebd_keys()
+
+    def _discover_ebd_keys(self) -> None:
+        """
+        finds the EBD keys (and their titles and chapter information) in the headings; the other paragraphs are skipped
+        (neither their texts nor their chapter information are needed)
+        """
+        texts_and_heading_levels = (
+            (self._paragraphs[index].text, self._paragraphs[index].heading_level) for index in self._heading_indices
+        )
+        for index, (text, ebd_kapitel) in zip(
+            self._heading_indices, enrich_paragraph_texts_with_sections(texts_and_heading_levels)
+        ):
+            if EBD_KEY_PATTERN.match(text[:6]) is not None:
+                self._first_index_by_key.setdefault(text[:6], index)
+            match = EBD_KEY_WITH_HEADING_PATTERN.match(text)
+            if match is None:
+                contains_ebd_number = text.lstrip().startswith("E_")
+                if contains_ebd_number:
+                    _logger.warning("Found EBD number but could not match: '%s'", text)
+                continue
+            ebd_key = match.groupdict()["key"]
+            title = match.groupdict()["title"]
+            self._ebd_keys[ebd_key] = (title, ebd_kapitel)
+            _logger.debug("Found EBD %s: '%s' (%s)", ebd_key, title, ebd_kapitel)
+        _logger.info("%i EBD keys have been found", len(self._ebd_keys))
+
+    @abstractmethod
+    def _get_raw_table(self, table: TableT) -> RawEbdTable:
+        """
+        returns the text-only representation of the table (the same instance for repeated calls with the same table)
+        """
+
+    def get_all_ebd_keys(self) -> dict[str, tuple[str, EbdChapterInformation]]:
+        """
+        Returns a dictionary with all EBD keys as keys and the respective EBD titles and chapter information as values.
+        E.g. key: "E_0003", value: ("Bestellung der Aggregationsebene RZ prüfen", EbdChapterInformation(...))
+        """
+        return dict(self._ebd_keys)
+
+    def get_ebd_docx_tables(self, ebd_key: str) -> list[TableT] | EbdNoTableSection:
+        """
+        Returns the tables that relate to the given `ebd_key` (or an `EbdNoTableSection` if the section of the EBD
+        contains no table but a remark).
+
+        Raises:
+            TableNotFoundError: If no tables related to the given `ebd_key` are found in the document.
+        """
+        if EBD_KEY_PATTERN.match(ebd_key) is None:
+            raise ValueError(f"The ebd_key '{ebd_key}' does not match {EBD_KEY_PATTERN.pattern}")
+        if ebd_key not in self._sections:
+            with measure_stage("locate_tables", ebd_key):
+                self._sections[ebd_key] = self._locate_section(ebd_key)
+        section = self._sections[ebd_key]
+        if section is None:
+            raise TableNotFoundError(ebd_key=ebd_key)
+        if isinstance(section, EbdNoTableSection):
+            return section
+        return list(section)
+
+    def get_ebd_raw_tables(self, ebd_key: str) -> list[RawEbdTable] | EbdNoTableSection:
+        """
+        Same as get_ebd_docx_tables but returns the text-only representations of the tables (the same instances for
+        repeated calls), which is what the converter reads.
+        """
+        docx_tables = self.get_ebd_docx_tables(ebd_key)
+        if isinstance(docx_tables, EbdNoTableSection):
+            return docx_tables
+        return [self._get_raw_table(table) for table in docx_tables]
+
+    def get_ebd_fingerprint(self, ebd_key: str) -> Optional[str]:
+        """
+        Returns the fingerprint (a SHA-256 hex digest) of the content of the section of the given EBD: the key, title
+        and chapter information of its heading and either the canonical XML of its tables (see
+        get_canonical_table_xml) or the remark of a section without tables. That is everything but the release
+        information that the result of the EBD depends on: Sections with the same fingerprint are converted to the same
+        EbdTable or EbdNoTableSection (apart from the release information), no matter in which document, release or
+        engine they have been read.
+        Formatting, run boundaries and revision ids (rsid) of the XML don't change the fingerprint.
+        Returns None if the key is not one of the EBD keys of the document (see get_all_ebd_keys).
+        """
+        if ebd_key not in self._fingerprints:
+            self._fingerprints[ebd_key] = self._compute_fingerprint(ebd_key)
+        return self._fingerprints[ebd_key]
+
+    def get_all_ebd_fingerprints(self) -> dict[str, str]:
+        """
+        Returns the fingerprints (see get_ebd_fingerprint) of all EBDs of the document, in document order.
+        They're computed from this index; the document is not read again.
+        """
+        fingerprints: dict[str, str] = {}
+        for ebd_key in self._ebd_keys:
+            fingerprint = self.get_ebd_fingerprint(ebd_key)
+            assert fingerprint is not None  # all keys of the index have a fingerprint
+            fingerprints[ebd_key] = fingerprint
+        return fingerprints
+
+    def _compute_fingerprint(self, ebd_key: str) -> Optional[str]:
+        if ebd_key not in self._ebd_keys:
+            return None
+        title, ebd_kapitel = self._ebd_keys[ebd_key]
+        heading = {"ebd_key": ebd_key, "title": title, "chapter": ebd_kapitel.model_dump(mode="json")}
+        sha256 = hashlib.sha256(json.dumps(heading, ensure_ascii=False, sort_keys=True).encode("utf-8"))
+        try:
+            section = self.get_ebd_docx_tables(ebd_key)
+        except TableNotFoundError:
+            sha256.update(b"<not-found/>")
+            return sha256.hexdigest()
+        if isinstance(section, EbdNoTableSection):
+            sha256.update(json.dumps({"remark": section.remark}, ensure_ascii=False).encode("utf-8"))
+            return sha256.hexdigest()
+        for table in section:
+            sha256.update(self._get_canonical_table_xml(table))
+        return sha256.hexdigest()
+
+    def _get_canonical_table_xml(self, table: TableT) -> bytes:
+        """
+        returns the canonical XML of the table (see get_canonical_table_xml)
+        """
+        return self._get_raw_table(table).get_canonical_xml()
+
+    def _is_an_ebd_table(self, table: TableT) -> bool:
+        """
+        returns true iff the table "looks like" an EBD table (see table_is_an_ebd_table)
+        """
+        return raw_table_is_an_ebd_table(self._get_raw_table(table))
+
+    def _is_first_ebd_table(self, table: TableT) -> bool:
+        """
+        returns true iff the table is the first table of an EBD (see table_is_first_ebd_table)
+        """
+        return raw_table_is_first_ebd_table(self._get_raw_table(table))
+
+    def _table_is_an_ebd_table(self, index: int) -> bool:
+        """
+        memoized classification of the table at the given index
+        """
+        if index not in self._is_ebd_table:
+            self._is_ebd_table[index] = self._is_an_ebd_table(self._tables[index])
+        return self._is_ebd_table[index]
+
+    def _collect_continuation_tables(self, first_table_index: int) -> list[TableT]:
+        """
+        Collects the first EBD table and the tables that follow it.
+        Sometimes the authors create multiple tables split over multiple pages which belong together, sometimes they
+        create 1 proper table that spans multiple pages. The latter case is transparent to the extraction logic.
+        We're done collecting as soon as a paragraph that starts with the next EBD (or something similar) occurs.
+        """
+        tables: list[TableT] = [self._tables[first_table_index]]
+        for index in range(first_table_index + 1, self._number_of_items):
+            if index in self._tables:
+                if self._table_is_an_ebd_table(index):
+                    tables.append(self._tables[index])
+            elif self._paragraphs[index].text.startswith("S_") or self._paragraphs[index].text.startswith("E_"):
+                break
+        return tables
+
+    def _locate_section(self, ebd_key: str) -> Optional[list[TableT] | EbdNoTableSection]:
+        """
+        Searches the tables (or the remark) of the given EBD, starting at the first paragraph that starts with the key.
+        Assumptions:
+        1. before each EbdTable there is a paragraph whose text starts with the respective EBD key
+        2. there are no duplicates
+        Returns None if nothing has been found.
+        """
+        start_index = self._first_index_by_key.get(ebd_key)
+        if start_index is None:
+            return None
+        empty_ebd_text: Optional[str] = None  # paragraph text if there is no ebd table
+        found_table_in_subsection: bool = False
+        for index in range(start_index + 1, self._number_of_items):
+            paragraph = self._paragraphs.get(index)
+            if paragraph is not None:
+                if paragraph.heading_level is not None:
+                    _logger.warning("No EBD table found in subsection for: '%s'", ebd_key)
+                    break
+                if paragraph.text.strip() != "":
+                    if empty_ebd_text is None:
+                        # the first text paragraph after we found the correct section containing the ebd key
+                        empty_ebd_text = paragraph.text.strip()
+                    else:
+                        empty_ebd_text += "\n" + paragraph.text.strip()
+                continue
+            found_table_in_subsection = True
+            if self._table_is_an_ebd_table(index) and self._is_first_ebd_table(self._tables[index]):
+                return self._collect_continuation_tables(index)
+        if empty_ebd_text is None:
+            if found_table_in_subsection:
+                # probably there is an error while scraping the tables
+                return None
+            return EbdNoTableSection(ebd_key=ebd_key, remark="")
+        return EbdNoTableSection(ebd_key=ebd_key, remark=empty_ebd_text.strip())
+
+
+def _get_indexed_items(document: DocumentType) -> Iterable[IndexedParagraph | DeferredParagraph | Table]:
+    """
+    yields the paragraphs (as text and heading level; the texts of the other paragraphs are read on demand) and tables
+    of the document body in document order
+    """
+    # the raw style ids are looked up in a map that is built once; resolving Paragraph.style is much more expensive
+    heading_levels = get_heading_levels(document)
+    for item in get_tables_and_paragraphs(document):
+        if isinstance(item, Paragraph):
+            paragraph_element = item._p  # pylint:disable=protected-access
+            heading_level = heading_levels.get_paragraph_level(paragraph_element)
+            if heading_level is None:
+                yield DeferredParagraph(paragraph_element)
+            else:
+                yield IndexedParagraph(paragraph_element.text, heading_level)
+        else:
+            yield item
+
+
+class DocumentIndex(DocumentIndexBase[Table]):
+    """
+    An index over the tables and paragraphs of an EBD document.
+
+    The document body is traversed exactly once when the index is created. All EBD keys (with their titles and
+    chapter information) are collected in this traversal. The tables (or the remark, if there is no table) that belong
+    to an EBD key are located lazily on first access; the search starts at the heading of the respective EBD and only
+    covers its section. Results are memoized, so repeated lookups of the same key are free.
+    """
+
+    def __init__(self, document: DocumentType):
+        """
+        Builds the index for the given document.
+        """
+        self._document = document
+        self._raw_tables: dict[Table, RawEbdTable] = {}
+        """
+        the text-only representations of the tables that have been requested (e.g. for the conversion) so far
+        """
+        super().__init__(_get_indexed_items(document))
+
+    @property
+    def document(self) -> DocumentType:
+        """
+        the document from which this index has been built
+        """
+        return self._document
+
+    def _is_an_ebd_table(self, table: Table) -> bool:
+        # the classifiers on the XML element neither compute the cell grid nor join the texts of every cell
+        return ct_tbl_is_an_ebd_table(table._tbl)  # pylint:disable=protected-access
+
+    def _is_first_ebd_table(self, table: Table) -> bool:
+        return ct_tbl_is_first_ebd_table(table._tbl)  # pylint:disable=protected-access
+
+    def _get_canonical_table_xml(self, table: Table) -> bytes:
+        raw_table = self._raw_tables.get(table)
+        if raw_table is not None:  # e.g. the tables of the previous release that have been converted already
+            return raw_table.get_canonical_xml()
+        return get_canonical_table_xml(table._tbl)  # pylint:disable=protected-access
+
+    def _get_raw_table(self, table: Table) -> RawEbdTable:
+        raw_table = self._raw_tables.get(table)
+        if raw_table is None:
+            raw_table = RawEbdTable.from_docx_table(table)
+            self._raw_tables[table] = raw_table
+        return raw_table
@@ -6,11 +6,10 @@ import logging
 import re
 from enum import Enum
 from itertools import cycle, groupby
-from typing import Generator, Literal, Optional
+from typing import Literal, NamedTuple, Optional, Sequence
 
-from docx.table import Table, _Cell, _Row
+from docx.table import Table
 from more_itertools import first, first_true, last
-from pydantic import BaseModel, ConfigDict
 from rebdhuhn.models.ebd_table import (
     STEP_NUMBER_REGEX,
     EbdCheckResult,
@@ -22,8 +21,10 @@ from rebdhuhn.models.ebd_table import (
     MultiStepInstruction,
 )
 
-from ._docx_utils import get_ebd_document_release_information_from_body
+from ._docx_utils import get_ebd_document_release_information
+from ._raw_table import RawEbdTable, RawEbdTableRow
 from .exceptions import EbdTableNotConvertibleError, StepNumberNotFoundError
+from .instrumentation import measure_stage
 
 _logger = logging.getLogger(__name__)
 
@@ -35,14 +36,14 @@ def _is_pruefende_rolle_cell_text(text: str) -> bool:
     return text.startswith("Prüfende Rolle: ")
 
 
-def _sort_columns_in_row(docx_table_row: _Row) -> Generator[_Cell, None, None]:
+def _sort_columns_in_row(table: RawEbdTable, row_index: int) -> tuple[str, ...]:
     """
     The internal structure of the table rows is not as you'd expect it to be as soon as there are merged columns.
     This problem is described in https://github.com/python-openxml/python-docx/issues/970#issuecomment-877386927 .
-    We apply the workaround described in the GithHub issue.
+    We apply the workaround described in the GithHub issue: The cells are read from the w:tc elements of the row
+    (which is the column order of the text matrix of a RawEbdTable).
     """
-    for table_column in docx_table_row._tr.tc_lst:  # pylint:disable=protected-access
-        yield _Cell(table_column, docx_table_row.table)
+    return table.get_cell_texts(row_index)
 
 
 _subsequent_step_pattern = re.compile(
@@ -53,13 +54,11 @@ _subsequent_step_pattern = re.compile(
 _step_number_pattern = re.compile(STEP_NUMBER_REGEX)
 
 
-def _get_index_of_first_column_with_step_number(cells: list[_Cell], ebd_key: str) -> int:
+def _get_index_of_first_column_with_step_number(cells: Sequence[str], ebd_key: str) -> int:
     """
     returns the index of the first cell in cells, that contains a step number
     """
-    first_step_number_cell = first_true(
-        cells, pred=lambda cell: _step_number_pattern.match(cell.text.strip()) is not None
-    )
+    first_step_number_cell = first_true(cells, pred=lambda cell: _step_number_pattern.match(cell.strip()) is not None)
     if first_step_number_cell is None:
         raise StepNumberNotFoundError(ebd_key=ebd_key)
 
@@ -68,7 +67,7 @@ def _get_index_of_first_column_with_step_number(cells: list[_Cell], ebd_key: str
     return step_number_column_index
 
 
-def _get_use_cases(cells: list[_Cell], ebd_key: str) -> list[str]:
+def _get_use_cases(cells: Sequence[str], ebd_key: str) -> list[str]:
     """
     Extract use cases from the given list of cells.
     May return empty list, never returns None.
@@ -77,20 +76,20 @@ def _get_use_cases(cells: list[_Cell], ebd_key: str) -> list[str]:
     use_cases: list[str]
     if index_of_step_number != 0:
         # "use_cases" are present; This means, that this step must only be applied for certain scenarios,
-        use_cases = [c.text for c in cells[0:index_of_step_number]]
+        use_cases = list(cells[0:index_of_step_number])
     else:
         use_cases = []
     _logger.debug("%i use cases have been found", len(use_cases))
     return use_cases  # we don't return None here because we need something that has a length in the calling code
 
 
-def _read_subsequent_step_cell(cell: _Cell) -> tuple[Optional[bool], Optional[str]]:
+def _read_subsequent_step_cell(cell: str) -> tuple[Optional[bool], Optional[str]]:
     """
     Parses the cell that contains the outcome and the subsequent step (e.g. "ja➡5" where "5" is the subsequent step
     number). As a result we might also have no boolean values as there is no "ja" or "nein" pointing to the
     subsequent step, e.g. " 110" at step "105" for E_0594 in FV2504.
     """
-    cell_text = cell.text.lower().strip()
+    cell_text = cell.lower().strip()
     # we first match against the lower case cell text; then we convert the "ende" to upper case again in the end.
     # this is to avoid confusion with "ja" vs. "Ja"
     match = _subsequent_step_pattern.match(cell_text)
@@ -121,17 +120,16 @@ class _EbdSubRowPosition(Enum):
     LOWER = 2  #: the lower sub row
 
 
-# pylint:disable=too-few-public-methods
-class _EnhancedDocxTableLine(BaseModel):
+class _EnhancedDocxTableLine(NamedTuple):
     """
     A structure that primarily contains a single row from a DOCX table but also meta information about previous and
     following elements in the table. It gathers information that are not directly accessible when only looking at one
     single row.
+    This is a purely internal intermediate that is created for every single row; it's a (slotted) named tuple because
+    a validated model would be (measurably) slower without any benefit here.
     """
 
-    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
-
-    row: _Row
+    row: RawEbdTableRow
     """
     The row that is currently being processed
     """
@@ -139,9 +137,9 @@ class _EnhancedDocxTableLine(BaseModel):
     """
     denotes if row is an upper/lower sub row
     """
-    cells: list[_Cell]
+    cells: tuple[str, ...]
     """
-    the (sanitized) cells of the row
+    the texts of the (sanitized) cells of the row (shared with the text matrix of the table)
     """
     multi_step_instruction_text: Optional[str] = None
     """
@@ -149,13 +147,13 @@ class _EnhancedDocxTableLine(BaseModel):
     """
 
 
-def _get_upper_lower_position(cells: list[_Cell]) -> _EbdSubRowPosition:
+def _get_upper_lower_position(cells: Sequence[str]) -> _EbdSubRowPosition:
     """
     Takes cells of rows of list and returns the _EbdSubRowPosition:
     The first two entries are empty -> _EbdSubRowPosition.LOWER
     else -> _EbdSubRowPosition.UPPER
     """
-    if all(cell.text == "" for cell in cells[0:2]):
+    if all(cell == "" for cell in cells[0:2]):
         return _EbdSubRowPosition.LOWER
     return _EbdSubRowPosition.UPPER
 
@@ -168,7 +166,7 @@ class DocxTableConverter:
 
     def __init__(
         self,
-        docx_tables: list[Table],
+        docx_tables: list[Table] | list[RawEbdTable],
         ebd_key: str,
         chapter: str,
         section: str,
@@ -178,15 +176,24 @@ class DocxTableConverter:
         """
         the constructor initializes the instance and reads some metadata from the (first) table header.
 
+        The tables are either python-docx tables or their detached, text-only representation (`RawEbdTable`, e.g. as
+        returned by `get_ebd_raw_tables` or read by the lxml engine).
+
         If release_information is not provided, it will be automatically extracted from the
-        document's title page via the table's parent document reference.
+        document's title page via the table's parent document reference (python-docx tables only).
         """
-        self._docx_tables = docx_tables
+        self._docx_tables: list[RawEbdTable] = [
+            table if isinstance(table, RawEbdTable) else RawEbdTable.from_docx_table(table) for table in docx_tables
+        ]
         if release_information is None:
-            # Extract release information from the table's parent document
-            # Tables have a reference to their parent document via table.part.element.body
-            body = first(docx_tables).part.element.body
-            self._release_information = get_ebd_document_release_information_from_body(body)
+            first_table = first(docx_tables)
+            if isinstance(first_table, Table):
+                # Extract release information from the table's parent document
+                # Tables have a reference to their parent document via table.part
+                document = first_table.part.package.main_document_part.document
+                self._release_information = get_ebd_document_release_information(document)
+            else:
+                self._release_information = None  # a RawEbdTable has no reference to its document
         else:
             self._release_information = release_information
         self._column_index_step_number: int
@@ -205,7 +212,7 @@ class DocxTableConverter:
             distinct_cell_texts: list[str] = [
                 x[0]
                 for x in groupby(
-                    first(docx_tables).rows[row_index].cells, lambda cell: cell.text
+                    first(self._docx_tables).get_grid_cell_texts(row_index)
                 )  # row_cells() is deprecated and returns false rows
             ]
             for column_index, table_cell_text in enumerate(distinct_cell_texts):
@@ -237,7 +244,7 @@ class DocxTableConverter:
         )
 
     @staticmethod
-    def _enhance_list_view(table: Table, row_offset: int) -> list[_EnhancedDocxTableLine]:
+    def _enhance_list_view(table: RawEbdTable, row_offset: int) -> list[_EnhancedDocxTableLine]:
         """
         Loop over the given table and enhance the table rows with additional information.
         It spares the main loop in _handle_single_table from peeking ahead or looking back.
@@ -245,16 +252,17 @@ class DocxTableConverter:
         result: list[_EnhancedDocxTableLine] = []
         upper_lower_iterator = cycle([_EbdSubRowPosition.UPPER, _EbdSubRowPosition.LOWER])
         multi_step_instruction_text: Optional[str] = None
-        for table_row, sub_row_position in zip(
-            table.rows[row_offset:],
+        for row_index, sub_row_position in zip(
+            range(row_offset, len(table.rows)),
             upper_lower_iterator,
         ):
-            row_cells = list(_sort_columns_in_row(table_row))
+            table_row = table.rows[row_index]
+            row_cells = _sort_columns_in_row(table, row_index)
             if len(row_cells) <= 2:
                 # These are the multi-column rows that span that contain stuff like
                 # "Alle festgestellten Antworten sind anzugeben, soweit im Format möglich (maximal 8 Antwortcodes)*."
                 _ = next(upper_lower_iterator)  # reset the iterator
-                multi_step_instruction_text = row_cells[0].text
+                multi_step_instruction_text = row_cells[0]
                 # we store the text in the local variable for now because we don't yet know the next step number
                 continue
             sub_row_position = _get_upper_lower_position(row_cells)
@@ -273,7 +281,7 @@ class DocxTableConverter:
     # pylint:disable=too-many-arguments, too-many-positional-arguments, too-many-locals
     def _handle_single_table(
         self,
-        table: Table,
+        table: RawEbdTable,
         multi_step_instructions: list[MultiStepInstruction],
         row_offset: int,
         rows: list[EbdTableRow],
@@ -288,7 +296,8 @@ class DocxTableConverter:
         # todo: https://github.com/Hochfrequenz/ebdamame/issues/318 # pylint:disable=fixme
         description: str = ""
         step_number: str = ""
-        for row_index, enhanced_table_row in enumerate(self._enhance_list_view(table=table, row_offset=row_offset)):
+        enhanced_table_rows = self._enhance_list_view(table=table, row_offset=row_offset)
+        for row_index, enhanced_table_row in enumerate(enhanced_table_rows):
             if enhanced_table_row.sub_row_position == _EbdSubRowPosition.UPPER:
                 is_transition_row = len(sub_rows) == 1 and last_row_position == _EbdSubRowPosition.UPPER
                 if is_transition_row:
@@ -304,20 +313,22 @@ class DocxTableConverter:
                 last_row_position = _EbdSubRowPosition.UPPER
                 use_cases = _get_use_cases(enhanced_table_row.cells, ebd_key=self._metadata.ebd_code)
                 sub_rows = []  # clear list every second entry
-                step_number = enhanced_table_row.cells[len(use_cases) + self._column_index_step_number].text.strip()
-                description = enhanced_table_row.cells[len(use_cases) + self._column_index_description].text.strip()
+                step_number = enhanced_table_row.cells[len(use_cases) + self._column_index_step_number].strip()
+                description = enhanced_table_row.cells[len(use_cases) + self._column_index_description].strip()
             boolean_outcome, subsequent_step_number = _read_subsequent_step_cell(
                 enhanced_table_row.cells[len(use_cases) + self._column_index_check_result]
             )
             if step_number.endswith("*"):  # pylint:disable=possibly-used-before-assignment
                 # step number is defined and set at this point, because the enhanced list view always starts with UPPER
-                self._handle_single_table_star_exception(table, multi_step_instructions, row_offset, rows, row_index)
+                # (and the current row is the UPPER row that has set it, so the use cases are those of this row)
+                self._handle_single_table_star_exception(
+                    enhanced_table_rows, multi_step_instructions, rows, row_index, use_cases
+                )
                 break
             sub_row = EbdTableSubRow(
                 check_result=EbdCheckResult(subsequent_step_number=subsequent_step_number, result=boolean_outcome),
-                result_code=enhanced_table_row.cells[len(use_cases) + self._column_index_result_code].text.strip()
-                or None,
-                note=enhanced_table_row.cells[len(use_cases) + self._column_index_note].text.strip() or None,
+                result_code=enhanced_table_row.cells[len(use_cases) + self._column_index_result_code].strip() or None,
+                note=enhanced_table_row.cells[len(use_cases) + self._column_index_note].strip() or None,
             )
             _logger.debug(
                 "Successfully read sub row %s/%s", sub_row.result_code or subsequent_step_number, boolean_outcome
@@ -348,29 +359,28 @@ class DocxTableConverter:
     # pylint:disable=too-many-locals, too-many-positional-arguments
     def _handle_single_table_star_exception(
         self,
-        table: Table,
+        complete_table: list[_EnhancedDocxTableLine],
         multi_step_instructions: list[MultiStepInstruction],
-        row_offset: int,
         rows: list[EbdTableRow],
         row_index: int,
+        use_cases: list[str],
     ) -> None:
         """
         Completes table when handling of single table (out of possible multiple tables for 1 EBD) hit a step
         with several instructions. Those instructions will be split in individual steps.
+        The enhanced rows of the table and the use cases of the row at row_index have already been read by
+        _handle_single_table and are reused here.
         As above, the results are written into rows, sub_rows and multi_step_instructions. Those will be modified.
         """
-        use_cases: list[str] = []
-        complete_table = self._enhance_list_view(table=table, row_offset=row_offset)
         enhanced_table_row = complete_table[row_index]
-        use_cases = _get_use_cases(enhanced_table_row.cells, ebd_key=self._metadata.ebd_code)
         star_case_result_code = (
-            enhanced_table_row.cells[len(use_cases) + self._column_index_result_code].text.strip() or None
+            enhanced_table_row.cells[len(use_cases) + self._column_index_result_code].strip() or None
         )
-        star_case_note = enhanced_table_row.cells[len(use_cases) + self._column_index_note].text.strip() or None
+        star_case_note = enhanced_table_row.cells[len(use_cases) + self._column_index_note].strip() or None
         while row_index < len(complete_table):
             enhanced_table_row = complete_table[row_index]
             step_number = str(int(last(rows).step_number) + 1)
-            description = enhanced_table_row.cells[len(use_cases) + self._column_index_description].text.strip()
+            description = enhanced_table_row.cells[len(use_cases) + self._column_index_description].strip()
             boolean_outcome, subsequent_step_number = _read_subsequent_step_cell(
                 enhanced_table_row.cells[len(use_cases) + self._column_index_check_result]
             )
@@ -422,22 +432,25 @@ class DocxTableConverter:
         Raises:
             EbdTableNotConvertibleError: If the table format is not supported (e.g. uses "--" instead of ja/nein).
         """
-        rows: list[EbdTableRow] = []
-        sub_rows: list[EbdTableSubRow] = []
-        multi_step_instructions: list[MultiStepInstruction] = []
-        try:
-            for table_index, table in enumerate(self._docx_tables):
-                offset: int = 0
-                if table_index == 0:
-                    offset = self._row_index_last_header + 1
-                self._handle_single_table(table, multi_step_instructions, offset, rows, sub_rows)
-        except ValueError as e:
-            if "result is not boolean" in str(e).lower():
-                raise EbdTableNotConvertibleError(
-                    ebd_key=self._metadata.ebd_code,
-                    reason="Table uses non-boolean format (e.g. '--' instead of 'ja/nein')",
-                ) from e
-            raise
-        result = EbdTable(rows=rows, metadata=self._metadata, multi_step_instructions=multi_step_instructions or None)
-        _logger.info("Successfully created an EbdTable for EBD '%s'", result.metadata.ebd_code)
-        return result
+        with measure_stage("convert_tables", self._metadata.ebd_code):
+            rows: list[EbdTableRow] = []
+            sub_rows: list[EbdTableSubRow] = []
+            multi_step_instructions: list[MultiStepInstruction] = []
+            try:
+                for table_index, table in enumerate(self._docx_tables):
+                    offset: int = 0
+                    if table_index == 0:
+                        offset = self._row_index_last_header + 1
+                    self._handle_single_table(table, multi_step_instructions, offset, rows, sub_rows)
+            except ValueError as e:
+                if "result is not boolean" in str(e).lower():
+                    raise EbdTableNotConvertibleError(
+                        ebd_key=self._metadata.ebd_code,
+                        reason="Table uses non-boolean format (e.g. '--' instead of 'ja/nein')",
+                    ) from e
+                raise
+            result = EbdTable(
+                rows=rows, metadata=self._metadata, multi_step_instructions=multi_step_instructions or None
+            )
+            _logger.info("Successfully created an EbdTable for EBD '%s'", result.metadata.ebd_code)
+            return result
@@ -10,6 +10,11 @@ class TableNotFoundError(Exception):
 
     def __init__(self, ebd_key: str):
         self.ebd_key = ebd_key
+        super().__init__(ebd_key)
+
+    def __reduce__(self) -> tuple[type["TableNotFoundError"], tuple[str]]:
+        # required to send the error from worker processes back to the main process
+        return self.__class__, (self.ebd_key,)
 
 
 class EbdTableNotConvertibleError(Exception):
@@ -28,6 +33,9 @@ class EbdTableNotConvertibleError(Exception):
         self.reason = reason
         super().__init__(f"EBD table '{ebd_key}' cannot be converted: {reason}")
 
+    def __reduce__(self) -> tuple[type["EbdTableNotConvertibleError"], tuple[str, str]]:
+        return self.__class__, (self.ebd_key, self.reason)
+
 
 class StepNumberNotFoundError(Exception):
     """
@@ -46,3 +54,6 @@ class StepNumberNotFoundError(Exception):
     def __init__(self, ebd_key: str):
         self.ebd_key = ebd_key
         super().__init__(f"No cell containing a valid step number found in EBD table '{ebd_key}'")
+
+    def __reduce__(self) -> tuple[type["StepNumberNotFoundError"], tuple[str]]:
+        return self.__class__, (self.ebd_key,)
@@ -0,0 +1,120 @@
+"""
+This module contains a streaming exporter that writes the extraction results as JSON Lines (one EBD per line).
+The models are serialized by pydantic-core (`model_dump_json`), without building an intermediate dict per EBD first.
+"""
+
+import json
+from types import TracebackType
+from typing import IO, Iterable, Optional
+
+from rebdhuhn.models.ebd_table import EbdTable
+
+from .models import EbdNoTableSection
+
+DEFAULT_MAX_BUFFER_SIZE = 1024 * 1024
+"""
+the (default) number of characters that are collected in memory before they're written to the sink
+"""
+
+
+def serialize_json_line(
+    ebd_key: str, result: EbdTable | EbdNoTableSection | Exception, docx_file_name: Optional[str] = None
+) -> str:
+    """
+    Returns a single JSON Lines record (including the trailing line break) of the given result:
+    `{"docx_file": ..., "ebd_key": ..., "type": "EbdTable"|"EbdNoTableSection", "data": {...}}` or
+    `{"docx_file": ..., "ebd_key": ..., "type": "error", "error": <exception class name>, "message": ...}`.
+    The "docx_file" is only present if a name is given.
+    The "data" is the same JSON object as in the files of the machine-readable_entscheidungsbaumdiagramme repository
+    (only the order of the keys and the whitespace differ).
+    """
+    record = "{"
+    if docx_file_name is not None:
+        record += f'"docx_file":{json.dumps(docx_file_name, ensure_ascii=False)},'
+    record += f'"ebd_key":{json.dumps(ebd_key, ensure_ascii=False)},'
+    if isinstance(result, Exception):
+        error_name = json.dumps(type(result).__name__)
+        message = json.dumps(str(result), ensure_ascii=False)
+        return record + f'"type":"error","error":{error_name},"message":{message}}}\n'
+    return record + f'"type":"{type(result).__name__}","data":{result.model_dump_json()}}}\n'
+
+
+class JsonLinesWriter:
+    """
+    Writes extraction results to a text stream (e.g. a file opened with encoding="utf-8" or sys.stdout) as JSON Lines.
+
+    The records are collected in memory until they exceed `max_buffer_size` characters and are then written to the
+    sink at once; so neither many small writes nor the whole export end up in memory. Use the writer as a context
+    manager (or call `flush`) to write the remaining records, too. The sink is not closed by the writer.
+    """
+
+    def __init__(self, sink: IO[str], max_buffer_size: int = DEFAULT_MAX_BUFFER_SIZE):
+        if max_buffer_size < 0:
+            raise ValueError(f"max_buffer_size must not be negative but was {max_buffer_size}")
+        self._sink = sink
+        self._max_buffer_size = max_buffer_size
+        self._buffer: list[str] = []
+        self._buffer_size = 0
+        self._number_of_records = 0
+
+    @property
+    def number_of_records(self) -> int:
+        """
+        the number of records that have been written (including those that are still buffered)
+        """
+        return self._number_of_records
+
+    def write(
+        self, ebd_key: str, result: EbdTable | EbdNoTableSection | Exception, docx_file_name: Optional[str] = None
+    ) -> None:
+        """
+        Appends the record of the given result (see `serialize_json_line`).
+        """
+        record = serialize_json_line(ebd_key, result, docx_file_name)
+        self._buffer.append(record)
+        self._buffer_size += len(record)
+        self._number_of_records += 1
+        if self._buffer_size > self._max_buffer_size:
+            self._write_buffer()
+
+    def _write_buffer(self) -> None:
+        if self._buffer:
+            self._sink.write("".join(self._buffer))
+            self._buffer.clear()
+            self._buffer_size = 0
+
+    def flush(self) -> None:
+        """
+        Writes all buffered records to the sink and flushes the sink.
+        """
+        self._write_buffer()
+        self._sink.flush()
+
+    def __enter__(self) -> "JsonLinesWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.flush()
+
+
+def write_json_lines(
+    results: Iterable[tuple[str, EbdTable | EbdNoTableSection | Exception]],
+    sink: IO[str],
+    docx_file_name: Optional[str] = None,
+    max_buffer_size: int = DEFAULT_MAX_BUFFER_SIZE,
+) -> int:
+    """
+    Writes the given results (e.g. those of `iter_ebd_tables`) to the sink as JSON Lines while they're produced.
+
+    Returns:
+        int: The number of records that have been written.
+    """
+    with JsonLinesWriter(sink, max_buffer_size=max_buffer_size) as writer:
+        for ebd_key, result in results:
+            writer.write(ebd_key, result, docx_file_name)
+    return writer.number_of_records
@@ -0,0 +1,92 @@
+"""
+This module contains the incremental extraction of a new release of an EBD document.
+Consecutive releases (e.g. correction releases) share most of their EBD sections. Only the sections whose content
+changed compared to the previous release are converted again; the EbdTables of the other sections are reused.
+"""
+
+import logging
+from typing import Any, Generator, Mapping, Optional
+
+from rebdhuhn.models.ebd_table import EbdDocumentReleaseInformation, EbdTable
+
+from . import DocumentIndex, EbdNoTableSection, ExtractionEngine
+from ._docx_source import DocxSource
+from ._extraction import convert_ebd_section, get_document_index, get_release_information
+from .documentindex import DocumentIndexBase
+
+_logger = logging.getLogger(__name__)
+
+
+def _with_release_information(
+    ebd_table: EbdTable, release_information: Optional[EbdDocumentReleaseInformation]
+) -> EbdTable:
+    """
+    returns the given table if it has the given release information already; a copy with the new release information
+    otherwise (the previous result is not modified)
+    """
+    if ebd_table.metadata.release_information == release_information:
+        return ebd_table
+    metadata = ebd_table.metadata.model_copy(update={"release_information": release_information})
+    return ebd_table.model_copy(update={"metadata": metadata})
+
+
+def _get_unchanged_result(
+    ebd_key: str,
+    document_index: DocumentIndexBase[Any],
+    previous_document_index: DocumentIndexBase[Any],
+    previous_result: Optional[EbdTable | EbdNoTableSection | Exception],
+) -> Optional[EbdTable]:
+    """
+    returns the previous EbdTable if the section of the EBD did not change (None otherwise)
+    """
+    if not isinstance(previous_result, EbdTable):
+        return None
+    fingerprint = document_index.get_ebd_fingerprint(ebd_key)
+    if fingerprint is None or fingerprint != previous_document_index.get_ebd_fingerprint(ebd_key):
+        return None
+    return previous_result
+
+
+def iter_ebd_tables_incrementally(
+    docx_file_path: DocxSource | DocumentIndex,
+    previous_document_index: DocumentIndexBase[Any],
+    previous_results: Mapping[str, EbdTable | EbdNoTableSection | Exception],
+    engine: ExtractionEngine = "python-docx",
+) -> Generator[tuple[str, EbdTable | EbdNoTableSection | Exception], None, None]:
+    """
+    Converts all EBDs from the given file (or its content or document index), like `iter_ebd_tables`, but reuses the
+    results of a previous release of the document for the EBD sections that did not change.
+
+    A section is unchanged if its heading (title and chapter information) and the texts and layout of its tables are
+    the same in both documents (see `DocumentIndex.get_ebd_fingerprint`); changes of the formatting, the run
+    boundaries or the revision ids of the XML are ignored. The EbdTables of unchanged sections are taken from
+    `previous_results` (e.g. `dict(iter_ebd_tables(previous_docx_file_path))`), with the release information of the
+    new document. Everything else (new or changed sections, sections without tables and EBDs whose previous
+    conversion failed) is converted as usual.
+
+    The `previous_document_index` is the index the `previous_results` have been extracted from. It may have been built
+    by either engine; the `engine` determines how the new file is read (see `iter_ebd_tables`).
+
+    Yields:
+        tuple[str, EbdTable | EbdNoTableSection | Exception]: The EBD key and the result (same as `iter_ebd_tables`),
+        in document order.
+    """
+    document_index = get_document_index(docx_file_path, engine=engine)
+    release_information = get_release_information(document_index)
+    number_of_reused_results = 0
+    for ebd_key, (title, ebd_kapitel) in document_index.get_all_ebd_keys().items():
+        result: Optional[EbdTable | EbdNoTableSection | Exception]
+        try:
+            result = _get_unchanged_result(
+                ebd_key, document_index, previous_document_index, previous_results.get(ebd_key)
+            )
+            if result is None:
+                result = convert_ebd_section(document_index, ebd_key, title, ebd_kapitel, release_information)
+            else:
+                number_of_reused_results += 1
+                result = _with_release_information(result, release_information)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            _logger.warning("Could not convert EBD '%s': %s", ebd_key, error)
+            result = error
+        yield ebd_key, result
+    _logger.info("%i EBDs have been reused from the previous release", number_of_reused_results)
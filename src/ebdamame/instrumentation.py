@@ -0,0 +1,168 @@
+"""
+Opt-in instrumentation of the extraction: durations and counts per processing stage and per EBD key.
+
+Nothing is measured unless a recording is active, e.g.:
+
+    with record_timings() as recorder:
+        for ebd_key, result in iter_ebd_tables(docx_file_path):
+            ...
+    print(recorder.get_report().model_dump_json(indent=2))
+
+A recording covers the stages that run in the current thread or asyncio task (and in the jobs that an
+`AsyncEbdExtractor` runs for it), so concurrent recordings, e.g. one per request of a web service, don't interfere.
+The conversions in the worker processes of `iter_ebd_tables(..., max_workers=...)` and `extract_documents` are not
+recorded.
+"""
+
+import threading
+import time
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Callable, Generator, Literal, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+Stage = Literal[
+    "read_document",
+    "discover_ebd_keys",
+    "locate_tables",
+    "read_release_information",
+    "convert_tables",
+]
+"""
+The stages of the extraction:
+"read_document": opening and parsing the .docx file (python-docx) or streaming its XML (lxml engine),
+"discover_ebd_keys": finding the EBD keys and the chapter information of their headings (building the index),
+"locate_tables": finding the tables (or the remark) of a single EBD,
+"read_release_information": reading the release information from the title page (python-docx; the lxml engine reads
+it while streaming the document),
+"convert_tables": converting the tables of a single EBD to an EbdTable.
+"""
+
+TimingCallback = Callable[[str, Optional[str], float], None]
+"""
+called with the stage, the EBD key (None for stages that are not specific to a single EBD) and the duration in seconds
+"""
+
+
+class StageTimings(BaseModel):
+    """
+    the aggregated durations of all measurements of a single stage
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    count: int
+    total_seconds: float
+    min_seconds: float
+    max_seconds: float
+
+
+class TimingReport(BaseModel):
+    """
+    The result of a recording; use `model_dump()` or `model_dump_json()` to export it.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    stages: dict[str, StageTimings]
+    """
+    the timings per stage (in the order in which the stages have been measured first)
+    """
+    ebds: dict[str, dict[str, float]]
+    """
+    the summed up durations (in seconds) per EBD key and stage, e.g. {"E_0003": {"locate_tables": 0.01, ...}}
+    """
+
+
+class TimingRecorder:
+    """
+    Collects the durations of the stages while it is active (see `record_timings`). It's thread-safe.
+    """
+
+    def __init__(self, callback: Optional[TimingCallback] = None):
+        self._callback = callback
+        self._lock = threading.Lock()
+        self._stages: dict[str, list[float]] = {}
+        """
+        count, total, min and max of the durations per stage
+        """
+        self._ebds: dict[str, dict[str, float]] = {}
+
+    def record(self, stage: str, seconds: float, ebd_key: Optional[str] = None) -> None:
+        """
+        Adds a single measurement (the stage doesn't have to be one of ebdamame's own stages).
+        """
+        with self._lock:
+            statistics = self._stages.get(stage)
+            if statistics is None:
+                self._stages[stage] = [1, seconds, seconds, seconds]
+            else:
+                statistics[0] += 1
+                statistics[1] += seconds
+                statistics[2] = min(statistics[2], seconds)
+                statistics[3] = max(statistics[3], seconds)
+            if ebd_key is not None:
+                ebd_stages = self._ebds.setdefault(ebd_key, {})
+                ebd_stages[stage] = ebd_stages.get(stage, 0.0) + seconds
+        if self._callback is not None:
+            self._callback(stage, ebd_key, seconds)
+
+    @contextmanager
+    def measure(self, stage: str, ebd_key: Optional[str] = None) -> Generator[None, None, None]:
+        """
+        measures the duration of the with-block (also if it raises an exception)
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start, ebd_key)
+
+    def get_report(self) -> TimingReport:
+        """
+        returns the timings that have been recorded so far
+        """
+        with self._lock:
+            return TimingReport(
+                stages={
+                    stage: StageTimings(count=int(count), total_seconds=total, min_seconds=minimum, max_seconds=maximum)
+                    for stage, (count, total, minimum, maximum) in self._stages.items()
+                },
+                ebds={ebd_key: dict(ebd_stages) for ebd_key, ebd_stages in self._ebds.items()},
+            )
+
+
+_active_recorder: ContextVar[Optional[TimingRecorder]] = ContextVar("ebdamame_active_recorder", default=None)
+"""
+the recorder of the current recording in this context, i.e. thread or asyncio task (None if nothing is recorded)
+"""
+_NO_MEASUREMENT: AbstractContextManager[None] = nullcontext()
+
+
+def measure_stage(stage: Stage, ebd_key: Optional[str] = None) -> AbstractContextManager[None]:
+    """
+    Returns a context manager that measures the duration of the with-block as the given stage.
+    If no recording is active, a shared no-op context manager is returned, so the instrumentation costs nothing but
+    this function call.
+    """
+    recorder = _active_recorder.get()
+    if recorder is None:
+        return _NO_MEASUREMENT
+    return recorder.measure(stage, ebd_key)
+
+
+@contextmanager
+def record_timings(callback: Optional[TimingCallback] = None) -> Generator[TimingRecorder, None, None]:
+    """
+    Records the durations of the extraction stages in the current thread or asyncio task while the with-block is
+    executed. Recordings in other threads or tasks may overlap with it in any order; each records its own stages.
+    The optional callback is called after every single measurement, e.g. to forward them to a monitoring system.
+    Recordings can be nested; the inner recording is active until its with-block ends.
+    """
+    recorder = TimingRecorder(callback=callback)
+    token = _active_recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _active_recorder.reset(token)
@@ -0,0 +1,122 @@
+"""
+This module contains the manifest of an EBD document: everything that is known about a release of the document
+without converting a single EBD (keys, titles, chapter information, release information, the number of tables or the
+remark of each EBD and their fingerprints). It's built from one traversal of the document body and can be stored as
+JSON, e.g. next to the .docx file.
+"""
+
+from typing import Any, Optional
+
+from pydantic import BaseModel, ConfigDict
+from rebdhuhn.models.ebd_table import EbdDocumentReleaseInformation
+
+from . import DocumentIndex, EbdChapterInformation, EbdNoTableSection, ExtractionEngine, TableNotFoundError
+from ._docx_source import DocxSource, get_rereadable_docx_source
+from ._extraction import get_document_index, get_release_information
+from .cache import get_document_hash
+from .documentindex import DocumentIndexBase
+
+
+class EbdManifestEntry(BaseModel):
+    """
+    Describes a single EBD of the document.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    ebd_key: str
+    title: str
+    chapter_information: EbdChapterInformation
+    number_of_tables: int
+    """
+    the number of tables of the EBD (the table of an EBD may be split into several tables in the document); 0 if its
+    section contains no table (see remark) or if its table could not be found
+    """
+    remark: Optional[str] = None
+    """
+    the remark of a section without tables (see EbdNoTableSection); None if the section has tables or if its table
+    could not be found
+    """
+    fingerprint: str
+    """
+    the fingerprint of the content of the section (see DocumentIndex.get_ebd_fingerprint)
+    """
+
+
+class DocumentManifest(BaseModel):
+    """
+    The manifest of an EBD document (see build_manifest).
+    Use `model_dump_json` and `model_validate_json` to store and load it.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    document_hash: Optional[str] = None
+    """
+    the SHA-256 hex digest of the content of the .docx file (see get_document_hash); None if the manifest has been
+    built from a document index
+    """
+    release_information: Optional[EbdDocumentReleaseInformation] = None
+    ebds: list[EbdManifestEntry]
+    """
+    the EBDs in document order
+    """
+
+    def get_entry(self, ebd_key: str) -> Optional[EbdManifestEntry]:
+        """
+        Returns the entry of the given EBD (None if the EBD is not part of the document).
+        """
+        return next((entry for entry in self.ebds if entry.ebd_key == ebd_key), None)
+
+    def is_manifest_of(self, docx_file_path: DocxSource) -> bool:
+        """
+        Returns True if the manifest has been built from a file with the same content as the given file (or in-memory
+        content or file object), i.e. if a stored manifest is still up to date.
+        """
+        return self.document_hash is not None and self.document_hash == get_document_hash(docx_file_path)
+
+
+def _create_entry(
+    document_index: DocumentIndexBase[Any], ebd_key: str, title: str, ebd_kapitel: EbdChapterInformation
+) -> EbdManifestEntry:
+    try:
+        section = document_index.get_ebd_docx_tables(ebd_key)
+    except TableNotFoundError:
+        section = []
+    fingerprint = document_index.get_ebd_fingerprint(ebd_key)
+    assert fingerprint is not None  # all keys of the index have a fingerprint
+    return EbdManifestEntry(
+        ebd_key=ebd_key,
+        title=title,
+        chapter_information=ebd_kapitel,
+        number_of_tables=0 if isinstance(section, EbdNoTableSection) else len(section),
+        remark=section.remark if isinstance(section, EbdNoTableSection) else None,
+        fingerprint=fingerprint,
+    )
+
+
+def build_manifest(
+    docx_file_path: DocxSource | DocumentIndex, engine: ExtractionEngine = "python-docx"
+) -> DocumentManifest:
+    """
+    Builds the manifest of the given file (or its content or a binary file object, see `get_document`) or document
+    index: the EBD keys with their titles and chapter information, the release information, the number of tables (or
+    the remark) and the fingerprint of each EBD, and the hash of the file content.
+
+    The document body is traversed once (when the document index is built); the tables of each EBD are located within
+    its section only and are not converted. The `engine` ("python-docx" or "lxml") determines how the file is read;
+    both yield the same manifest.
+    """
+    document_hash: Optional[str] = None
+    if not isinstance(docx_file_path, DocumentIndex):
+        docx_file_path = get_rereadable_docx_source(docx_file_path)  # it's hashed and then parsed
+        document_hash = get_document_hash(docx_file_path)
+    document_index = get_document_index(docx_file_path, engine=engine)
+    return DocumentManifest(
+        document_hash=document_hash,
+        release_information=get_release_information(document_index),
+        ebds=[
+            _create_entry(document_index, ebd_key, title, ebd_kapitel)
+            for ebd_key, (title, ebd_kapitel) in document_index.get_all_ebd_keys().items()
+        ],
+    )
@@ -15,3 +15,8 @@ EBD_2023_06_29_V34 = _TEST_DATA_DIR / "ebd20230629_v34.docx"
 EBD_2024_04_03_V35 = _TEST_DATA_DIR / "ebd20240403_v35.docx"
 EBD_2025_04_04_V40B = _TEST_DATA_DIR / "ebd20250404_v40b.docx"
 EBD_V42 = _TEST_DATA_DIR / "EBD_4.2_20260401_99991231_20251211_oxox_12000.docx"
+
+ALL_DOCX_FILES = sorted(_TEST_DATA_DIR.glob("*.docx"))
+"""
+all .docx files in the test data directory
+"""
@@ -0,0 +1,160 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable
+
+import pytest  # type: ignore[import]
+
+from ebdamame import (
+    TableNotFoundError,
+    clear_document_cache,
+    get_all_ebd_keys,
+    get_ebd_docx_tables,
+    get_ebd_table,
+    iter_ebd_tables,
+)
+from ebdamame.aio import AsyncEbdExtractor
+
+from . import EBD_2022_11_28
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    """
+    A thread pool that counts the submitted jobs.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(max_workers=4)
+        self.number_of_jobs = 0
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> "Future[Any]":
+        self.number_of_jobs += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+class TestAsyncEbdExtractor:
+    """
+    Tests the asyncio API.
+    """
+
+    def test_results_are_the_same_as_with_the_synchronous_api(self):
+        async def extract() -> tuple[Any, ...]:
+            async with AsyncEbdExtractor(engine="lxml") as extractor:
+                return await asyncio.gather(
+                    extractor.get_all_ebd_keys(EBD_2022_11_28),
+                    extractor.get_ebd_table(EBD_2022_11_28, "E_0003"),
+                    extractor.get_ebd_docx_tables(EBD_2022_11_28, "E_0003"),
+                )
+
+        ebd_keys, ebd_table, docx_tables = asyncio.run(extract())
+        assert ebd_keys == get_all_ebd_keys(EBD_2022_11_28)
+        assert ebd_table == get_ebd_table(EBD_2022_11_28, "E_0003")
+        assert len(docx_tables) == len(get_ebd_docx_tables(EBD_2022_11_28, "E_0003"))
+
+    def test_paths_given_as_strings(self):
+        async def extract() -> Any:
+            async with AsyncEbdExtractor(engine="lxml") as extractor:
+                return await extractor.get_ebd_table(str(EBD_2022_11_28), "E_0003")
+
+        assert asyncio.run(extract()) == get_ebd_table(EBD_2022_11_28, "E_0003")
+
+    @pytest.mark.parametrize("read_content", [pytest.param(False, id="path"), pytest.param(True, id="content")])
+    def test_iter_ebd_tables(self, read_content: bool):
+        docx_file = EBD_2022_11_28.read_bytes() if read_content else EBD_2022_11_28
+
+        async def extract() -> list[Any]:
+            async with AsyncEbdExtractor(engine="lxml") as extractor:
+                return [result async for result in extractor.iter_ebd_tables(docx_file)]
+
+        actual = asyncio.run(extract())
+        expected = list(iter_ebd_tables(EBD_2022_11_28, engine="lxml"))
+        assert [ebd_key for ebd_key, _ in actual] == [ebd_key for ebd_key, _ in expected]
+        for (_, actual_result), (_, expected_result) in zip(actual, expected):
+            if isinstance(expected_result, Exception):
+                assert type(actual_result) is type(expected_result)
+            else:
+                assert actual_result == expected_result
+
+    def test_concurrent_requests_for_the_same_ebd_share_one_job(self):
+        clear_document_cache(EBD_2022_11_28)
+        executor = _CountingExecutor()
+
+        async def extract() -> list[Any]:
+            extractor = AsyncEbdExtractor(executor=executor, engine="lxml")
+            return await asyncio.gather(*(extractor.get_ebd_table(EBD_2022_11_28, "E_0003") for _ in range(5)))
+
+        with executor:
+            results = asyncio.run(extract())
+        assert all(result == results[0] for result in results)
+        assert executor.number_of_jobs == 2  # reading the document and converting the EBD
+
+    def test_errors_are_raised_to_all_waiting_requests(self):
+        async def extract() -> list[Any]:
+            async with AsyncEbdExtractor(engine="lxml") as extractor:
+                return await asyncio.gather(
+                    *(extractor.get_ebd_table(EBD_2022_11_28, "E_9999") for _ in range(2)), return_exceptions=True
+                )
+
+        assert all(isinstance(result, TableNotFoundError) for result in asyncio.run(extract()))
+
+    def test_number_of_concurrent_jobs_is_bounded(self):
+        lock = threading.Lock()
+        running_jobs: list[int] = [0, 0]  # currently running, maximum
+
+        def job() -> None:
+            with lock:
+                running_jobs[0] += 1
+                running_jobs[1] = max(running_jobs)
+            time.sleep(0.02)
+            with lock:
+                running_jobs[0] -= 1
+
+        async def run_jobs() -> None:
+            async with AsyncEbdExtractor(executor=ThreadPoolExecutor(max_workers=8), max_concurrency=2) as extractor:
+                run_in_executor = extractor._run_in_executor  # pylint:disable=protected-access
+                await asyncio.gather(*(run_in_executor(job) for _ in range(8)))
+
+        asyncio.run(run_jobs())
+        assert running_jobs[1] == 2
+
+    def test_cancelled_requests_do_not_cancel_shared_jobs(self):
+        clear_document_cache(EBD_2022_11_28)
+        executor = _CountingExecutor()
+
+        async def extract() -> Any:
+            extractor = AsyncEbdExtractor(executor=executor, max_concurrency=1, engine="lxml")
+            first_request = asyncio.ensure_future(extractor.get_ebd_table(EBD_2022_11_28, "E_0003"))
+            second_request = asyncio.ensure_future(extractor.get_ebd_table(EBD_2022_11_28, "E_0003"))
+            third_request = asyncio.ensure_future(extractor.get_ebd_table(EBD_2022_11_28, "E_0004"))
+            await asyncio.sleep(0)
+            first_request.cancel()
+            third_request.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await third_request
+            return await second_request
+
+        with executor:
+            assert asyncio.run(extract()) == get_ebd_table(EBD_2022_11_28, "E_0003")
+        assert executor.number_of_jobs == 2  # E_0004 has never been converted
+
+    def test_closing_iter_ebd_tables_cancels_pending_jobs(self):
+        executor = _CountingExecutor()
+
+        async def extract_first() -> None:
+            extractor = AsyncEbdExtractor(executor=executor, max_concurrency=1, engine="lxml")
+            ebd_tables = extractor.iter_ebd_tables(EBD_2022_11_28)
+            await anext(ebd_tables)
+            await ebd_tables.aclose()
+            await asyncio.sleep(0.1)
+
+        with executor:
+            asyncio.run(extract_first())
+        assert executor.number_of_jobs < len(get_all_ebd_keys(EBD_2022_11_28))
+
+    def test_process_pool(self):
+        async def extract() -> Any:
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                return await AsyncEbdExtractor(executor=executor, engine="lxml").get_ebd_table(EBD_2022_11_28, "E_0003")
+
+        assert asyncio.run(extract()) == get_ebd_table(EBD_2022_11_28, "E_0003")
@@ -0,0 +1,77 @@
+from pathlib import Path
+from typing import Optional
+
+import pytest  # type: ignore[import]
+
+import ebdamame.batch
+from ebdamame import EbdTableCache, TableNotFoundError, get_ebd_table, iter_ebd_tables
+from ebdamame.batch import extract_documents
+
+from . import EBD_2022_11_28, EBD_2023_06_19_V33
+
+
+class TestBatchExtraction:
+    """
+    Tests the extraction of multiple documents at once
+    """
+
+    def test_parallel_results_are_identical_to_sequential_results(self):
+        paths = [EBD_2022_11_28, EBD_2023_06_19_V33]
+        actual = {path: (results, statistics) for path, results, statistics in extract_documents(paths, max_workers=2)}
+        assert set(actual.keys()) == set(paths)
+        for path in paths:
+            expected = list(iter_ebd_tables(path))
+            results, statistics = actual[path]
+            assert list(results.keys()) == [ebd_key for ebd_key, _ in expected]
+            for ebd_key, expected_result in expected:
+                if isinstance(expected_result, Exception):
+                    assert type(results[ebd_key]) is type(expected_result)
+                    assert str(results[ebd_key]) == str(expected_result)
+                else:
+                    assert results[ebd_key] == expected_result
+            assert statistics.docx_file_path == path
+            assert statistics.number_of_ebds == len(expected)
+            assert statistics.number_of_errors == sum(1 for _, result in expected if isinstance(result, Exception))
+            assert statistics.ebds_per_second > 0
+
+    def test_sequential_extraction(self):
+        (path, results, statistics), *others = list(extract_documents([EBD_2022_11_28, EBD_2022_11_28]))
+        assert not any(others)  # duplicates are ignored
+        assert path == EBD_2022_11_28
+        assert statistics.number_of_ebds == len(results) > 0
+
+    def test_cached_documents_are_not_scheduled(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        cache = EbdTableCache(tmp_path)
+        ((_, expected, _),) = list(extract_documents([EBD_2022_11_28], max_workers=1, cache=cache))
+        monkeypatch.setattr(ebdamame.batch, "ProcessPoolExecutor", None)  # no worker must be started
+        ((_, actual, statistics),) = list(extract_documents([EBD_2022_11_28], max_workers=1, cache=cache))
+        assert list(actual.keys()) == list(expected.keys())
+        assert statistics.number_of_ebds == len(expected)
+
+    @pytest.mark.parametrize("max_workers", [pytest.param(None, id="sequential"), pytest.param(2, id="parallel")])
+    def test_selected_ebds(self, max_workers: Optional[int], tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        hashed_files: list[Path] = []
+
+        def get_document_hash(docx_file_path: Path) -> str:
+            hashed_files.append(docx_file_path)
+            return original_get_document_hash(docx_file_path)
+
+        original_get_document_hash = ebdamame.batch.get_document_hash
+        monkeypatch.setattr(ebdamame.batch, "get_document_hash", get_document_hash)
+        ebd_keys = ["E_0015", "E_9999", "E_0003"]
+        ((path, results, statistics),) = list(
+            extract_documents(
+                [EBD_2022_11_28], max_workers=max_workers, cache=EbdTableCache(tmp_path), ebd_keys=ebd_keys
+            )
+        )
+        assert path == EBD_2022_11_28
+        assert list(results.keys()) == ebd_keys
+        assert results["E_0003"] == get_ebd_table(EBD_2022_11_28, "E_0003")
+        assert isinstance(results["E_9999"], TableNotFoundError)
+        assert statistics.number_of_ebds == 3 and statistics.number_of_errors == 1
+        assert hashed_files == [EBD_2022_11_28]  # once per file, not once per EBD
+        assert EbdTableCache(tmp_path).load(original_get_document_hash(EBD_2022_11_28), "E_0015") == results["E_0015"]
+
+    def test_malformed_ebd_keys(self):
+        with pytest.raises(ValueError):
+            list(extract_documents([EBD_2022_11_28], ebd_keys=["foo"]))
@@ -0,0 +1,80 @@
+import logging
+from pathlib import Path
+
+import pytest  # type: ignore[import]
+from rebdhuhn.models.ebd_table import EbdTable
+
+from ebdamame import (
+    EbdNoTableSection,
+    EbdTableCache,
+    TableNotFoundError,
+    clear_document_cache,
+    get_ebd_table,
+    iter_ebd_tables,
+)
+from ebdamame.cache import get_document_hash
+
+from . import EBD_2022_11_28
+from .examples import table_e0003
+
+
+class TestEbdTableCache:
+    """
+    Tests the on-disk cache of converted EBDs
+    """
+
+    def test_get_ebd_table_is_read_from_cache(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        cache = EbdTableCache(tmp_path)
+        expected = get_ebd_table(EBD_2022_11_28, "E_0003", cache=cache)
+        assert isinstance(expected, EbdTable)
+        assert expected.rows == table_e0003.rows
+        assert any(tmp_path.rglob("*.json.zlib"))
+        clear_document_cache()
+        monkeypatch.setattr("ebdamame._extraction.read_document", None)  # the document must not be read
+        actual = get_ebd_table(EBD_2022_11_28, "E_0003", cache=cache)
+        assert actual == expected
+
+    def test_errors_are_cached(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        cache = EbdTableCache(tmp_path)
+        with pytest.raises(TableNotFoundError):
+            get_ebd_table(EBD_2022_11_28, "E_9999", cache=cache)
+        clear_document_cache()
+        monkeypatch.setattr("ebdamame._extraction.read_document", None)  # the document must not be read
+        with pytest.raises(TableNotFoundError) as error_info:
+            get_ebd_table(EBD_2022_11_28, "E_9999", cache=cache)
+        assert error_info.value.ebd_key == "E_9999"
+
+    def test_iter_ebd_tables_is_read_from_cache(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        cache = EbdTableCache(tmp_path)
+        expected = list(iter_ebd_tables(EBD_2022_11_28, cache=cache))
+        clear_document_cache()
+        monkeypatch.setattr("ebdamame._extraction.read_document", None)  # the document must not be read
+        actual = list(iter_ebd_tables(EBD_2022_11_28, cache=cache))
+        assert [ebd_key for ebd_key, _ in actual] == [ebd_key for ebd_key, _ in expected]
+        for (_, actual_result), (_, expected_result) in zip(actual, expected):
+            if isinstance(expected_result, Exception):
+                assert type(actual_result) is type(expected_result)
+                assert str(actual_result) == str(expected_result)
+            else:
+                assert isinstance(actual_result, (EbdTable, EbdNoTableSection))
+                assert actual_result == expected_result
+
+    def test_in_memory_content_is_not_logged(self, tmp_path: Path, caplog: pytest.LogCaptureFixture):
+        cache = EbdTableCache(tmp_path)
+        docx_content = EBD_2022_11_28.read_bytes()
+        list(iter_ebd_tables(docx_content, cache=cache))
+        with caplog.at_level(logging.DEBUG, logger="ebdamame"):
+            list(iter_ebd_tables(docx_content, cache=cache))
+        assert "All EBDs of '<bytes>' are read from the cache" in caplog.messages
+        assert all(len(message) < 1000 for message in caplog.messages)
+
+    def test_cache_is_keyed_by_content(self, tmp_path: Path):
+        cache = EbdTableCache(tmp_path / "cache")
+        copied_file = tmp_path / "renamed.docx"
+        copied_file.write_bytes(EBD_2022_11_28.read_bytes())
+        assert get_document_hash(copied_file) == get_document_hash(EBD_2022_11_28)
+        cache.store(get_document_hash(copied_file), "E_0402", EbdNoTableSection(ebd_key="E_0402", remark="foo"))
+        assert cache.load(get_document_hash(EBD_2022_11_28), "E_0402") == EbdNoTableSection(
+            ebd_key="E_0402", remark="foo"
+        )
+        assert cache.load(get_document_hash(EBD_2022_11_28), "E_0003") is None
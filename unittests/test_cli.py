@@ -0,0 +1,123 @@
+import json
+import shutil
+from pathlib import Path
+from typing import Any
+
+import pytest  # type: ignore[import]
+from click.testing import CliRunner
+
+import ebdamame.batch
+from ebdamame import EbdTableCache, get_ebd_table
+from ebdamame.cache import get_document_hash
+from ebdamame.cli import main
+
+from . import EBD_2022_11_28
+
+
+class TestCli:
+    """
+    Tests the `ebdamame extract` command.
+    """
+
+    def test_extract_selected_ebds_to_a_directory(self, tmp_path: Path):
+        result = CliRunner().invoke(
+            main, ["extract", str(EBD_2022_11_28), "--output-dir", str(tmp_path), "--keys", "E_0003,E_0015"]
+        )
+        assert result.exit_code == 0, result.output
+        document_output_dir = tmp_path / EBD_2022_11_28.stem
+        assert sorted(path.name for path in document_output_dir.iterdir()) == ["E_0003.json", "E_0015.json"]
+        with open(document_output_dir / "E_0003.json", encoding="utf-8") as json_file:
+            assert json.load(json_file) == get_ebd_table(EBD_2022_11_28, "E_0003").model_dump(mode="json")
+
+    def test_extract_to_json_lines(self, tmp_path: Path):
+        result = CliRunner().invoke(
+            main,
+            [
+                "extract",
+                str(EBD_2022_11_28),
+                "--jsonl",
+                "-",
+                "-k",
+                "E_0003",
+                "-k",
+                "E_9999",
+                "--cache-dir",
+                str(tmp_path),
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        lines = [json.loads(line) for line in result.stdout.splitlines()]
+        assert [(line["ebd_key"], line["type"]) for line in lines] == [("E_0003", "EbdTable"), ("E_9999", "error")]
+        assert lines[0]["docx_file"] == EBD_2022_11_28.name
+        assert lines[1]["error"] == "TableNotFoundError"
+        assert EbdTableCache(tmp_path).load(get_document_hash(EBD_2022_11_28), "E_0003") is not None
+
+    def test_extract_all_ebds(self, tmp_path: Path):
+        output_file = tmp_path / "ebds.jsonl"
+        result = CliRunner().invoke(
+            main, ["extract", str(EBD_2022_11_28), "--jsonl", str(output_file), "--engine", "lxml"]
+        )
+        assert result.exit_code == 0, result.output
+        with open(output_file, encoding="utf-8") as jsonl_file:
+            ebd_keys = [json.loads(line)["ebd_key"] for line in jsonl_file]
+        assert len(ebd_keys) > 100
+        assert "E_0003" in ebd_keys
+        assert "convert_tables" in result.stderr
+
+    @pytest.mark.parametrize("output_options", [[], ["--jsonl", "-", "--output-dir", "out"]])
+    def test_exactly_one_output_is_required(self, output_options: list[str]):
+        result = CliRunner().invoke(main, ["extract", str(EBD_2022_11_28), *output_options])
+        assert result.exit_code == 2
+        assert "exactly one of --output-dir and --jsonl" in result.output
+
+    def test_malformed_ebd_keys_are_usage_errors(self):
+        result = CliRunner().invoke(main, ["extract", str(EBD_2022_11_28), "--jsonl", "-", "--keys", "E_0003,foo"])
+        assert result.exit_code == 2
+        assert "'foo' is not an EBD key" in result.output
+
+    def test_selected_ebds_are_distributed_across_jobs(self):
+        arguments = ["extract", str(EBD_2022_11_28), "--jsonl", "-", "--keys", "E_0003,E_9999,E_0015"]
+        sequential_result = CliRunner().invoke(main, arguments)
+        parallel_result = CliRunner().invoke(main, [*arguments, "--jobs", "2"])
+        assert parallel_result.exit_code == sequential_result.exit_code == 0, parallel_result.output
+        assert parallel_result.stdout == sequential_result.stdout
+        assert [json.loads(line)["ebd_key"] for line in parallel_result.stdout.splitlines()] == [
+            "E_0003",
+            "E_9999",
+            "E_0015",
+        ]
+
+    def test_unexpected_errors_of_selected_ebds_are_reported_per_ebd(self, monkeypatch: pytest.MonkeyPatch):
+        def convert_ebd_section(*args: Any) -> Any:
+            if args[1] == "E_0003":
+                raise KeyError("foo")
+            return original_convert_ebd_section(*args)
+
+        original_convert_ebd_section = ebdamame.batch.convert_ebd_section
+        monkeypatch.setattr(ebdamame.batch, "convert_ebd_section", convert_ebd_section)
+        result = CliRunner().invoke(main, ["extract", str(EBD_2022_11_28), "--jsonl", "-", "--keys", "E_0003,E_0015"])
+        assert result.exit_code == 0, result.output
+        lines = [json.loads(line) for line in result.stdout.splitlines()]
+        assert [(line["ebd_key"], line["type"]) for line in lines] == [("E_0003", "error"), ("E_0015", "EbdTable")]
+        assert lines[0]["error"] == "KeyError"
+
+    def test_files_with_the_same_name_are_not_written_to_the_same_directory(self, tmp_path: Path):
+        copied_docx_file_path = tmp_path / "copy" / EBD_2022_11_28.name
+        copied_docx_file_path.parent.mkdir()
+        shutil.copy(EBD_2022_11_28, copied_docx_file_path)
+        output_dir = tmp_path / "out"
+        result = CliRunner().invoke(
+            main,
+            [
+                "extract",
+                str(EBD_2022_11_28),
+                str(copied_docx_file_path),
+                "--output-dir",
+                str(output_dir),
+                "-k",
+                "E_0003",
+            ],
+        )
+        assert result.exit_code == 2
+        assert str(copied_docx_file_path.resolve()) in result.output
+        assert not output_dir.exists()
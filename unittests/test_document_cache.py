@@ -0,0 +1,67 @@
+import os
+import shutil
+from pathlib import Path
+from typing import Generator
+
+import pytest  # type: ignore[import]
+
+from ebdamame import clear_document_cache, configure_document_cache, get_all_ebd_keys, get_document
+
+from . import EBD_2022_11_28
+
+
+@pytest.fixture
+def fresh_document_cache() -> Generator[None, None, None]:
+    clear_document_cache()
+    yield
+    configure_document_cache(max_documents=2, max_bytes=32 * 1024 * 1024)
+    clear_document_cache()
+
+
+@pytest.mark.usefixtures("fresh_document_cache")
+class TestDocumentCache:
+    """
+    Tests the in-process cache of parsed documents
+    """
+
+    def test_documents_are_cached(self):
+        assert get_document(EBD_2022_11_28) is get_document(EBD_2022_11_28)
+        assert get_document(EBD_2022_11_28, use_cache=False) is not get_document(EBD_2022_11_28)
+
+    def test_paths_given_as_strings_are_cached_like_paths(self):
+        docx_file_path = str(EBD_2022_11_28)
+        assert get_all_ebd_keys(docx_file_path) == get_all_ebd_keys(EBD_2022_11_28)
+        document = get_document(docx_file_path)
+        assert document is get_document(EBD_2022_11_28)
+        clear_document_cache(docx_file_path)
+        assert get_document(EBD_2022_11_28) is not document
+
+    def test_clear_document_cache(self):
+        document = get_document(EBD_2022_11_28)
+        clear_document_cache(EBD_2022_11_28)
+        assert get_document(EBD_2022_11_28) is not document
+
+    def test_modified_files_are_read_again(self, tmp_path: Path):
+        docx_file_path = tmp_path / "copy.docx"
+        shutil.copy(EBD_2022_11_28, docx_file_path)
+        document = get_document(docx_file_path)
+        modification_time = docx_file_path.stat().st_mtime_ns + 1_000_000_000
+        os.utime(docx_file_path, ns=(modification_time, modification_time))
+        assert get_document(docx_file_path) is not document
+
+    def test_least_recently_used_document_is_dropped(self, tmp_path: Path):
+        configure_document_cache(max_documents=1, max_bytes=32 * 1024 * 1024)
+        docx_file_path = tmp_path / "copy.docx"
+        shutil.copy(EBD_2022_11_28, docx_file_path)
+        document = get_document(EBD_2022_11_28)
+        _ = get_document(docx_file_path)
+        assert get_document(EBD_2022_11_28) is not document
+
+    def test_disabled_cache(self):
+        configure_document_cache(max_documents=0, max_bytes=0)
+        assert get_document(EBD_2022_11_28) is not get_document(EBD_2022_11_28)
+
+    def test_repeated_key_lookups_use_the_cached_index(self, monkeypatch: pytest.MonkeyPatch):
+        expected = get_all_ebd_keys(EBD_2022_11_28)
+        monkeypatch.setattr("ebdamame._extraction.read_document", None)  # the document must not be read again
+        assert get_all_ebd_keys(EBD_2022_11_28) == expected
@@ -0,0 +1,157 @@
+from pathlib import Path
+
+import pytest  # type: ignore[import]
+from docx.table import Table
+
+from ebdamame import (
+    DocumentIndex,
+    EbdNoTableSection,
+    TableNotFoundError,
+    get_all_ebd_keys,
+    get_document,
+    get_ebd_docx_tables,
+)
+from ebdamame._docx_utils import (
+    cell_text_is_probably_from_an_ebd_cell,
+    ct_tbl_is_an_ebd_table,
+    ct_tbl_is_first_ebd_table,
+    enrich_paragraph_texts_with_sections,
+    get_tables_and_paragraphs,
+    raw_table_is_an_ebd_table,
+    raw_table_is_first_ebd_table,
+)
+from ebdamame._raw_table import RawEbdTable
+from ebdamame.documentindex import DeferredParagraph
+
+from . import EBD_2022_11_28, EBD_2023_06_29_V34
+
+
+@pytest.fixture(scope="module")
+def document_index_2022_11_28() -> DocumentIndex:
+    return DocumentIndex(get_document(EBD_2022_11_28))
+
+
+class TestDocumentIndex:
+    """
+    Tests that the document index yields the same results as the path based functions.
+    """
+
+    @pytest.mark.parametrize("path", [EBD_2022_11_28, EBD_2023_06_29_V34])
+    def test_ebd_keys_are_identical(self, path: Path):
+        document_index = DocumentIndex(get_document(path))
+        assert get_all_ebd_keys(document_index) == get_all_ebd_keys(path)
+
+    @pytest.mark.parametrize(
+        "ebd_key, expected_number_of_tables, empty_ebd_str",
+        [
+            pytest.param("E_0003", 1, "", id="E_0003: One table on only one page"),
+            pytest.param("E_0015", 1, "", id="E_0015: one table spanning multiple pages"),
+            pytest.param("E_0901", 2, "", id="E_0901: multiple tables on multiple pages"),
+            pytest.param(
+                "E_0402",
+                0,
+                "Derzeit ist für diese Entscheidung kein Entscheidungsbaum notwendig, da keine Antwort gegeben wird. Der Netzbetreiber muss prüfen, ob eine Abmeldeanfrage zu senden ist.",
+                id="E_0402: no table",
+            ),
+        ],
+    )
+    def test_get_ebd_docx_tables(
+        self,
+        document_index_2022_11_28: DocumentIndex,
+        ebd_key: str,
+        expected_number_of_tables: int,
+        empty_ebd_str: str,
+    ):
+        actual = get_ebd_docx_tables(document_index_2022_11_28, ebd_key=ebd_key)
+        if isinstance(actual, EbdNoTableSection):
+            assert actual.remark == empty_ebd_str
+            assert actual == get_ebd_docx_tables(EBD_2022_11_28, ebd_key=ebd_key)
+        else:
+            assert len(actual) == expected_number_of_tables
+            assert all(isinstance(table, Table) for table in actual)
+            from_path = get_ebd_docx_tables(EBD_2022_11_28, ebd_key=ebd_key)
+            assert isinstance(from_path, list)
+            assert [table._tbl.xml for table in actual] == [table._tbl.xml for table in from_path]
+
+    def test_repeated_lookups_return_the_same_tables(self, document_index_2022_11_28: DocumentIndex):
+        first_lookup = document_index_2022_11_28.get_ebd_docx_tables("E_0901")
+        second_lookup = document_index_2022_11_28.get_ebd_docx_tables("E_0901")
+        assert isinstance(first_lookup, list) and isinstance(second_lookup, list)
+        assert first_lookup is not second_lookup  # modifying the result must not corrupt the index
+        assert [table._tbl for table in first_lookup] == [table._tbl for table in second_lookup]
+
+    def test_unknown_key_raises_table_not_found_error(self, document_index_2022_11_28: DocumentIndex):
+        with pytest.raises(TableNotFoundError):
+            document_index_2022_11_28.get_ebd_docx_tables("E_9999")
+
+    def test_invalid_key_raises_value_error(self, document_index_2022_11_28: DocumentIndex):
+        with pytest.raises(ValueError):
+            document_index_2022_11_28.get_ebd_docx_tables("foo")
+
+    def test_raw_tables_are_read_once_and_shared(self, document_index_2022_11_28: DocumentIndex):
+        raw_tables = document_index_2022_11_28.get_ebd_raw_tables("E_0901")
+        docx_tables = document_index_2022_11_28.get_ebd_docx_tables("E_0901")
+        assert isinstance(raw_tables, list) and isinstance(docx_tables, list)
+        assert len(raw_tables) == len(docx_tables)
+        # the tables are read only once, no matter how often they are requested
+        assert all(
+            first is second for first, second in zip(raw_tables, document_index_2022_11_28.get_ebd_raw_tables("E_0901"))
+        )
+        for raw_table, docx_table in zip(raw_tables, docx_tables):
+            assert raw_table.text_matrix is raw_table.text_matrix
+            assert raw_table.text_matrix == tuple(tuple(cell.text for cell in row.cells) for row in raw_table.rows)
+            assert len(raw_table.text_matrix) == len(docx_table.rows)
+
+    def test_table_classifiers_on_the_xml_give_the_same_verdicts(self, document_index_2022_11_28: DocumentIndex):
+        tables = [
+            item for item in get_tables_and_paragraphs(document_index_2022_11_28.document) if isinstance(item, Table)
+        ]
+        assert any(ct_tbl_is_an_ebd_table(table._tbl) for table in tables)
+        assert not all(ct_tbl_is_an_ebd_table(table._tbl) for table in tables)
+        for table in tables:
+            raw_table = RawEbdTable.from_element(table._tbl)
+            assert ct_tbl_is_an_ebd_table(table._tbl) == raw_table_is_an_ebd_table(raw_table)
+            assert ct_tbl_is_first_ebd_table(table._tbl) == raw_table_is_first_ebd_table(raw_table)
+
+    @pytest.mark.parametrize(
+        "cell_text, expected",
+        [
+            pytest.param("ja\uf0e05", True, id="arrow"),
+            pytest.param("ja à 5", True, id="arrow in wrong encoding"),
+            pytest.param("ja", True),
+            pytest.param("nein", True),
+            pytest.param("ja\n", False),
+            pytest.param("nein Ende", True),
+            pytest.param("ja 12\n", True),
+            pytest.param("ja, genau", False),
+            pytest.param("  Cluster: Ablehnung", True),
+            pytest.param("Hinweis: foo", True),
+            pytest.param(" Hinweis: foo", False),
+            pytest.param("Prüfschritt", False),
+            pytest.param("", False),
+        ],
+    )
+    def test_cell_text_is_probably_from_an_ebd_cell(self, cell_text: str, expected: bool):
+        assert cell_text_is_probably_from_an_ebd_cell(cell_text) is expected
+
+    def test_only_the_texts_of_the_headings_are_read_to_discover_the_ebd_keys(self):
+        document_index = DocumentIndex(get_document(EBD_2022_11_28))
+        deferred_paragraphs = [
+            item for item in document_index._paragraphs.values() if isinstance(item, DeferredParagraph)
+        ]
+        assert len(deferred_paragraphs) > len(document_index._heading_indices)
+        assert not any(paragraph._text is not None for paragraph in deferred_paragraphs)
+        remark = document_index.get_ebd_docx_tables("E_0402")
+        assert isinstance(remark, EbdNoTableSection) and remark.remark.startswith("Derzeit ist für diese Entscheidung")
+        assert any(paragraph._text is not None for paragraph in deferred_paragraphs)
+
+    def test_chapter_information_is_shared_below_the_same_heading(self):
+        locations = [
+            location
+            for _, location in enrich_paragraph_texts_with_sections(
+                [("Kapitel", 1), ("foo", None), ("bar", None), ("Abschnitt", 2), ("baz", None)]
+            )
+        ]
+        assert locations[0] is locations[1] is locations[2]
+        assert locations[3] is locations[4]
+        assert (locations[4].chapter, locations[4].section, locations[4].section_title) == (1, 1, "Abschnitt")
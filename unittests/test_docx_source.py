@@ -0,0 +1,139 @@
+import io
+import mmap
+import os
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest  # type: ignore[import]
+
+from ebdamame import (
+    EbdTableCache,
+    get_all_ebd_keys,
+    get_document,
+    get_ebd_docx_tables,
+    get_ebd_table,
+    iter_ebd_tables,
+    peek_release_information,
+)
+from ebdamame._docx_source import BufferReader, describe_docx_source
+from ebdamame.cache import get_document_hash
+from ebdamame.manifest import build_manifest
+
+from . import EBD_2022_11_28
+from .examples import table_e0003
+
+
+def _as_bytes(path: Path) -> Any:
+    return path.read_bytes()
+
+
+def _as_memoryview(path: Path) -> Any:
+    return memoryview(bytearray(path.read_bytes()))
+
+
+def _as_file_object(path: Path) -> Any:
+    return io.BytesIO(path.read_bytes())
+
+
+class _PathLike:  # pylint:disable=too-few-public-methods
+    """
+    an os.PathLike that is not a Path
+    """
+
+    def __init__(self, path: Path):
+        self._path = path
+
+    def __fspath__(self) -> str:
+        return str(self._path)
+
+
+class _NonSeekableStream(io.RawIOBase):
+    """
+    a binary stream that can be read only once (like a socket or a pipe)
+    """
+
+    def __init__(self, content: bytes):
+        super().__init__()
+        self._stream = io.BytesIO(content)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        return self._stream.readinto(buffer)
+
+
+def _as_non_seekable_stream(content: bytes) -> Any:
+    return _NonSeekableStream(content)
+
+
+class TestDocxSource:
+    """
+    Tests that the content of a file can be passed instead of its path.
+    """
+
+    @pytest.mark.parametrize("create_source", [_as_bytes, _as_memoryview, _as_file_object])
+    def test_ebd_keys_are_identical(self, create_source: Callable[[Path], Any]):
+        expected = get_all_ebd_keys(EBD_2022_11_28)
+        assert get_all_ebd_keys(create_source(EBD_2022_11_28)) == expected
+        assert get_all_ebd_keys(create_source(EBD_2022_11_28), engine="lxml") == expected
+
+    @pytest.mark.parametrize("create_path", [pytest.param(str, id="str"), pytest.param(_PathLike, id="os.PathLike")])
+    def test_paths_are_accepted_as_str_and_path_like(self, create_path: Callable[[Path], Any], tmp_path: Path):
+        docx_file_path = create_path(EBD_2022_11_28)
+        assert describe_docx_source(docx_file_path) == str(EBD_2022_11_28)
+        assert get_document_hash(docx_file_path) == get_document_hash(EBD_2022_11_28)
+        assert peek_release_information(docx_file_path) == peek_release_information(EBD_2022_11_28)
+        assert get_all_ebd_keys(docx_file_path, engine="lxml") == get_all_ebd_keys(EBD_2022_11_28)
+        cache = EbdTableCache(tmp_path)
+        assert get_ebd_table(docx_file_path, "E_0003", cache=cache) == get_ebd_table(EBD_2022_11_28, "E_0003")
+        assert cache.load(get_document_hash(EBD_2022_11_28), "E_0003") is not None
+        ebd_tables = iter_ebd_tables(docx_file_path, max_workers=1)  # parallel conversion requires a path
+        assert next(ebd_tables)[0] == next(iter(get_all_ebd_keys(EBD_2022_11_28)))
+        ebd_tables.close()
+
+    def test_non_seekable_streams_are_hashed_and_parsed(self, tmp_path: Path):
+        content = EBD_2022_11_28.read_bytes()
+        cache = EbdTableCache(tmp_path)
+        expected = get_ebd_table(EBD_2022_11_28, "E_0003")
+        assert get_ebd_table(_as_non_seekable_stream(content), "E_0003", cache=cache) == expected
+        assert dict(iter_ebd_tables(_as_non_seekable_stream(content), cache=cache, engine="lxml"))["E_0003"] == expected
+        manifest = build_manifest(_as_non_seekable_stream(content))
+        assert manifest.is_manifest_of(EBD_2022_11_28)
+        assert len(manifest.ebds) == len(get_all_ebd_keys(EBD_2022_11_28))
+
+    def test_memory_mapped_file(self):
+        with open(EBD_2022_11_28, "rb") as docx_file:
+            with mmap.mmap(docx_file.fileno(), 0, access=mmap.ACCESS_READ) as memory_mapped_file:
+                actual = get_ebd_table(memory_mapped_file, "E_0003")
+                assert get_document_hash(memory_mapped_file) == get_document_hash(EBD_2022_11_28)
+            # the memory-mapped file can be closed (i.e. no views on it are left behind)
+        assert actual.rows == table_e0003.rows  # type: ignore[union-attr]
+
+    def test_file_object_is_read_from_the_start_and_position_is_restored(self):
+        with open(EBD_2022_11_28, "rb") as docx_file:
+            _ = docx_file.read(10)
+            tables = get_ebd_docx_tables(docx_file, ebd_key="E_0003")
+            assert docx_file.tell() == 10
+        assert isinstance(tables, list) and len(tables) == 1
+
+    def test_documents_from_memory_are_not_cached(self):
+        content = EBD_2022_11_28.read_bytes()
+        assert get_document(content) is not get_document(content)
+
+    def test_parallel_conversion_requires_a_path(self):
+        with pytest.raises(ValueError):
+            next(iter_ebd_tables(EBD_2022_11_28.read_bytes(), max_workers=2))
+
+    def test_buffer_reader(self):
+        buffer_reader = BufferReader(memoryview(b"0123456789"))
+        assert buffer_reader.read(3) == b"012"
+        assert buffer_reader.seek(-2, io.SEEK_END) == 8
+        assert buffer_reader.read() == b"89"
+        assert buffer_reader.read(1) == b""
+        buffer_reader.seek(1)
+        target = bytearray(4)
+        assert buffer_reader.readinto(target) == 4
+        assert target == b"1234"
+        buffer_reader.close()
+        assert buffer_reader.closed
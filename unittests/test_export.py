@@ -0,0 +1,66 @@
+import io
+import json
+
+import pytest  # type: ignore[import]
+from rebdhuhn.models.ebd_table import EbdTable
+
+from ebdamame import EbdNoTableSection, TableNotFoundError, iter_ebd_tables
+from ebdamame.export import JsonLinesWriter, serialize_json_line, write_json_lines
+
+from . import EBD_2022_11_28
+
+
+@pytest.fixture(scope="module")
+def results() -> list[tuple[str, EbdTable | EbdNoTableSection | Exception]]:
+    return list(iter_ebd_tables(EBD_2022_11_28, engine="lxml"))
+
+
+class TestJsonLinesExport:
+    """
+    Tests the streaming export of the extraction results as JSON Lines.
+    """
+
+    def test_records_contain_the_same_data_as_model_dump(
+        self, results: list[tuple[str, EbdTable | EbdNoTableSection | Exception]]
+    ):
+        sink = io.StringIO()
+        assert write_json_lines(results, sink, docx_file_name=EBD_2022_11_28.name) == len(results)
+        records = [json.loads(line) for line in sink.getvalue().splitlines()]
+        assert [record["ebd_key"] for record in records] == [ebd_key for ebd_key, _ in results]
+        for record, (_, result) in zip(records, results):
+            assert record["docx_file"] == EBD_2022_11_28.name
+            if isinstance(result, Exception):
+                assert record["type"] == "error"
+                assert record["error"] == type(result).__name__
+                assert record["message"] == str(result)
+            else:
+                assert record["type"] == type(result).__name__
+                assert record["data"] == result.model_dump(mode="json")
+                assert type(result).model_validate(record["data"]) == result
+
+    def test_error_record(self):
+        record = serialize_json_line("E_9999", TableNotFoundError(ebd_key="E_9999"))
+        assert record.endswith("\n")
+        assert json.loads(record) == {
+            "ebd_key": "E_9999",
+            "type": "error",
+            "error": "TableNotFoundError",
+            "message": str(TableNotFoundError(ebd_key="E_9999")),
+        }
+
+    def test_buffering_is_bounded(self, results: list[tuple[str, EbdTable | EbdNoTableSection | Exception]]):
+        sink = io.StringIO()
+        max_buffer_size = 10_000
+        serialized_size = 0
+        with JsonLinesWriter(sink, max_buffer_size=max_buffer_size) as writer:
+            for ebd_key, result in results:
+                writer.write(ebd_key, result)
+                serialized_size += len(serialize_json_line(ebd_key, result))
+                assert 0 <= serialized_size - len(sink.getvalue()) <= max_buffer_size
+            assert writer.number_of_records == len(results)
+            assert len(sink.getvalue()) > 0  # records have been written before the writer is flushed
+        assert sink.getvalue() == "".join(serialize_json_line(ebd_key, result) for ebd_key, result in results)
+
+    def test_negative_buffer_size_is_rejected(self):
+        with pytest.raises(ValueError):
+            JsonLinesWriter(io.StringIO(), max_buffer_size=-1)
@@ -0,0 +1,58 @@
+import copy
+
+import pytest  # type: ignore[import]
+from docx.oxml.ns import qn
+from docx.table import Table
+
+from ebdamame import DocumentIndex, get_all_ebd_fingerprints, get_all_ebd_keys, get_document
+from ebdamame._raw_table import get_canonical_table_xml
+
+from . import EBD_2022_11_28, EBD_2023_06_19_V34, EBD_2023_06_29_V34
+
+
+@pytest.fixture(scope="module")
+def document_index_2022_11_28() -> DocumentIndex:
+    return DocumentIndex(get_document(EBD_2022_11_28))
+
+
+class TestFingerprint:
+    """
+    Tests the fingerprints of the EBD sections.
+    """
+
+    def test_fingerprints_do_not_depend_on_the_engine(self, document_index_2022_11_28: DocumentIndex):
+        fingerprints = get_all_ebd_fingerprints(document_index_2022_11_28)
+        assert list(fingerprints.keys()) == list(get_all_ebd_keys(document_index_2022_11_28).keys())
+        assert len(set(fingerprints.values())) == len(fingerprints)
+        assert get_all_ebd_fingerprints(EBD_2022_11_28, engine="lxml") == fingerprints
+
+    def test_only_changed_sections_have_new_fingerprints(self):
+        previous_fingerprints = get_all_ebd_fingerprints(EBD_2023_06_19_V34, engine="lxml")
+        fingerprints = get_all_ebd_fingerprints(EBD_2023_06_29_V34, engine="lxml")
+        number_of_unchanged_sections = sum(
+            1 for ebd_key, fingerprint in fingerprints.items() if previous_fingerprints.get(ebd_key) == fingerprint
+        )
+        # the correction release changed only a few EBDs
+        assert len(fingerprints) * 0.9 < number_of_unchanged_sections < len(fingerprints)
+
+    def test_unknown_key_has_no_fingerprint(self, document_index_2022_11_28: DocumentIndex):
+        assert document_index_2022_11_28.get_ebd_fingerprint("E_9999") is None
+
+    def test_canonical_table_xml_ignores_revision_ids_and_run_boundaries(
+        self, document_index_2022_11_28: DocumentIndex
+    ):
+        docx_tables = document_index_2022_11_28.get_ebd_docx_tables("E_0003")
+        assert isinstance(docx_tables, list) and isinstance(docx_tables[0], Table)
+        table_element = docx_tables[0]._tbl
+        modified_table_element = copy.deepcopy(table_element)
+        for paragraph in modified_table_element.iter(qn("w:p")):
+            paragraph.set(qn("w:rsidR"), "00ABCDEF")
+        text = next(text for text in modified_table_element.iter(qn("w:t")) if len(text.text or "") > 1)
+        run = text.getparent()
+        split_run = copy.deepcopy(run)
+        run.addnext(split_run)
+        split_text = split_run.find(qn("w:t"))
+        split_text.text, text.text = text.text[1:], text.text[:1]
+        assert get_canonical_table_xml(modified_table_element) == get_canonical_table_xml(table_element)
+        text.text = "changed"
+        assert get_canonical_table_xml(modified_table_element) != get_canonical_table_xml(table_element)
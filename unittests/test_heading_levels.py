@@ -0,0 +1,65 @@
+from typing import Optional
+
+import pytest  # type: ignore[import]
+from docx.oxml.ns import nsdecls
+from docx.text.paragraph import Paragraph
+from lxml import etree  # type: ignore[import-untyped]
+
+from ebdamame import get_document
+from ebdamame._docx_utils import HeadingLevels, get_heading_levels, get_tables_and_paragraphs, is_heading
+
+from . import EBD_2022_11_28
+
+_STYLES_XML = f"""<w:styles {nsdecls("w")}>
+    <w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/></w:style>
+    <w:style w:type="paragraph" w:styleId="Heading1"><w:name w:val="heading 1"/></w:style>
+    <w:style w:type="paragraph" w:styleId="Titre2"><w:name w:val="heading 2"/></w:style>
+    <w:style w:type="paragraph" w:styleId="berschrift3"><w:name w:val="heading 3"/></w:style>
+    <w:style w:type="paragraph" w:styleId="berschrift4"><w:name w:val="heading 4"/></w:style>
+    <w:style w:type="paragraph" w:styleId="Titel">
+        <w:name w:val="Title"/><w:pPr><w:outlineLvl w:val="0"/></w:pPr>
+    </w:style>
+    <w:style w:type="character" w:styleId="berschrift1Zchn"><w:name w:val="heading 1"/></w:style>
+</w:styles>"""
+
+
+class TestHeadingLevels:
+    """
+    Tests the map from the style ids of paragraphs to their heading levels.
+    """
+
+    @pytest.mark.parametrize(
+        "style_id, expected",
+        [
+            pytest.param("Heading1", 1, id="English style id"),
+            pytest.param("Titre2", 2, id="French style id"),
+            pytest.param("berschrift3", 3, id="German style id"),
+            pytest.param("berschrift4", None, id="only chapters, sections and subsections"),
+            pytest.param("Titel", None, id="outline level but no heading style"),
+            pytest.param("berschrift1Zchn", None, id="character style"),
+            pytest.param("berschrift1", None, id="unknown style id"),
+            pytest.param(None, None, id="no style id"),
+        ],
+    )
+    def test_get_level(self, style_id: Optional[str], expected: Optional[int]):
+        heading_levels = HeadingLevels(etree.fromstring(_STYLES_XML))
+        assert heading_levels.get_level(style_id) == expected
+
+    def test_ids_of_the_ebd_documents_are_used_without_styles_part(self):
+        heading_levels = HeadingLevels(None)
+        assert [heading_levels.get_level(f"berschrift{level}") for level in range(1, 5)] == [1, 2, 3, None]
+
+    def test_heading_levels_are_built_once_per_document(self):
+        document = get_document(EBD_2022_11_28)
+        assert get_heading_levels(document) is get_heading_levels(document)
+
+    def test_is_heading_is_the_same_as_with_the_resolved_style(self):
+        paragraphs = [
+            item for item in get_tables_and_paragraphs(get_document(EBD_2022_11_28)) if isinstance(item, Paragraph)
+        ]
+        headings = [paragraph for paragraph in paragraphs if is_heading(paragraph)]
+        assert len(headings) > 100
+        assert [is_heading(paragraph) for paragraph in paragraphs] == [
+            paragraph.style is not None and paragraph.style.style_id in {"berschrift1", "berschrift2", "berschrift3"}
+            for paragraph in paragraphs
+        ]
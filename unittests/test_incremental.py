@@ -0,0 +1,71 @@
+import pytest  # type: ignore[import]
+from rebdhuhn.models.ebd_table import EbdTable
+
+from ebdamame import DocumentIndex, EbdNoTableSection, get_document, iter_ebd_tables, record_timings
+from ebdamame.incremental import iter_ebd_tables_incrementally
+
+from . import EBD_2023_06_19_V34, EBD_2023_06_29_V34
+
+
+@pytest.fixture(scope="module")
+def previous_document_index() -> DocumentIndex:
+    return DocumentIndex(get_document(EBD_2023_06_19_V34))
+
+
+@pytest.fixture(scope="module")
+def previous_results(
+    previous_document_index: DocumentIndex,
+) -> dict[str, EbdTable | EbdNoTableSection | Exception]:
+    return dict(iter_ebd_tables(previous_document_index))
+
+
+def _dump(result: EbdTable | EbdNoTableSection | Exception) -> object:
+    if isinstance(result, Exception):
+        return type(result), str(result)
+    return result.model_dump()
+
+
+class TestIncrementalExtraction:
+    """
+    Tests the re-extraction of a document that reuses the results of a previous release.
+    """
+
+    def test_results_are_the_same_as_those_of_a_full_extraction(
+        self,
+        previous_document_index: DocumentIndex,
+        previous_results: dict[str, EbdTable | EbdNoTableSection | Exception],
+    ):
+        expected = dict(iter_ebd_tables(EBD_2023_06_29_V34, engine="lxml"))
+        with record_timings() as recorder:
+            actual = dict(
+                iter_ebd_tables_incrementally(
+                    EBD_2023_06_29_V34, previous_document_index, previous_results, engine="lxml"
+                )
+            )
+        assert list(actual.keys()) == list(expected.keys())
+        assert {ebd_key: _dump(result) for ebd_key, result in actual.items()} == {
+            ebd_key: _dump(result) for ebd_key, result in expected.items()
+        }
+        number_of_tables = sum(1 for result in expected.values() if isinstance(result, EbdTable))
+        # the correction release changed only a few EBDs; all others are reused (with the new release information)
+        assert recorder.get_report().stages["convert_tables"].count < number_of_tables / 10
+        reused_result = actual["E_0003"]
+        assert isinstance(reused_result, EbdTable)
+        assert reused_result.metadata.release_information != previous_results["E_0003"].metadata.release_information  # type: ignore[union-attr]
+
+    def test_results_of_an_unchanged_document_are_reused(
+        self,
+        previous_document_index: DocumentIndex,
+        previous_results: dict[str, EbdTable | EbdNoTableSection | Exception],
+    ):
+        with record_timings() as recorder:
+            actual = dict(
+                iter_ebd_tables_incrementally(previous_document_index, previous_document_index, previous_results)
+            )
+        # only the EBDs whose previous conversion failed are converted again
+        number_of_errors = sum(1 for result in previous_results.values() if isinstance(result, Exception))
+        conversions = recorder.get_report().stages.get("convert_tables")
+        assert conversions is None or conversions.count <= number_of_errors
+        for ebd_key, result in actual.items():
+            if isinstance(previous_results[ebd_key], EbdTable):
+                assert result is previous_results[ebd_key]
@@ -0,0 +1,115 @@
+import asyncio
+import json
+import threading
+from typing import Any, Optional
+
+import pytest  # type: ignore[import]
+from rebdhuhn.models.ebd_table import EbdTable
+
+from ebdamame import TimingRecorder, clear_document_cache, iter_ebd_tables, record_timings
+from ebdamame.aio import AsyncEbdExtractor
+from ebdamame.instrumentation import measure_stage
+
+from . import EBD_2022_11_28, EBD_2023_06_29_V34
+
+
+class TestInstrumentation:
+    """
+    Tests the recording of the durations of the extraction stages.
+    """
+
+    @pytest.mark.parametrize("engine", ["python-docx", "lxml"])
+    def test_all_stages_are_recorded(self, engine: str):
+        clear_document_cache()
+        with record_timings() as recorder:
+            results = dict(iter_ebd_tables(EBD_2022_11_28, engine=engine))  # type: ignore[arg-type]
+        report = recorder.get_report()
+        expected_stages = {"read_document", "discover_ebd_keys", "locate_tables", "convert_tables"}
+        if engine == "python-docx":
+            expected_stages.add("read_release_information")
+        assert set(report.stages.keys()) == expected_stages
+        assert report.stages["read_document"].count == 1
+        assert report.stages["locate_tables"].count == len(results)
+        number_of_tables = sum(1 for result in results.values() if isinstance(result, EbdTable))
+        assert report.stages["convert_tables"].count >= number_of_tables  # failed conversions are measured, too
+        assert set(report.ebds["E_0003"].keys()) == {"locate_tables", "convert_tables"}
+        assert report.stages["convert_tables"].min_seconds <= report.stages["convert_tables"].max_seconds
+        exported = json.loads(report.model_dump_json())
+        assert exported["stages"]["read_document"]["count"] == 1
+
+    def test_nothing_is_recorded_without_recording(self):
+        assert measure_stage("convert_tables", "E_0003") is measure_stage("read_document")
+        with record_timings() as recorder:
+            pass
+        _ = list(iter_ebd_tables(EBD_2022_11_28))
+        assert recorder.get_report().stages == {}
+
+    def test_callback_and_nesting(self):
+        measurements: list[tuple[str, Optional[str], float]] = []
+        with record_timings() as outer_recorder:
+            with record_timings(callback=lambda *args: measurements.append(args)) as inner_recorder:
+                with measure_stage("convert_tables", "E_0003"):
+                    pass
+            with measure_stage("read_document"):
+                pass
+        assert [(stage, ebd_key) for stage, ebd_key, _ in measurements] == [("convert_tables", "E_0003")]
+        assert set(inner_recorder.get_report().stages.keys()) == {"convert_tables"}
+        assert set(outer_recorder.get_report().stages.keys()) == {"read_document"}
+
+    def test_overlapping_recordings_in_threads(self):
+        second_recording_started = threading.Event()
+        first_recording_ended = threading.Event()
+        reports: dict[str, Any] = {}
+
+        def record_first() -> None:
+            with record_timings() as recorder:
+                assert second_recording_started.wait(timeout=10)
+                with measure_stage("read_document"):
+                    pass
+            first_recording_ended.set()
+            reports["first"] = recorder.get_report()
+
+        def record_second() -> None:
+            with record_timings() as recorder:
+                second_recording_started.set()
+                assert first_recording_ended.wait(timeout=10)  # the recordings end in the order in which they started
+                with measure_stage("convert_tables", "E_0003"):
+                    pass
+            reports["second"] = recorder.get_report()
+
+        threads = [threading.Thread(target=record_first), threading.Thread(target=record_second)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert set(reports["first"].stages.keys()) == {"read_document"}
+        assert set(reports["second"].stages.keys()) == {"convert_tables"}
+
+    def test_overlapping_recordings_in_asyncio_tasks(self):
+        clear_document_cache()
+
+        async def read_ebd_keys(extractor: AsyncEbdExtractor, docx_file_path: Any) -> Any:
+            with record_timings() as recorder:
+                await extractor.get_all_ebd_keys(docx_file_path)
+            return recorder.get_report()
+
+        async def read_both() -> tuple[Any, ...]:
+            async with AsyncEbdExtractor(engine="lxml") as extractor:
+                return await asyncio.gather(
+                    read_ebd_keys(extractor, EBD_2022_11_28), read_ebd_keys(extractor, EBD_2023_06_29_V34)
+                )
+
+        for report in asyncio.run(read_both()):
+            assert report.stages["read_document"].count == 1
+            assert report.stages["discover_ebd_keys"].count == 1
+
+    def test_recorder_aggregates_measurements(self):
+        recorder = TimingRecorder()
+        recorder.record("convert_tables", 1.0, "E_0003")
+        recorder.record("convert_tables", 3.0, "E_0003")
+        report = recorder.get_report()
+        assert report.stages["convert_tables"].count == 2
+        assert report.stages["convert_tables"].total_seconds == 4.0
+        assert report.stages["convert_tables"].min_seconds == 1.0
+        assert report.stages["convert_tables"].max_seconds == 3.0
+        assert report.ebds == {"E_0003": {"convert_tables": 4.0}}
@@ -0,0 +1,88 @@
+import pickle
+
+import pytest  # type: ignore[import]
+from rebdhuhn.models.ebd_table import EbdTable
+
+from ebdamame import (
+    DocumentIndex,
+    EbdNoTableSection,
+    EbdTableNotConvertibleError,
+    StepNumberNotFoundError,
+    TableNotFoundError,
+    get_all_ebd_keys,
+    get_document,
+    iter_ebd_tables,
+)
+
+from . import EBD_2022_11_28
+from .examples import table_e0003
+
+
+@pytest.fixture(scope="module")
+def results_2022_11_28() -> dict[str, EbdTable | EbdNoTableSection | Exception]:
+    return dict(iter_ebd_tables(EBD_2022_11_28))
+
+
+class TestIterEbdTables:
+    """
+    Tests the bulk conversion of all EBDs of a document
+    """
+
+    def test_all_keys_are_yielded_in_document_order(
+        self, results_2022_11_28: dict[str, EbdTable | EbdNoTableSection | Exception]
+    ):
+        assert list(results_2022_11_28.keys()) == list(get_all_ebd_keys(EBD_2022_11_28).keys())
+
+    def test_metadata_is_filled_from_chapter_information(
+        self, results_2022_11_28: dict[str, EbdTable | EbdNoTableSection | Exception]
+    ):
+        actual = results_2022_11_28["E_0003"]
+        assert isinstance(actual, EbdTable)
+        assert actual.rows == table_e0003.rows
+        assert actual.metadata.ebd_name == "E_0003_Bestellung der Aggregationsebene RZ prüfen"
+        assert actual.metadata.chapter == "MaBiS"
+        assert actual.metadata.section.startswith("7.")
+        assert actual.metadata.release_information == table_e0003.metadata.release_information
+
+    def test_no_table_section(self, results_2022_11_28: dict[str, EbdTable | EbdNoTableSection | Exception]):
+        actual = results_2022_11_28["E_0402"]
+        assert isinstance(actual, EbdNoTableSection)
+        assert actual.remark.startswith("Derzeit ist für diese Entscheidung kein Entscheidungsbaum notwendig")
+
+    def test_accepts_document_index(self):
+        document_index = DocumentIndex(get_document(EBD_2022_11_28))
+        ebd_key, result = next(iter_ebd_tables(document_index))
+        assert ebd_key == next(iter(get_all_ebd_keys(document_index)))
+        assert isinstance(result, (EbdTable, EbdNoTableSection, Exception))
+
+    def test_parallel_results_are_identical_to_sequential_results(
+        self, results_2022_11_28: dict[str, EbdTable | EbdNoTableSection | Exception]
+    ):
+        actual = list(iter_ebd_tables(EBD_2022_11_28, max_workers=2))
+        assert [ebd_key for ebd_key, _ in actual] == list(results_2022_11_28.keys())
+        for ebd_key, result in actual:
+            expected = results_2022_11_28[ebd_key]
+            if isinstance(expected, Exception):
+                assert type(result) is type(expected)
+                assert str(result) == str(expected)
+            else:
+                assert result == expected
+
+    def test_parallel_conversion_requires_a_path(self):
+        document_index = DocumentIndex(get_document(EBD_2022_11_28))
+        with pytest.raises(ValueError):
+            next(iter_ebd_tables(document_index, max_workers=2))
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            pytest.param(TableNotFoundError(ebd_key="E_0001")),
+            pytest.param(EbdTableNotConvertibleError(ebd_key="E_0001", reason="foo")),
+            pytest.param(StepNumberNotFoundError(ebd_key="E_0001")),
+        ],
+    )
+    def test_errors_can_be_sent_between_processes(self, error: Exception):
+        actual = pickle.loads(pickle.dumps(error))
+        assert type(actual) is type(error)
+        assert actual.__dict__ == error.__dict__
+        assert str(actual) == str(error)
@@ -0,0 +1,86 @@
+from pathlib import Path
+
+import pytest  # type: ignore[import]
+from rebdhuhn.models.ebd_table import EbdTable
+
+from ebdamame import (
+    EbdNoTableSection,
+    TableNotFoundError,
+    get_all_ebd_keys,
+    get_document,
+    get_ebd_document_release_information,
+    get_ebd_docx_tables,
+    get_ebd_table,
+    iter_ebd_tables,
+)
+from ebdamame._lxml_engine import read_streamed_document_index
+from ebdamame._raw_table import RawEbdTable
+from ebdamame.docxtableconverter import DocxTableConverter
+
+from . import ALL_DOCX_FILES, EBD_2022_11_28, EBD_2023_06_29_V34
+from .examples import table_e0003
+
+
+class TestLxmlEngine:
+    """
+    Tests that the lxml engine yields the same results as the python-docx engine.
+    """
+
+    @pytest.mark.parametrize("path", [pytest.param(path, id=path.name) for path in ALL_DOCX_FILES])
+    def test_ebd_keys_are_identical(self, path: Path):
+        assert get_all_ebd_keys(path, engine="lxml") == get_all_ebd_keys(path)
+
+    def test_release_information_is_identical(self):
+        expected = get_ebd_document_release_information(get_document(EBD_2023_06_29_V34))
+        assert read_streamed_document_index(EBD_2023_06_29_V34).release_information == expected
+
+    @pytest.mark.parametrize("path", [pytest.param(path, id=path.name) for path in ALL_DOCX_FILES])
+    def test_all_results_are_identical(self, path: Path):
+        expected_results: dict[str, EbdTable | EbdNoTableSection | Exception] = dict(iter_ebd_tables(path))
+        actual = list(iter_ebd_tables(path, engine="lxml"))
+        assert [ebd_key for ebd_key, _ in actual] == list(expected_results.keys())
+        for ebd_key, result in actual:
+            expected = expected_results[ebd_key]
+            if isinstance(expected, Exception):
+                assert type(result) is type(expected)
+                assert str(result) == str(expected)
+            else:
+                assert result == expected
+
+    def test_get_ebd_table(self):
+        actual = get_ebd_table(EBD_2022_11_28, "E_0003", engine="lxml")
+        assert isinstance(actual, EbdTable)
+        assert actual.rows == table_e0003.rows
+
+    def test_unknown_key_raises_table_not_found_error(self):
+        with pytest.raises(TableNotFoundError):
+            get_ebd_table(EBD_2022_11_28, "E_9999", engine="lxml")
+
+    def test_unknown_engine_raises_value_error(self):
+        with pytest.raises(ValueError):
+            get_all_ebd_keys(EBD_2022_11_28, engine="foo")  # type: ignore[arg-type]
+
+    @pytest.mark.parametrize("ebd_key", ["E_0003", "E_0901"])
+    def test_raw_table_texts_are_identical_to_python_docx(self, ebd_key: str):
+        docx_tables = get_ebd_docx_tables(EBD_2022_11_28, ebd_key=ebd_key)
+        assert isinstance(docx_tables, list)
+        for docx_table in docx_tables:
+            raw_table = RawEbdTable.from_element(docx_table._tbl)
+            assert len(raw_table.rows) == len(docx_table.rows)
+            for row_index, row in enumerate(docx_table.rows):
+                assert raw_table.get_grid_cell_texts(row_index) == tuple(cell.text for cell in row.cells)
+
+    def test_converter_accepts_raw_tables(self):
+        docx_tables = get_ebd_docx_tables(EBD_2022_11_28, ebd_key="E_0003")
+        assert isinstance(docx_tables, list)
+        raw_tables = [RawEbdTable.from_element(docx_table._tbl) for docx_table in docx_tables]
+        arguments = {
+            "ebd_key": "E_0003",
+            "chapter": "MaBiS",
+            "section": "7.39.1: AD: Bestellung der Aggregationsebene der Bilanzkreissummenzeitreihe",
+            "ebd_name": "E_0003_Bestellung der Aggregationsebene RZ prüfen",
+            "release_information": table_e0003.metadata.release_information,
+        }
+        actual = DocxTableConverter(raw_tables, **arguments).convert_docx_tables_to_ebd_table()  # type: ignore[arg-type]
+        expected = DocxTableConverter(docx_tables, **arguments).convert_docx_tables_to_ebd_table()  # type: ignore[arg-type]
+        assert actual == expected
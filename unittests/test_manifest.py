@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import pytest  # type: ignore[import]
+
+from ebdamame import (
+    DocumentIndex,
+    EbdNoTableSection,
+    TableNotFoundError,
+    get_all_ebd_fingerprints,
+    get_all_ebd_keys,
+    get_document,
+    get_ebd_document_release_information,
+    get_ebd_docx_tables,
+)
+from ebdamame.manifest import DocumentManifest, build_manifest
+
+from . import EBD_2022_11_28, EBD_2023_06_19_V34, EBD_2023_06_29_V34
+
+
+@pytest.fixture(scope="module")
+def manifest_2023_06_29_v34() -> DocumentManifest:
+    return build_manifest(EBD_2023_06_29_V34)
+
+
+class TestManifest:
+    """
+    Tests the manifest of a document, which is built in one traversal of the document body.
+    """
+
+    def test_manifest_contains_the_same_information_as_the_single_functions(
+        self, manifest_2023_06_29_v34: DocumentManifest
+    ):
+        ebd_keys = get_all_ebd_keys(EBD_2023_06_29_V34)
+        assert [entry.ebd_key for entry in manifest_2023_06_29_v34.ebds] == list(ebd_keys.keys())
+        assert manifest_2023_06_29_v34.release_information == get_ebd_document_release_information(
+            get_document(EBD_2023_06_29_V34)
+        )
+        fingerprints = get_all_ebd_fingerprints(EBD_2023_06_29_V34)
+        for entry in manifest_2023_06_29_v34.ebds:
+            assert (entry.title, entry.chapter_information) == ebd_keys[entry.ebd_key]
+            assert entry.fingerprint == fingerprints[entry.ebd_key]
+            try:
+                section = get_ebd_docx_tables(EBD_2023_06_29_V34, entry.ebd_key)
+            except TableNotFoundError:
+                assert (entry.number_of_tables, entry.remark) == (0, None)
+                continue
+            if isinstance(section, EbdNoTableSection):
+                assert (entry.number_of_tables, entry.remark) == (0, section.remark)
+            else:
+                assert (entry.number_of_tables, entry.remark) == (len(section), None)
+                assert entry.number_of_tables >= 1
+
+    def test_engines_yield_the_same_manifest(self, manifest_2023_06_29_v34: DocumentManifest):
+        assert build_manifest(EBD_2023_06_29_V34, engine="lxml") == manifest_2023_06_29_v34
+
+    def test_manifest_can_be_stored_as_json(self, manifest_2023_06_29_v34: DocumentManifest, tmp_path: Path):
+        manifest_path = tmp_path / f"{EBD_2023_06_29_V34.name}.manifest.json"
+        manifest_path.write_text(manifest_2023_06_29_v34.model_dump_json(indent=2), encoding="utf-8")
+        stored_manifest = DocumentManifest.model_validate_json(manifest_path.read_text(encoding="utf-8"))
+        assert stored_manifest == manifest_2023_06_29_v34
+        assert stored_manifest.is_manifest_of(EBD_2023_06_29_V34)
+        assert not stored_manifest.is_manifest_of(EBD_2023_06_19_V34)
+
+    def test_manifest_of_a_document_index(self, manifest_2023_06_29_v34: DocumentManifest):
+        manifest = build_manifest(DocumentIndex(get_document(EBD_2023_06_29_V34)))
+        assert manifest.document_hash is None
+        assert not manifest.is_manifest_of(EBD_2023_06_29_V34)
+        assert manifest.ebds == manifest_2023_06_29_v34.ebds
+
+    def test_get_entry(self):
+        manifest = build_manifest(EBD_2022_11_28, engine="lxml")
+        entry = manifest.get_entry("E_0003")
+        assert entry is not None
+        assert entry.title.startswith("Bestellung der Aggregationsebene RZ prüfen")
+        assert entry.number_of_tables >= 1
+        assert manifest.get_entry("E_9999") is None
@@ -0,0 +1,62 @@
+import pickle
+
+import pytest  # type: ignore[import]
+
+from ebdamame import (
+    EbdNoTableSection,
+    ExtractionEngine,
+    RawEbdTable,
+    TableNotFoundError,
+    get_ebd_docx_tables,
+    get_ebd_raw_tables,
+    get_ebd_table,
+)
+from ebdamame.docxtableconverter import DocxTableConverter
+
+from . import EBD_2022_11_28
+
+
+class TestRawEbdTable:
+    """
+    Tests the detached, text-only representation of the EBD tables.
+    """
+
+    @pytest.mark.parametrize("engine", ["python-docx", "lxml"])
+    def test_get_ebd_raw_tables(self, engine: ExtractionEngine):
+        docx_tables = get_ebd_docx_tables(EBD_2022_11_28, "E_0901")
+        assert isinstance(docx_tables, list)
+        raw_tables = get_ebd_raw_tables(EBD_2022_11_28, "E_0901", engine=engine)
+        assert isinstance(raw_tables, list)
+        assert [raw_table.get_canonical_xml() for raw_table in raw_tables] == [
+            RawEbdTable.from_docx_table(docx_table).get_canonical_xml() for docx_table in docx_tables
+        ]
+
+    @pytest.mark.parametrize("engine", ["python-docx", "lxml"])
+    def test_get_ebd_raw_tables_without_tables(self, engine: ExtractionEngine):
+        assert isinstance(get_ebd_raw_tables(EBD_2022_11_28, "E_0402", engine=engine), EbdNoTableSection)
+        with pytest.raises(TableNotFoundError):
+            get_ebd_raw_tables(EBD_2022_11_28, "E_9999", engine=engine)
+
+    def test_pickled_tables_are_converted_like_the_docx_tables(self):
+        raw_tables = get_ebd_raw_tables(EBD_2022_11_28, "E_0003")
+        assert isinstance(raw_tables, list)
+        for raw_table in raw_tables:
+            raw_table.get_grid_cell_texts(0)  # the derived text matrices are not pickled
+        unpickled_tables: list[RawEbdTable] = pickle.loads(pickle.dumps(raw_tables))
+        assert [table.rows for table in unpickled_tables] == [table.rows for table in raw_tables]
+        expected = get_ebd_table(EBD_2022_11_28, "E_0003")
+        actual = DocxTableConverter(
+            unpickled_tables,
+            ebd_key="E_0003",
+            chapter=expected.metadata.chapter,
+            section=expected.metadata.section,
+            ebd_name=expected.metadata.ebd_name,
+            release_information=expected.metadata.release_information,
+        ).convert_docx_tables_to_ebd_table()
+        assert actual == expected
+
+    def test_identical_cells_are_stored_once(self):
+        raw_tables = get_ebd_raw_tables(EBD_2022_11_28, "E_0003")
+        assert isinstance(raw_tables, list)
+        cells = [cell for raw_table in raw_tables for row in raw_table.rows for cell in row.cells]
+        assert len({id(cell) for cell in cells}) == len(set(cells)) < len(cells)
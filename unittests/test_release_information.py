@@ -0,0 +1,90 @@
+import gc
+import io
+import weakref
+from pathlib import Path
+
+import docx
+import pytest  # type: ignore[import]
+
+from ebdamame import (
+    get_document,
+    get_ebd_document_release_information,
+    get_ebd_docx_tables,
+    peek_release_information,
+    record_timings,
+)
+from ebdamame._docx_utils import _release_information_cache
+from ebdamame.docxtableconverter import DocxTableConverter
+
+from . import EBD_2022_11_28, EBD_2025_04_04_V40B
+
+
+class TestReleaseInformation:
+    """
+    Tests the reading of the release information from the title page.
+    """
+
+    def test_release_information_is_read_once_per_document(self):
+        document = get_document(EBD_2025_04_04_V40B, use_cache=False)
+        with record_timings() as recorder:
+            first = get_ebd_document_release_information(document)
+            second = get_ebd_document_release_information(document)
+        assert recorder.get_report().stages["read_release_information"].count == 1
+        assert first == second
+        assert first is not second  # the result is mutable, so every caller gets its own copy
+        assert first is not None
+        first.ebdamame_version = None
+        assert get_ebd_document_release_information(document) == second
+
+    def test_converters_share_the_release_information_of_the_document(self):
+        with record_timings() as recorder:
+            for ebd_key in ["E_0003", "E_0015"]:
+                docx_tables = get_ebd_docx_tables(EBD_2025_04_04_V40B, ebd_key=ebd_key)
+                assert isinstance(docx_tables, list)
+                converter = DocxTableConverter(docx_tables, ebd_key=ebd_key, chapter="", section="", ebd_name=ebd_key)
+                release_information = converter.convert_docx_tables_to_ebd_table().metadata.release_information
+                assert release_information is not None and release_information.version == "4.0b"
+        assert recorder.get_report().stages["read_release_information"].count <= 1
+
+    def test_cache_does_not_keep_the_document_alive(self):
+        document = get_document(EBD_2025_04_04_V40B, use_cache=False)
+        _ = get_ebd_document_release_information(document)
+        assert document.element in _release_information_cache
+        document_element_reference = weakref.ref(document.element)
+        del document
+        gc.collect()
+        assert document_element_reference() is None
+
+    @pytest.mark.parametrize("path", [EBD_2022_11_28, EBD_2025_04_04_V40B])
+    def test_peek_release_information(self, path: Path):
+        expected = get_ebd_document_release_information(get_document(path))
+        assert expected is not None
+        assert peek_release_information(path) == expected
+        assert peek_release_information(path.read_bytes()) == expected
+
+    def test_release_information_after_the_title_page_is_ignored(self):
+        document = docx.Document()
+        document.add_paragraph("Stand: 01.02.2023")
+        document.add_section()  # the section break ends the title page
+        table = document.add_table(rows=2, cols=2)
+        table.cell(0, 0).text = "Version:"
+        table.cell(0, 1).text = "3.5"
+        table.cell(1, 0).text = "Publikationsdatum:"
+        table.cell(1, 1).text = "01.02.2023"
+        docx_file = io.BytesIO()
+        document.save(docx_file)
+        assert get_ebd_document_release_information(get_document(docx_file)) is None
+        assert peek_release_information(docx_file) is None
+
+    def test_title_page_ends_at_the_first_heading_of_any_style_id(self):
+        document = docx.Document()  # the default template has English style ids ("Heading1")
+        document.add_paragraph("Stand: 01.02.2023")
+        document.add_heading("1 Einleitung", level=1)
+        table = document.add_table(rows=2, cols=2)
+        table.cell(0, 0).text = "Version:"
+        table.cell(0, 1).text = "3.5"
+        docx_file = io.BytesIO()
+        document.save(docx_file)
+        assert document.paragraphs[1].style is not None and document.paragraphs[1].style.style_id == "Heading1"
+        assert get_ebd_document_release_information(get_document(docx_file)) is None
+        assert peek_release_information(docx_file) is None